@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+
+# Copyright © 2023-2024, Meheret Tesfaye Batu <meherett.batu@gmail.com>
+# Distributed under the MIT software license, see the accompanying
+# file COPYING or https://opensource.org/license/mit
+
+# Per-key memory footprint of holding many secp256k1 keys, e.g. the results of a
+# batch derivation or a recovery run. Usage: python benchmarks/memory.py [COUNT]
+# from the repository root with the package installed, or with PYTHONPATH=.
+
+from typing import (
+    Callable, List, Tuple
+)
+
+import gc
+import sys
+import time
+import tracemalloc
+
+from ecdsa import (
+    VerifyingKey, curves, ellipticcurve
+)
+from ecdsa.ecdsa import curve_secp256k1
+
+from bip38.secp256k1 import (
+    CompactPublicKey, CompactPrivateKey, PublicKey
+)
+from bip38.secp256k1 import ecmult
+
+# Number of keys to hold, the ecdsa verifying keys are measured on a smaller sample
+COUNT: int = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+ECDSA_COUNT: int = min(COUNT, 20_000)
+# Points are normalized to affine coordinates in chunks of this size
+CHUNK: int = 4096
+
+
+def points(count: int) -> bytes:
+    # The public keys of the secret exponents 1..count, as consecutive multiples of G,
+    # packed as 64 bytes each so that every measurement allocates its own ints
+    packed: bytearray = bytearray()
+    point: ecmult.Jacobian = (ecmult.GX, ecmult.GY, 1)
+    for start in range(0, count, CHUNK):
+        chunk: List[ecmult.Jacobian] = []
+        for _ in range(min(CHUNK, count - start)):
+            chunk.append(point)
+            point = ecmult.jacobian_add_affine(point, (ecmult.GX, ecmult.GY))
+        for x, y in ecmult.batch_to_affine(chunk):
+            packed += x.to_bytes(32, "big") + y.to_bytes(32, "big")
+    return bytes(packed)
+
+
+def coordinates(packed: bytes, count: int) -> List[Tuple[int, int]]:
+    return [
+        (int.from_bytes(packed[index:index + 32], "big"), int.from_bytes(packed[index + 32:index + 64], "big"))
+        for index in range(0, count * 64, 64)
+    ]
+
+
+def measure(name: str, count: int, build: Callable[[], list]) -> None:
+    gc.collect()
+    tracemalloc.start()
+    start: float = time.perf_counter()
+    held: list = build()
+    elapsed: float = time.perf_counter() - start
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{name:<42} {size / count:>8.1f} B/key {size / 2 ** 20:>10.1f} MiB {elapsed:>8.2f} s")
+    del held
+
+
+def compact_encoded(packed: bytes) -> List[CompactPublicKey]:
+    keys: List[CompactPublicKey] = [CompactPublicKey(x, y) for x, y in coordinates(packed, COUNT)]
+    for key in keys:
+        key.raw_compressed()
+    return keys
+
+
+def ecdsa_verifying_keys(packed: bytes) -> List[VerifyingKey]:
+    return [
+        VerifyingKey.from_public_point(
+            ellipticcurve.Point(curve_secp256k1, x, y, ecmult.N), curve=curves.SECP256k1, validate_point=False
+        ) for x, y in coordinates(packed, ECDSA_COUNT)
+    ]
+
+
+if __name__ == "__main__":
+
+    print(f"Generating {COUNT} public keys ...")
+    PACKED: bytes = points(COUNT)
+    print(f"{'Representation':<42} {'Per key':>14} {'Total':>14} {'Build':>10}")
+
+    measure("(x, y) tuples", COUNT, lambda: coordinates(PACKED, COUNT))
+    measure("CompactPublicKey", COUNT, lambda: [CompactPublicKey(x, y) for x, y in coordinates(PACKED, COUNT)])
+    measure("CompactPublicKey, compressed cached", COUNT, lambda: compact_encoded(PACKED))
+    measure("PublicKey adapter", COUNT, lambda: [
+        PublicKey._from_trusted(x, y) for x, y in coordinates(PACKED, COUNT)
+    ])
+    measure("CompactPrivateKey, public key not derived", COUNT, lambda: [
+        # Full-size secret exponents, the x coordinates reduced modulo the curve order
+        CompactPrivateKey(x % ecmult.N) for x, _ in coordinates(PACKED, COUNT)
+    ])
+    measure(f"ecdsa VerifyingKey (sample of {ECDSA_COUNT})", ECDSA_COUNT, lambda: ecdsa_verifying_keys(PACKED))
@@ -18,7 +18,9 @@ from .info import (
     __tracker__,
     __keywords__
 )
-from .bip38 import BIP38
+from .bip38 import (
+    BIP38, backends
+)
 
 __all__: List[str] = [
     "__name__",
@@ -31,5 +33,6 @@ __all__: List[str] = [
     "__url__",
     "__tracker__",
     "__keywords__",
-    "BIP38"
+    "BIP38",
+    "backends"
 ]
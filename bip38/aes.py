@@ -0,0 +1,572 @@
+#!/usr/bin/env python3
+
+# Copyright © 2023-2024, Meheret Tesfaye Batu <meherett.batu@gmail.com>
+# Distributed under the MIT software license, see the accompanying
+# file COPYING or https://opensource.org/license/mit
+
+from typing import (
+    Type, Union, Optional, Sequence, List, Dict, Tuple, Any
+)
+from abc import (
+    ABC, abstractmethod
+)
+
+import threading
+
+try:
+    from cryptography.hazmat.primitives.ciphers import (
+        Cipher, algorithms, modes
+    )
+except ImportError:  # pragma: no cover
+    Cipher = None
+try:
+    from Crypto.Cipher import AES as CryptoAES
+except ImportError:  # pragma: no cover
+    CryptoAES = None
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+from .libs.aes import (
+    AES as PythonAESCipher, SBOX, INV_SBOX, RCON, TE0, TE1, TE2, TE3, TD0, TD1, TD2, TD3
+)
+from .exceptions import Error
+
+# FIPS 197 (appendix C.3) AES-256 test vector used to validate every backend before it is selected
+AES_TEST_VECTOR: Dict[str, bytes] = {
+    "key": bytes(range(32)),
+    "plaintext": bytes.fromhex("00112233445566778899aabbccddeeff"),
+    "ciphertext": bytes.fromhex("8ea2b7ca516745bfeafc49904b496089")
+}
+
+
+class IAES(ABC):
+    """
+    The AES-ECB backend interface, every backend must implement :meth:`new`.
+
+    BIP38 always processes its ``encrypted_half_1`` and ``encrypted_half_2`` blocks with the same key,
+    so the key is expanded once by :meth:`new` and :meth:`encrypt_blocks` / :meth:`decrypt_blocks`
+    handle both blocks in one call.
+    """
+
+    NAME: str
+    FALLBACK: bool = False
+
+    @classmethod
+    def is_available(cls) -> bool:
+        """
+        Checks whether the backend can be used on this host.
+
+        :returns: True if the backend is importable, otherwise False.
+        :rtype: bool
+        """
+
+        return True
+
+    @classmethod
+    @abstractmethod
+    def new(cls, key: bytes) -> Any:
+        """
+        Expands a key into an ECB cipher.
+
+        :param key: The 16, 24 or 32 bytes key.
+        :type key: bytes
+
+        :returns: A cipher with ``encrypt(data)`` and ``decrypt(data)`` over multiples of 16 bytes.
+        :rtype: Any
+        """
+
+        raise NotImplementedError
+
+    @classmethod
+    def encrypt_blocks(cls, key: bytes, block_1: bytes, block_2: bytes) -> Tuple[bytes, bytes]:
+        """
+        Encrypts two 16 bytes blocks with the same key.
+
+        :param key: The 16, 24 or 32 bytes key.
+        :type key: bytes
+        :param block_1: The first block.
+        :type block_1: bytes
+        :param block_2: The second block.
+        :type block_2: bytes
+
+        :returns: The two encrypted blocks.
+        :rtype: Tuple[bytes, bytes]
+
+        >>> from bip38.aes import PythonAES
+        >>> [block.hex() for block in PythonAES.encrypt_blocks(bytes(range(32)), bytes(16), bytes(16))]
+        ['f29000b62a499fd0a9f39a6add2e7780', 'f29000b62a499fd0a9f39a6add2e7780']
+        """
+
+        data: bytes = cls.new(key).encrypt(block_1 + block_2)
+        return data[:16], data[16:]
+
+    @classmethod
+    def decrypt_blocks(cls, key: bytes, block_1: bytes, block_2: bytes) -> Tuple[bytes, bytes]:
+        """
+        Decrypts two 16 bytes blocks with the same key.
+
+        :param key: The 16, 24 or 32 bytes key.
+        :type key: bytes
+        :param block_1: The first block.
+        :type block_1: bytes
+        :param block_2: The second block.
+        :type block_2: bytes
+
+        :returns: The two decrypted blocks.
+        :rtype: Tuple[bytes, bytes]
+        """
+
+        data: bytes = cls.new(key).decrypt(block_1 + block_2)
+        return data[:16], data[16:]
+
+    @classmethod
+    def encrypt_many(cls, keys: Sequence[bytes], blocks: Sequence[bytes]) -> List[bytes]:
+        """
+        Encrypts many independent inputs, each one under its own key.
+
+        :param keys: The keys, all of the same length (16, 24 or 32 bytes).
+        :type keys: Sequence[bytes]
+        :param blocks: The data to encrypt, one multiple of 16 bytes per key, all of the same length.
+        :type blocks: Sequence[bytes]
+
+        :returns: The encrypted data, in the same order as the inputs.
+        :rtype: List[bytes]
+        """
+
+        if len(keys) != len(blocks):
+            raise Error("Invalid number of blocks", expected=len(keys), got=len(blocks))
+        return [cls.new(key).encrypt(data) for key, data in zip(keys, blocks)]
+
+    @classmethod
+    def decrypt_many(cls, keys: Sequence[bytes], blocks: Sequence[bytes]) -> List[bytes]:
+        """
+        Decrypts many independent inputs, each one under its own key.
+
+        :param keys: The keys, all of the same length (16, 24 or 32 bytes).
+        :type keys: Sequence[bytes]
+        :param blocks: The data to decrypt, one multiple of 16 bytes per key, all of the same length.
+        :type blocks: Sequence[bytes]
+
+        :returns: The decrypted data, in the same order as the inputs.
+        :rtype: List[bytes]
+        """
+
+        if len(keys) != len(blocks):
+            raise Error("Invalid number of blocks", expected=len(keys), got=len(blocks))
+        return [cls.new(key).decrypt(data) for key, data in zip(keys, blocks)]
+
+
+class _CryptographyCipher:
+
+    def __init__(self, key: bytes) -> None:
+        self._cipher = Cipher(algorithms.AES(key), modes.ECB())
+
+    def encrypt(self, data: bytes) -> bytes:
+        encryptor = self._cipher.encryptor()
+        return encryptor.update(data) + encryptor.finalize()
+
+    def decrypt(self, data: bytes) -> bytes:
+        decryptor = self._cipher.decryptor()
+        return decryptor.update(data) + decryptor.finalize()
+
+
+class CryptographyAES(IAES):
+    """
+    The OpenSSL AES backend, through the ``cryptography`` package.
+    """
+
+    NAME = "cryptography"
+
+    @classmethod
+    def is_available(cls) -> bool:
+        return Cipher is not None
+
+    @classmethod
+    def new(cls, key: bytes) -> Any:
+        return _CryptographyCipher(key)
+
+
+class PyCryptodomeAES(IAES):
+    """
+    The ``pycryptodome`` AES backend.
+    """
+
+    NAME = "pycryptodome"
+
+    @classmethod
+    def is_available(cls) -> bool:
+        return CryptoAES is not None
+
+    @classmethod
+    def new(cls, key: bytes) -> Any:
+        return CryptoAES.new(key, CryptoAES.MODE_ECB)
+
+
+def _sub_word_lanes(w: "numpy.ndarray", sbox: "numpy.ndarray") -> "numpy.ndarray":
+    return (
+        (sbox[w >> 24] << 24) | (sbox[(w >> 16) & 0xff] << 16) | (sbox[(w >> 8) & 0xff] << 8) | sbox[w & 0xff]
+    )
+
+
+def _expand_keys_lanes(keys: "numpy.ndarray") -> "numpy.ndarray":
+    """
+    Expands a (N, 16|24|32) ``uint8`` array of keys into a (N, 4 * (rounds + 1)) ``uint32`` array of round keys.
+    """
+
+    nk: int = keys.shape[1] // 4
+    sbox: "numpy.ndarray" = _NUMPY_TABLES["sbox"]
+    w: "numpy.ndarray" = numpy.empty((keys.shape[0], 4 * (nk + 7)), dtype=numpy.uint32)
+    w[:, :nk] = numpy.ascontiguousarray(keys).view(">u4")
+    for i in range(nk, w.shape[1]):
+        t: "numpy.ndarray" = w[:, i - 1]
+        if i % nk == 0:
+            t = _sub_word_lanes((t << 8) | (t >> 24), sbox) ^ numpy.uint32(RCON[i // nk - 1] << 24)
+        elif nk > 6 and i % nk == 4:
+            t = _sub_word_lanes(t, sbox)
+        w[:, i] = w[:, i - nk] ^ t
+    return w
+
+
+def _invert_keys_lanes(w: "numpy.ndarray") -> "numpy.ndarray":
+    """
+    Derives the equivalent inverse cipher round keys from a (N, 4 * (rounds + 1)) array of round keys.
+    """
+
+    sbox, td = _NUMPY_TABLES["sbox"], _NUMPY_TABLES["td"]
+    d: "numpy.ndarray" = w.reshape(w.shape[0], -1, 4)[:, ::-1].copy()
+    m: "numpy.ndarray" = d[:, 1:-1]
+    d[:, 1:-1] = (
+        td[0][sbox[m >> 24]] ^ td[1][sbox[(m >> 16) & 0xff]] ^ td[2][sbox[(m >> 8) & 0xff]] ^ td[3][sbox[m & 0xff]]
+    )
+    return d.reshape(w.shape[0], -1)
+
+
+def _crypt_lanes(w: "numpy.ndarray", blocks: "numpy.ndarray", decrypt: bool) -> "numpy.ndarray":
+    """
+    Runs the AES rounds over a (M, 16) ``uint8`` array of blocks with a (M, 4 * (rounds + 1)) array of round keys.
+    """
+
+    t: List["numpy.ndarray"] = _NUMPY_TABLES["td" if decrypt else "te"]
+    sbox: "numpy.ndarray" = _NUMPY_TABLES["inv_sbox" if decrypt else "sbox"]
+    # Column shifted into word i by table j: ShiftRows for encryption, InvShiftRows for decryption
+    shift: int = 3 if decrypt else 1
+    s: "numpy.ndarray" = numpy.ascontiguousarray(blocks).view(">u4").astype(numpy.uint32) ^ w[:, :4]
+    for k in range(4, w.shape[1] - 4, 4):
+        s = numpy.stack([
+            t[0][s[:, i] >> 24] ^ t[1][(s[:, (i + shift) % 4] >> 16) & 0xff] ^
+            t[2][(s[:, (i + 2 * shift) % 4] >> 8) & 0xff] ^ t[3][s[:, (i + 3 * shift) % 4] & 0xff]
+            for i in range(4)
+        ], axis=1) ^ w[:, k:k + 4]
+    s = numpy.stack([
+        (sbox[s[:, i] >> 24] << 24) | (sbox[(s[:, (i + shift) % 4] >> 16) & 0xff] << 16) |
+        (sbox[(s[:, (i + 2 * shift) % 4] >> 8) & 0xff] << 8) | sbox[s[:, (i + 3 * shift) % 4] & 0xff]
+        for i in range(4)
+    ], axis=1) ^ w[:, -4:]
+    return s.astype(">u4").view(numpy.uint8)
+
+
+_NUMPY_TABLES: Dict[str, Any] = dict(
+    sbox=numpy.array(SBOX, dtype=numpy.uint32),
+    inv_sbox=numpy.array(INV_SBOX, dtype=numpy.uint32),
+    te=[numpy.array(table, dtype=numpy.uint32) for table in (TE0, TE1, TE2, TE3)],
+    td=[numpy.array(table, dtype=numpy.uint32) for table in (TD0, TD1, TD2, TD3)]
+) if numpy is not None else {}
+
+
+class _NumpyCipher:
+
+    def __init__(self, key: bytes) -> None:
+        if len(key) not in (16, 24, 32):
+            raise ValueError("Invalid key size")
+        self._key = key
+
+    def encrypt(self, data: bytes) -> bytes:
+        return NumpyAES.encrypt_many([self._key], [data])[0]
+
+    def decrypt(self, data: bytes) -> bytes:
+        return NumpyAES.decrypt_many([self._key], [data])[0]
+
+
+class NumpyAES(IAES):
+    """
+    The NumPy backend, which runs the rounds of a whole batch of inputs, each under its own key, at once.
+
+    Every block is a row of ``uint32`` state words, and every round is a vectorized T-table gather,
+    so a batch costs the same number of NumPy operations as a single block. It is only worth it for
+    batches, single calls are served by the other backends.
+    """
+
+    NAME = "numpy"
+    FALLBACK = True
+
+    @classmethod
+    def is_available(cls) -> bool:
+        return numpy is not None
+
+    @classmethod
+    def new(cls, key: bytes) -> Any:
+        return _NumpyCipher(key)
+
+    @classmethod
+    def encrypt_array(cls, keys: "numpy.ndarray", blocks: "numpy.ndarray") -> "numpy.ndarray":
+        """
+        Encrypts a (N, 16 * k) ``uint8`` array of blocks under a (N, 16|24|32) ``uint8`` array of keys.
+
+        :param keys: The keys, one row per input.
+        :type keys: numpy.ndarray
+        :param blocks: The blocks, one row of k blocks per key.
+        :type blocks: numpy.ndarray
+
+        :returns: The (N, 16 * k) ``uint8`` array of encrypted blocks.
+        :rtype: numpy.ndarray
+        """
+
+        return cls._crypt_array(keys, blocks, False)
+
+    @classmethod
+    def decrypt_array(cls, keys: "numpy.ndarray", blocks: "numpy.ndarray") -> "numpy.ndarray":
+        """
+        Decrypts a (N, 16 * k) ``uint8`` array of blocks under a (N, 16|24|32) ``uint8`` array of keys.
+
+        :param keys: The keys, one row per input.
+        :type keys: numpy.ndarray
+        :param blocks: The blocks, one row of k blocks per key.
+        :type blocks: numpy.ndarray
+
+        :returns: The (N, 16 * k) ``uint8`` array of decrypted blocks.
+        :rtype: numpy.ndarray
+        """
+
+        return cls._crypt_array(keys, blocks, True)
+
+    @classmethod
+    def encrypt_many(cls, keys: Sequence[bytes], blocks: Sequence[bytes]) -> List[bytes]:
+        return cls._crypt_many(keys, blocks, False)
+
+    @classmethod
+    def decrypt_many(cls, keys: Sequence[bytes], blocks: Sequence[bytes]) -> List[bytes]:
+        return cls._crypt_many(keys, blocks, True)
+
+    @classmethod
+    def _crypt_array(cls, keys: "numpy.ndarray", blocks: "numpy.ndarray", decrypt: bool) -> "numpy.ndarray":
+        if keys.ndim != 2 or keys.shape[1] not in (16, 24, 32):
+            raise ValueError("Invalid key size")
+        if blocks.ndim != 2 or blocks.shape[0] != keys.shape[0] or blocks.shape[1] % 16:
+            raise ValueError("Data must be a multiple of 16 bytes")
+        w: "numpy.ndarray" = _expand_keys_lanes(keys.astype(numpy.uint8))
+        if decrypt:
+            w = _invert_keys_lanes(w)
+        count: int = blocks.shape[1] // 16
+        return _crypt_lanes(
+            numpy.repeat(w, count, axis=0), blocks.astype(numpy.uint8).reshape(-1, 16), decrypt
+        ).reshape(blocks.shape)
+
+    @classmethod
+    def _crypt_many(cls, keys: Sequence[bytes], blocks: Sequence[bytes], decrypt: bool) -> List[bytes]:
+        if len(keys) != len(blocks):
+            raise Error("Invalid number of blocks", expected=len(keys), got=len(blocks))
+        if not keys:
+            return []
+        if len(set(map(len, keys))) != 1:
+            raise ValueError("Invalid key size")
+        if len(set(map(len, blocks))) != 1:
+            raise ValueError("Data must be a multiple of 16 bytes")
+        data: "numpy.ndarray" = cls._crypt_array(
+            numpy.frombuffer(b"".join(keys), dtype=numpy.uint8).reshape(len(keys), -1),
+            numpy.frombuffer(b"".join(blocks), dtype=numpy.uint8).reshape(len(blocks), -1),
+            decrypt
+        )
+        return [row.tobytes() for row in data]
+
+
+class PythonAES(IAES):
+    """
+    The pure-Python T-table fallback backend, only selected when no native backend is importable.
+    """
+
+    NAME = "python"
+    FALLBACK = True
+
+    @classmethod
+    def new(cls, key: bytes) -> Any:
+        return PythonAESCipher(key)
+
+
+AES_BACKENDS: Dict[str, Type[IAES]] = {
+    backend.NAME: backend for backend in [
+        CryptographyAES, PyCryptodomeAES, NumpyAES, PythonAES
+    ]
+}
+
+# Smallest batch for which the NumPy backend beats the pure-Python fallback
+NUMPY_BATCH_THRESHOLD: int = 16
+
+_selection: Dict[str, Any] = {}
+_selection_lock: threading.Lock = threading.Lock()
+
+
+def select(force: bool = False) -> Dict[str, Any]:
+    """
+    Validates the available AES backends and selects one.
+
+    Every backend is checked against a FIPS 197 test vector once per process. The first usable
+    native backend, in registry order, is selected, otherwise the pure-Python fallback. Batches
+    through :func:`encrypt_many` / :func:`decrypt_many` use the NumPy backend instead of the
+    pure-Python fallback.
+
+    :param force: Whether to run the selection again (default: False).
+    :type force: bool
+
+    :returns: The selected backend name and the usable backends.
+    :rtype: Dict[str, Any]
+    """
+
+    with _selection_lock:
+        if _selection and not force:
+            return _selection
+
+        usable: List[str] = []
+        for name, backend in AES_BACKENDS.items():
+            if not backend.is_available():
+                continue
+            try:
+                cipher: Any = backend.new(AES_TEST_VECTOR["key"])
+                if cipher.encrypt(AES_TEST_VECTOR["plaintext"]) != AES_TEST_VECTOR["ciphertext"] or \
+                        cipher.decrypt(AES_TEST_VECTOR["ciphertext"]) != AES_TEST_VECTOR["plaintext"]:
+                    continue
+            except (ValueError, TypeError):  # pragma: no cover
+                continue
+            usable.append(name)
+
+        _selection.clear()
+        _selection.update(
+            selected=next(
+                (name for name in usable if not AES_BACKENDS[name].FALLBACK), PythonAES.NAME
+            ), available=usable
+        )
+        return _selection
+
+
+def get_aes_backend(name: Optional[str] = None) -> Type[IAES]:
+    """
+    Returns an AES backend by name, or the selected one.
+
+    :param name: Optional backend name, one of :data:`AES_BACKENDS` (default: the selected one).
+    :type name: Optional[str]
+
+    :returns: The AES backend.
+    :rtype: Type[IAES]
+
+    >>> from bip38.aes import get_aes_backend
+    >>> get_aes_backend("python").new(bytes(range(32))).encrypt(bytes.fromhex("00112233445566778899aabbccddeeff")).hex()
+    '8ea2b7ca516745bfeafc49904b496089'
+    """
+
+    if name is None:
+        return AES_BACKENDS[select()["selected"]]
+    if name not in AES_BACKENDS:
+        raise Error("Invalid AES backend", expected=list(AES_BACKENDS.keys()), got=name)
+    if not AES_BACKENDS[name].is_available():
+        raise Error("Unavailable AES backend", detail=f"'{name}' is not available on this host")
+    return AES_BACKENDS[name]
+
+
+class AutoAES(IAES):
+    """
+    Delegates to the selected AES backend, resolved on first use.
+    """
+
+    NAME = "auto"
+
+    @classmethod
+    def new(cls, key: bytes) -> Any:
+        return get_aes_backend().new(key)
+
+    @classmethod
+    def batch_backend(cls, size: int) -> Type[IAES]:
+        """
+        Returns the backend for a batch, the NumPy backend when the selected one is the pure-Python fallback.
+
+        :param size: The number of inputs in the batch.
+        :type size: int
+
+        :returns: The AES backend.
+        :rtype: Type[IAES]
+        """
+
+        backend: Type[IAES] = get_aes_backend()
+        if backend.FALLBACK and size >= NUMPY_BATCH_THRESHOLD and NumpyAES.is_available():
+            return NumpyAES
+        return backend
+
+    @classmethod
+    def encrypt_many(cls, keys: Sequence[bytes], blocks: Sequence[bytes]) -> List[bytes]:
+        return cls.batch_backend(len(keys)).encrypt_many(keys, blocks)
+
+    @classmethod
+    def decrypt_many(cls, keys: Sequence[bytes], blocks: Sequence[bytes]) -> List[bytes]:
+        return cls.batch_backend(len(keys)).decrypt_many(keys, blocks)
+
+
+def _batch_backend(backend: Optional[Union[str, Any]]) -> Any:
+    return (
+        AutoAES if backend is None else get_aes_backend(backend) if isinstance(backend, str) else backend
+    )
+
+
+def encrypt_many(
+    keys: Sequence[bytes], blocks: Sequence[bytes], backend: Optional[Union[str, Any]] = None
+) -> List[bytes]:
+    """
+    Encrypts many independent inputs, each one under its own key, batched when the backend supports it.
+
+    :param keys: The keys, all of the same length (16, 24 or 32 bytes).
+    :type keys: Sequence[bytes]
+    :param blocks: The data to encrypt, one multiple of 16 bytes per key, all of the same length.
+    :type blocks: Sequence[bytes]
+    :param backend: Optional AES backend name or backend (default: the selected backend, or NumPy for
+        batches when only the pure-Python fallback is available).
+    :type backend: Optional[Union[str, Any]]
+
+    :returns: The encrypted data, in the same order as the inputs.
+    :rtype: List[bytes]
+
+    >>> from bip38.aes import encrypt_many
+    >>> [data.hex() for data in encrypt_many([bytes(range(32)), bytes(32)], [bytes.fromhex("00112233445566778899aabbccddeeff"), bytes(16)], backend="numpy")]
+    ['8ea2b7ca516745bfeafc49904b496089', 'dc95c078a2408989ad48a21492842087']
+    """
+
+    backend: Any = _batch_backend(backend)
+    if hasattr(backend, "encrypt_many"):
+        return backend.encrypt_many(keys, blocks)
+    if len(keys) != len(blocks):
+        raise Error("Invalid number of blocks", expected=len(keys), got=len(blocks))
+    return [backend.new(key).encrypt(data) for key, data in zip(keys, blocks)]
+
+
+def decrypt_many(
+    keys: Sequence[bytes], blocks: Sequence[bytes], backend: Optional[Union[str, Any]] = None
+) -> List[bytes]:
+    """
+    Decrypts many independent inputs, each one under its own key, batched when the backend supports it.
+
+    :param keys: The keys, all of the same length (16, 24 or 32 bytes).
+    :type keys: Sequence[bytes]
+    :param blocks: The data to decrypt, one multiple of 16 bytes per key, all of the same length.
+    :type blocks: Sequence[bytes]
+    :param backend: Optional AES backend name or backend (default: the selected backend, or NumPy for
+        batches when only the pure-Python fallback is available).
+    :type backend: Optional[Union[str, Any]]
+
+    :returns: The decrypted data, in the same order as the inputs.
+    :rtype: List[bytes]
+    """
+
+    backend: Any = _batch_backend(backend)
+    if hasattr(backend, "decrypt_many"):
+        return backend.decrypt_many(keys, blocks)
+    if len(keys) != len(blocks):
+        raise Error("Invalid number of blocks", expected=len(keys), got=len(blocks))
+    return [backend.new(key).decrypt(data) for key, data in zip(keys, blocks)]
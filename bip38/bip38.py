@@ -5,26 +5,36 @@
 # file COPYING or https://opensource.org/license/mit
 
 from typing import (
-    Type, Union, Optional, Literal, List
+    Type, Union, Optional, Literal, Sequence, List, Dict, Tuple, Iterable, Iterator, Callable, Any
 )
-from pyaes import AESModeOfOperationECB
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from itertools import islice
 
-import scrypt
 import unicodedata
 import os
 
 from .cryptocurrencies import (
-    ICryptocurrency, Bitcoin
+    ICryptocurrency, Bitcoin, CRYPTOCURRENCIES
 )
 from .libs.base58 import (
-    encode, check_encode, decode, check_decode, ensure_string
+    encode, check_encode, decode, check_decode, check_encode_many, check_decode_many, ensure_string
 )
 from .secp256k1 import (
-    PublicKey, PrivateKey
+    Point, PublicKey, PrivateKey
 )
 from .p2pkh_address import P2PKHAddress
+from .cache import (
+    PassFactorCache, PointCache
+)
+from .aes import (
+    AutoAES, get_aes_backend, select, encrypt_many, decrypt_many
+)
+from .kdf import (
+    AutoScrypt, get_scrypt_backend, calibrate, scrypt_many
+)
 from .crypto import (
-    double_sha256, get_checksum
+    double_sha256, hash160, get_checksum, ripemd160_backend
 )
 from .const import (
     N,
@@ -40,6 +50,7 @@ from .const import (
     EC_MULTIPLIED_PRIVATE_KEY_PREFIX,
     CONFIRMATION_CODE_PREFIX,
     WIF_TYPES,
+    PUBLIC_KEY_TYPES,
     FLAGS
 )
 from .exceptions import (
@@ -57,19 +68,44 @@ class BIP38:
     """
     A class for BIP38 encryption and decryption of Wallet Import Format (WIF) keys.
 
+    Encrypted WIFs, confirmation codes and addresses are base58 encoded with the cryptocurrency's
+    alphabet, intermediate codes and WIFs always with the Bitcoin alphabet.
+
     :param cryptocurrency: The cryptocurrency class to use (e.g., Bitcoin).
     :type cryptocurrency: Type[ICryptocurrency]
     :param network: The network for the WIF key (e.g., 'mainnet' or 'testnet'). Defaults to 'mainnet'.
     :type network: str
+    :param pass_factor_cache: Optional EC-multiply pass factor cache, shared by decrypt and confirm code (default: None).
+    :type pass_factor_cache: Optional[PassFactorCache]
+    :param point_cache: Optional cache of decompressed pass points and points b (default: None).
+    :type point_cache: Optional[PointCache]
+    :param scrypt_backend: Optional scrypt backend name (see :func:`bip38.backends`) or engine with a
+        ``scrypt.hash`` compatible ``hash`` method, e.g. :class:`bip38.kdf.ParallelScrypt` (default: the
+        fastest available backend). Class methods like :meth:`intermediate_code` use the class-level
+        ``BIP38.scrypt_backend``.
+    :type scrypt_backend: Optional[Union[str, Any]]
+    :param aes_backend: Optional AES backend name (see :func:`bip38.backends`) or :class:`bip38.aes.IAES`
+        compatible backend (default: a native backend when importable, otherwise pure Python).
+    :type aes_backend: Optional[Union[str, Any]]
     """
 
     cryptocurrency: Type[ICryptocurrency]
     networks: List[str]
     network: str
     alphabet: str
+    pass_factor_cache: Optional[PassFactorCache]
+    point_cache: Optional[PointCache]
+    scrypt_backend: Any = AutoScrypt
+    aes_backend: Any = AutoAES
 
     def __init__(
-        self, cryptocurrency: Type[ICryptocurrency], network: str = "mainnet"
+        self,
+        cryptocurrency: Type[ICryptocurrency],
+        network: str = "mainnet",
+        pass_factor_cache: Optional[PassFactorCache] = None,
+        point_cache: Optional[PointCache] = None,
+        scrypt_backend: Optional[Union[str, Any]] = None,
+        aes_backend: Optional[Union[str, Any]] = None
     ) -> None:
 
         if not issubclass(cryptocurrency, ICryptocurrency):
@@ -86,6 +122,138 @@ class BIP38:
             if self.cryptocurrency.ALPHABET else
             Bitcoin.ALPHABET
         )
+        self.pass_factor_cache = pass_factor_cache
+        self.point_cache = point_cache
+        if scrypt_backend is not None:
+            self.scrypt_backend = (
+                get_scrypt_backend(scrypt_backend) if isinstance(scrypt_backend, str) else scrypt_backend
+            )
+        if aes_backend is not None:
+            self.aes_backend = (
+                get_aes_backend(aes_backend) if isinstance(aes_backend, str) else aes_backend
+            )
+
+    def _worker_settings(self) -> Dict[str, Any]:
+        """
+        Describes this instance for the process pool workers, which rebuild it once each (see :meth:`worker_initializer`).
+
+        The calibrated scrypt backend is passed by name, so that workers do not calibrate again, and
+        caches by size, since every worker process keeps its own.
+        """
+
+        return dict(
+            cryptocurrency=self.cryptocurrency,
+            network=self.network,
+            scrypt_backend=calibrate()["selected"] if self.scrypt_backend is AutoScrypt else self.scrypt_backend,
+            aes_backend=self.aes_backend,
+            pass_factor_cache=self.pass_factor_cache.maxsize if self.pass_factor_cache is not None else None,
+            point_cache=self.point_cache.maxsize if self.point_cache is not None else None
+        )
+
+    @classmethod
+    def _from_worker_settings(cls, settings: Dict[str, Any]) -> "BIP38":
+        """
+        Rebuilds an instance from :meth:`_worker_settings`.
+        """
+
+        return cls(
+            cryptocurrency=settings["cryptocurrency"],
+            network=settings["network"],
+            pass_factor_cache=(
+                PassFactorCache(maxsize=settings["pass_factor_cache"]) if settings["pass_factor_cache"] else None
+            ),
+            point_cache=PointCache(maxsize=settings["point_cache"]) if settings["point_cache"] else None,
+            scrypt_backend=settings["scrypt_backend"],
+            aes_backend=settings["aes_backend"]
+        )
+
+    def worker_initializer(self) -> Tuple[Callable[[Dict[str, Any]], None], Tuple[Dict[str, Any]]]:
+        """
+        Builds the initializer of a process pool whose workers run with this instance's settings.
+
+        Each worker rebuilds the instance once, with the same backends and caches of the same sizes,
+        and tasks submitted through :meth:`in_worker` are called with it.
+
+        :returns: The initializer and its arguments, for ``ProcessPoolExecutor(initializer=..., initargs=...)``.
+        :rtype: Tuple[Callable[[Dict[str, Any]], None], Tuple[Dict[str, Any]]]
+
+        >>> from concurrent.futures import ProcessPoolExecutor
+        >>> from bip38 import BIP38
+        >>> from bip38.cryptocurrencies import Bitcoin
+        >>> bip38: BIP38 = BIP38(cryptocurrency=Bitcoin, network="mainnet")
+        >>> initializer, initargs = bip38.worker_initializer()
+        >>> with ProcessPoolExecutor(max_workers=2, initializer=initializer, initargs=initargs) as executor:
+        ...     executor.submit(BIP38.in_worker, BIP38.decrypt, "6PRVWUbkzzsbcVac2qwfssoUJAN1Xhrg6bNk8J7Nzm5H7kxEbn2Nh2ZoGg", "TestingOneTwoThree").result()
+        '5KN7MzqK5wt2TP1fQCYyHBtDrXdJuXbUzm4A9rKAteGu3Qi5CVR'
+        """
+
+        return _initialize, (self._worker_settings(),)
+
+    @staticmethod
+    def in_worker(function: Callable[..., Any], *args: Any) -> Any:
+        """
+        Calls a function with the instance of the current pool worker, see :meth:`worker_initializer`.
+
+        :param function: The picklable function, called as ``function(bip38, *args)``.
+        :type function: Callable[..., Any]
+        :param args: The remaining arguments of the function.
+        :type args: Any
+
+        :returns: The result of the function.
+        :rtype: Any
+        """
+
+        if _bip38 is None:
+            raise Error("Process pool worker is not initialized, see BIP38.worker_initializer")
+        return function(_bip38, *args)
+
+    def _pass_factor(
+        self,
+        passphrase: str,
+        owner_entropy: bytes,
+        lot_and_sequence: bool,
+        pass_factor_cache: Optional[PassFactorCache] = None
+    ) -> Tuple[bytes, bytes]:
+        """
+        Derives the EC-multiply pass factor and compressed pass point.
+
+        Both are looked up in ``pass_factor_cache`` (default: the instance's cache) by passphrase and
+        owner entropy, and on a miss the 16384-round scrypt pre-factor by passphrase and owner salt,
+        so every sequence of a lot shares it.
+        """
+
+        cache: Optional[PassFactorCache] = (
+            pass_factor_cache if pass_factor_cache is not None else self.pass_factor_cache
+        )
+        derived_key: Optional[bytes] = cache.key(passphrase, owner_entropy) if cache is not None else None
+        derived: Optional[Tuple[bytes, bytes]] = cache.get_derived(derived_key) if cache is not None else None
+        if derived is not None:
+            return derived
+
+        owner_salt: bytes = owner_entropy[:4] if lot_and_sequence else owner_entropy
+        key: Optional[bytes] = cache.key(passphrase, owner_salt) if cache is not None else None
+        pre_factor: Optional[bytes] = cache.get(key) if cache is not None else None
+        if pre_factor is None:
+            pre_factor = self.scrypt_backend.hash(unicodedata.normalize("NFC", passphrase), owner_salt, 16384, 8, 8, 32)
+            if cache is not None:
+                cache.put(key, pre_factor)
+
+        pass_factor: bytes = double_sha256(pre_factor + owner_entropy) if lot_and_sequence else pre_factor
+        if bytes_to_integer(pass_factor) == 0 or bytes_to_integer(pass_factor) >= N:
+            raise Error("Invalid EC encrypted WIF (Wallet Import Format)")
+        pass_point: bytes = PrivateKey.from_bytes(pass_factor).public_key().raw_compressed()
+        if cache is not None:
+            cache.put_derived(derived_key, pass_factor, pass_point)
+        return pass_factor, pass_point
+
+    def _decompress(self, point: bytes) -> Point:
+        """
+        Decompresses a 33 bytes pass point or point b, through the cache when enabled.
+        """
+
+        if self.point_cache is None:
+            return Point.from_bytes(point)
+        return Point.from_jacobian(*self.point_cache.decompress(point), 1)
 
     @classmethod
     def intermediate_code(
@@ -124,32 +292,84 @@ class BIP38:
             raise Error("Invalid owner salt length", expected=[8, 16], got=len(bytes_to_string(owner_salt)))
         if len(owner_salt) == 4 and (lot is None or sequence is None):
             raise Error("Invalid owner salt length for non lot/sequence", expected=16, got=len(bytes_to_string(owner_salt)))
-        if (lot and sequence is None) or (lot is None and sequence):
+        if (lot is not None and sequence is None) or (lot is None and sequence is not None):
             raise Error("Both lot & sequence are required", detail=f"got: (lot {lot}) & (sequence {sequence})")
 
-        if lot and sequence:
-            lot, sequence = int(lot), int(sequence)
-            if not 100000 <= lot <= 999999:
-                raise Error("Invalid lot", expected="100000 <= lot <= 999999", got=lot)
-            if not 0 <= sequence <= 4095:
-                raise Error("Invalid sequence", expected="0 <= sequence <= 4095", got=sequence)
-
-            pre_factor: bytes = scrypt.hash(unicodedata.normalize("NFC", passphrase), owner_salt[:4], 16384, 8, 8, 32)
-            owner_entropy: bytes = owner_salt[:4] + integer_to_bytes((lot * 4096 + sequence), 4)
-            pass_factor: bytes = double_sha256(pre_factor + owner_entropy)
-            magic: bytes = integer_to_bytes(MAGIC_LOT_AND_SEQUENCE)
-        else:
-            pass_factor: bytes = scrypt.hash(unicodedata.normalize("NFC", passphrase), owner_salt, 16384, 8, 8, 32)
-            magic: bytes = integer_to_bytes(MAGIC_NO_LOT_AND_SEQUENCE)
-            owner_entropy: bytes = owner_salt
+        if lot is not None and sequence is not None:
+            return next(cls.intermediate_codes(
+                passphrase=passphrase, lot=lot, sequences=[sequence], owner_salt=owner_salt
+            ))
 
+        pass_factor: bytes = cls.scrypt_backend.hash(unicodedata.normalize("NFC", passphrase), owner_salt, 16384, 8, 8, 32)
         pass_point: PublicKey = PrivateKey.from_bytes(
             private_key=pass_factor
         ).public_key()
         return ensure_string(check_encode(
-            magic + owner_entropy + pass_point.raw_compressed()
+            integer_to_bytes(MAGIC_NO_LOT_AND_SEQUENCE) + owner_salt + pass_point.raw_compressed()
         ))
 
+    @classmethod
+    def intermediate_codes(
+        cls,
+        passphrase: str,
+        lot: int,
+        sequences: Iterable[int] = range(0, 4096),
+        owner_salt: Optional[Union[str, bytes]] = None
+    ) -> Iterator[str]:
+        """
+        Generates lot & sequence intermediate passphrases for a range of sequence numbers.
+
+        The expensive scrypt pre-factor only depends on the passphrase and owner salt, so it is derived once
+        and each sequence number costs a double SHA-256 and an EC multiplication.
+
+        :param passphrase: The passphrase or password.
+        :type passphrase: str
+        :param lot: The lot number (100000-999999).
+        :type lot: int
+        :param sequences: The sequence numbers (0-4095), yielded in order (default: 0 to 4095).
+        :type sequences: Iterable[int]
+        :param owner_salt: Optional owner salt, only the first 4 bytes are used (default: random 4 bytes).
+        :type owner_salt: Optional[str, bytes]
+
+        :returns: The intermediate passphrases.
+        :rtype: Iterator[str]
+
+        >>> from bip38 import BIP38
+        >>> from bip38.cryptocurrencies import Bitcoin
+        >>> bip38: BIP38 = BIP38(cryptocurrency=Bitcoin, network="mainnet")
+        >>> list(bip38.intermediate_codes(passphrase="TestingOneTwoThree", lot=199999, sequences=range(1, 3), owner_salt="75ed1cde"))
+        ['passphraseb7ruSN4At4Rb8hPTNcAVezfsjonvUs4Qo3xSp1fBFsFPvVGSbpP2WTJMhw3mVZ', 'passphraseb7ruSN4At4RjgGZdrk1pgVFEXftJpGRdShGvMczG4oK31W7xsKBqxjbm9yXaSU']
+        """
+
+        owner_salt: bytes = get_bytes(owner_salt) if owner_salt else os.urandom(4)
+        if len(owner_salt) not in [4, 8]:
+            raise Error("Invalid owner salt length", expected=[8, 16], got=len(bytes_to_string(owner_salt)))
+        lot: int = int(lot)
+        if not 100000 <= lot <= 999999:
+            raise Error("Invalid lot", expected="100000 <= lot <= 999999", got=lot)
+
+        def generate() -> Iterator[str]:
+            pre_factor: bytes = cls.scrypt_backend.hash(
+                unicodedata.normalize("NFC", passphrase), owner_salt[:4], 16384, 8, 8, 32
+            )
+            magic: bytes = integer_to_bytes(MAGIC_LOT_AND_SEQUENCE)
+            for sequence in sequences:
+                sequence: int = int(sequence)
+                if not 0 <= sequence <= 4095:
+                    raise Error("Invalid sequence", expected="0 <= sequence <= 4095", got=sequence)
+
+                owner_entropy: bytes = owner_salt[:4] + integer_to_bytes((lot * 4096 + sequence), 4)
+                pass_factor: bytes = double_sha256(pre_factor + owner_entropy)
+                pass_point: PublicKey = PrivateKey.from_bytes(
+                    private_key=pass_factor
+                ).public_key()
+                yield ensure_string(check_encode(
+                    magic + owner_entropy + pass_point.raw_compressed()
+                ))
+
+        # Validated here rather than in the generator, so that bad arguments fail at the call
+        return generate()
+
     def encrypt(self, wif: str, passphrase: str, network: Optional[str] = None) -> str:
         """
         Encrypts a Wallet Import Format (WIF) key using a passphrase with BIP38 encryption.
@@ -185,35 +405,52 @@ class BIP38:
         wif_type: str = get_wif_type(
             wif=wif, cryptocurrency=self.cryptocurrency, network=network
         )
-        if wif_type == "wif":
-            flag: bytes = integer_to_bytes(NO_EC_MULTIPLIED_WIF_FLAG)
-            private_key: PrivateKey = PrivateKey.from_bytes(get_bytes(wif_to_private_key(
-                wif=wif, cryptocurrency=self.cryptocurrency, network=network
-            )))
-            public_key_type: str = "uncompressed"
-        else:
-            flag: bytes = integer_to_bytes(NO_EC_MULTIPLIED_WIF_COMPRESSED_FLAG)
-            private_key: PrivateKey = PrivateKey.from_bytes(get_bytes(wif_to_private_key(
-                wif=wif, cryptocurrency=self.cryptocurrency, network=network
-            )))
-            public_key_type: str = "compressed"
+        private_key: PrivateKey = PrivateKey.from_bytes(get_bytes(wif_to_private_key(
+            wif=wif, cryptocurrency=self.cryptocurrency, network=network
+        )))
+        public_key_type: str = "uncompressed" if wif_type == "wif" else "compressed"
+        return self._encrypt_private_key(
+            private_key=private_key.raw(),
+            address_hash=self._address_hash(
+                public_key=private_key.public_key(), public_key_type=public_key_type, network=network
+            ),
+            public_key_type=public_key_type,
+            passphrase=passphrase
+        )
+
+    def _address_hash(self, public_key: PublicKey, public_key_type: str, network: str) -> bytes:
+        """
+        Computes the address hash of a public key, the first 4 bytes of the double SHA-256 of its P2PKH address.
+        """
 
         address: str = P2PKHAddress.encode(
-            public_key=private_key.public_key(),
+            public_key=public_key,
             address_prefix=self.cryptocurrency.NETWORKS[network]["address_prefix"],
-            public_key_type=public_key_type
+            public_key_type=public_key_type,
+            alphabet=self.alphabet
+        )
+        return get_checksum(get_bytes(address, unhexlify=False))
+
+    def _encrypt_private_key(self, private_key: bytes, address_hash: bytes, public_key_type: str, passphrase: str) -> str:
+        """
+        Encrypts a private key without EC multiplication, under the address hash of its public key.
+        """
+
+        flag: bytes = integer_to_bytes(
+            NO_EC_MULTIPLIED_WIF_COMPRESSED_FLAG if public_key_type == "compressed" else NO_EC_MULTIPLIED_WIF_FLAG
         )
-        address_hash: bytes = get_checksum(get_bytes(address, unhexlify=False))
-        key: bytes = scrypt.hash(unicodedata.normalize("NFC", passphrase), address_hash, 16384, 8, 8)
+        key: bytes = self.scrypt_backend.hash(unicodedata.normalize("NFC", passphrase), address_hash, 16384, 8, 8)
         derived_half_1, derived_half_2 = key[0:32], key[32:64]
 
-        aes: AESModeOfOperationECB = AESModeOfOperationECB(derived_half_2)
-        encrypted_half_1: bytes = aes.encrypt(integer_to_bytes(
-            bytes_to_integer(private_key.raw()[0:16]) ^ bytes_to_integer(derived_half_1[0:16])
-        ))
-        encrypted_half_2: bytes = aes.encrypt(integer_to_bytes(
-            bytes_to_integer(private_key.raw()[16:32]) ^ bytes_to_integer(derived_half_1[16:32])
-        ))
+        encrypted_half_1, encrypted_half_2 = self.aes_backend.encrypt_blocks(
+            derived_half_2,
+            integer_to_bytes(
+                bytes_to_integer(private_key[0:16]) ^ bytes_to_integer(derived_half_1[0:16]), bytes_num=16
+            ),
+            integer_to_bytes(
+                bytes_to_integer(private_key[16:32]) ^ bytes_to_integer(derived_half_1[16:32]), bytes_num=16
+            )
+        )
 
         encrypted_private_key: bytes = (
             integer_to_bytes(
@@ -221,7 +458,7 @@ class BIP38:
             ) + flag + address_hash + encrypted_half_1 + encrypted_half_2
         )
         return ensure_string(encode(
-            encrypted_private_key + get_checksum(encrypted_private_key)
+            encrypted_private_key + get_checksum(encrypted_private_key), alphabet=self.alphabet
         ))
 
     def create_new_encrypted_wif(
@@ -261,6 +498,176 @@ class BIP38:
         if network not in self.networks:
             raise NetworkError("Wrong network type", expected=self.networks, got=type(network))
         seed_b: bytes = get_bytes(seed) if seed else os.urandom(24)
+        flag, owner_entropy, pass_point, public_key_type = self._decode_intermediate_passphrase(
+            intermediate_passphrase=intermediate_passphrase, wif_type=wif_type
+        )
+        return self._create_encrypted_wif(
+            flag=flag,
+            owner_entropy=owner_entropy,
+            pass_point=pass_point,
+            pass_point_multiplier=self._decompress(pass_point),
+            public_key_type=public_key_type,
+            seed_b=seed_b,
+            network=network
+        )
+
+    def create_new_encrypted_wifs(
+        self,
+        intermediate_passphrase: str,
+        count: int,
+        wif_type: str = "wif",
+        seeds: Optional[Iterable[Union[str, bytes]]] = None,
+        network: Optional[str] = None,
+        batch_size: int = 64
+    ) -> Iterator[dict]:
+        """
+        Creates many new encrypted WIFs (Wallet Import Format) from one intermediate passphrase.
+
+        The intermediate passphrase is decoded and validated once, and a fixed-base precomputation
+        table is built for its pass point, so every key only costs a table-driven multiplication.
+        Keys are minted in batches, so that their 1024-round scrypt runs and AES rounds go through the
+        batch APIs of the scrypt and AES backends (see :func:`bip38.kdf.scrypt_many` and
+        :func:`bip38.aes.encrypt_many`).
+
+        :param intermediate_passphrase: The intermediate passphrase.
+        :type intermediate_passphrase: str
+        :param count: The number of encrypted WIFs to create.
+        :type count: int
+        :param wif_type: The WIF type, either 'wif' or 'wif-compressed' (default is 'wif').
+        :type wif_type: str
+        :param seeds: Optional seeds, one per encrypted WIF (default: random 24 bytes each).
+        :type seeds: Optional[Iterable[Union[str, bytes]]]
+        :param network: Optional network for encryption. Defaults to the class's network if not provided.
+        :type network: Optional[str]
+        :param batch_size: The number of keys minted per batch (default: 64).
+        :type batch_size: int
+
+        :returns: Dictionaries containing the encrypted WIFs, like :meth:`create_new_encrypted_wif`.
+        :rtype: Iterator[dict]
+
+        >>> from bip38 import BIP38
+        >>> from bip38.cryptocurrencies import Bitcoin
+        >>> bip38: BIP38 = BIP38(cryptocurrency=Bitcoin, network="testnet")
+        >>> [new["encrypted_wif"] for new in bip38.create_new_encrypted_wifs(intermediate_passphrase="passphraseb7ruSN4At4Rb8hPTNcAVezfsjonvUs4Qo3xSp1fBFsFPvVGSbpP2WTJMhw3mVZ", count=1, wif_type="wif-compressed", seeds=["99241d58245c883896f80843d2846672d7312e6195ca1a6c"])]
+        ['6PoH364JVeoBPsJBveXCwfWpX2H82N5qiAervtynak7r7dzZF2TBFxZAXE']
+        """
+
+        network: str = (
+            network if network else self.network
+        )
+        if network not in self.networks:
+            raise NetworkError("Wrong network type", expected=self.networks, got=type(network))
+        flag, owner_entropy, pass_point, public_key_type = self._decode_intermediate_passphrase(
+            intermediate_passphrase=intermediate_passphrase, wif_type=wif_type
+        )
+        pass_point_multiplier: Point = self._decompress(pass_point).precomputed()
+        seeds: Iterator[Union[str, bytes]] = iter(seeds) if seeds is not None else iter(
+            lambda: os.urandom(24), None
+        )
+
+        while count > 0:
+            seeds_b: List[bytes] = []
+            for seed_b in seeds:
+                seeds_b.append(get_bytes(seed_b))
+                if len(seeds_b) == min(count, batch_size):
+                    break
+            if not seeds_b:
+                return
+            count -= len(seeds_b)
+            batch: List[Tuple[bytes, ...]] = [
+                (seed_b,) + derived for seed_b, derived in zip(seeds_b, self._derive_addresses(
+                    pass_point_multiplier=pass_point_multiplier, seeds_b=seeds_b, public_key_type=public_key_type, network=network
+                ))
+            ]
+
+            scrypt_hashes: List[bytes] = scrypt_many(
+                [pass_point] * len(batch), [item[4] + owner_entropy for item in batch], 1024, 1, 1, 64,
+                backend=self.scrypt_backend
+            )
+            yield from self._seal_encrypted_wifs(
+                flag=flag, owner_entropy=owner_entropy, public_key_type=public_key_type, batch=batch, scrypt_hashes=scrypt_hashes
+            )
+
+    def intermediate_pass_point(self, intermediate_passphrase: str, wif_type: str = "wif") -> Tuple[Point, str]:
+        """
+        Decodes and validates an intermediate passphrase into its pass point, with a precomputed
+        fixed-base table, and the public key type of the keys created from it.
+
+        :param intermediate_passphrase: The intermediate passphrase.
+        :type intermediate_passphrase: str
+        :param wif_type: The WIF type, either 'wif' or 'wif-compressed' (default is 'wif').
+        :type wif_type: str
+
+        :returns: The precomputed pass point and the public key type, to pass to :meth:`seed_addresses`.
+        :rtype: Tuple[Point, str]
+
+        >>> from bip38 import BIP38
+        >>> from bip38.cryptocurrencies import Bitcoin
+        >>> bip38: BIP38 = BIP38(cryptocurrency=Bitcoin, network="testnet")
+        >>> bip38.intermediate_pass_point(intermediate_passphrase="passphraseb7ruSN4At4Rb8hPTNcAVezfsjonvUs4Qo3xSp1fBFsFPvVGSbpP2WTJMhw3mVZ", wif_type="wif-compressed")[1]
+        'compressed'
+        """
+
+        _, _, pass_point, public_key_type = self._decode_intermediate_passphrase(
+            intermediate_passphrase=intermediate_passphrase, wif_type=wif_type
+        )
+        return self._decompress(pass_point).precomputed(), public_key_type
+
+    def seed_addresses(
+        self,
+        pass_point: Point,
+        seeds: Sequence[Union[str, bytes]],
+        public_key_type: str = "uncompressed",
+        network: Optional[str] = None
+    ) -> List[str]:
+        """
+        Derives the addresses of the keys :meth:`create_new_encrypted_wif` creates from seeds, without
+        their scrypt and AES steps.
+
+        :param pass_point: The pass point, see :meth:`intermediate_pass_point`.
+        :type pass_point: Point
+        :param seeds: The seeds, 24 bytes each.
+        :type seeds: Sequence[Union[str, bytes]]
+        :param public_key_type: The public key type, either 'uncompressed' or 'compressed' (default: 'uncompressed').
+        :type public_key_type: str
+        :param network: Optional network of the addresses. Defaults to the class's network if not provided.
+        :type network: Optional[str]
+
+        :returns: The addresses, in the same order as the seeds.
+        :rtype: List[str]
+
+        >>> from bip38 import BIP38
+        >>> from bip38.cryptocurrencies import Bitcoin
+        >>> bip38: BIP38 = BIP38(cryptocurrency=Bitcoin, network="testnet")
+        >>> pass_point, public_key_type = bip38.intermediate_pass_point(intermediate_passphrase="passphraseb7ruSN4At4Rb8hPTNcAVezfsjonvUs4Qo3xSp1fBFsFPvVGSbpP2WTJMhw3mVZ", wif_type="wif-compressed")
+        >>> bip38.seed_addresses(pass_point=pass_point, seeds=["99241d58245c883896f80843d2846672d7312e6195ca1a6c"], public_key_type=public_key_type)
+        ['mjurfzLk2ryxCyfm4nMk5qarvNRhbNCtK8']
+        """
+
+        network: str = (
+            network if network else self.network
+        )
+        if network not in self.networks:
+            raise NetworkError("Wrong network type", expected=self.networks, got=type(network))
+        if public_key_type not in PUBLIC_KEY_TYPES:
+            raise Error("Invalid public key type", expected=PUBLIC_KEY_TYPES, got=public_key_type)
+        return [
+            address for _, _, address, _ in self._derive_addresses(
+                pass_point_multiplier=pass_point,
+                seeds_b=[get_bytes(seed) for seed in seeds],
+                public_key_type=public_key_type,
+                network=network
+            )
+        ]
+
+    @staticmethod
+    def _decode_intermediate_passphrase(
+        intermediate_passphrase: str, wif_type: str
+    ) -> Tuple[bytes, bytes, bytes, str]:
+        """
+        Decodes and validates an intermediate passphrase into its flag, owner entropy, pass point and public key type.
+        """
+
         try:
             intermediate_decode: bytes = check_decode(intermediate_passphrase)
         except ValueError:
@@ -296,63 +703,130 @@ class BIP38:
                     bytes_to_string(integer_to_bytes(MAGIC_NO_LOT_AND_SEQUENCE))
                 ], got=bytes_to_string(magic)
             )
+        return flag, owner_entropy, pass_point, public_key_type
 
-        factor_b: bytes = double_sha256(seed_b)
-        if not 0 < bytes_to_integer(factor_b) < N:
-            raise Error("Invalid EC encrypted WIF (Wallet Import Format)")
+    def _create_encrypted_wif(
+        self,
+        flag: bytes,
+        owner_entropy: bytes,
+        pass_point: bytes,
+        pass_point_multiplier: Point,
+        public_key_type: str,
+        seed_b: bytes,
+        network: str
+    ) -> dict:
+        """
+        Creates one encrypted WIF and confirmation code from a decoded intermediate passphrase and seed.
+        """
 
-        public_key: PublicKey = PublicKey.from_point(
-            PublicKey.from_bytes(pass_point).point() * bytes_to_integer(factor_b)
-        )
-        address: str = P2PKHAddress.encode(
-            public_key=public_key,
-            address_prefix=self.cryptocurrency.NETWORKS[network]["address_prefix"],
-            public_key_type=public_key_type
-        )
-        address_hash: bytes = get_checksum(get_bytes(address, unhexlify=False))
+        factor_b, public_key, address, address_hash = self._derive_addresses(
+            pass_point_multiplier=pass_point_multiplier, seeds_b=[seed_b], public_key_type=public_key_type, network=network
+        )[0]
         salt: bytes = address_hash + owner_entropy
-        scrypt_hash: bytes = scrypt.hash(pass_point, salt, 1024, 1, 1, 64)
-        derived_half_1, derived_half_2, key = scrypt_hash[:16], scrypt_hash[16:32], scrypt_hash[32:]
+        return self._seal_encrypted_wifs(
+            flag=flag,
+            owner_entropy=owner_entropy,
+            public_key_type=public_key_type,
+            batch=[(seed_b, factor_b, public_key, address, address_hash)],
+            scrypt_hashes=[self.scrypt_backend.hash(pass_point, salt, 1024, 1, 1, 64)]
+        )[0]
 
-        aes: AESModeOfOperationECB = AESModeOfOperationECB(key)
-        encrypted_half_1: bytes = aes.encrypt(integer_to_bytes(
-            bytes_to_integer(seed_b[:16]) ^ bytes_to_integer(derived_half_1)
-        ))
-        encrypted_half_2: bytes = aes.encrypt(integer_to_bytes(
-            bytes_to_integer(encrypted_half_1[8:] + seed_b[16:]) ^ bytes_to_integer(derived_half_2)
-        ))
-        encrypted_wif: str = ensure_string(check_encode((
-            integer_to_bytes(EC_MULTIPLIED_PRIVATE_KEY_PREFIX) +
-            flag + address_hash + owner_entropy + encrypted_half_1[:8] + encrypted_half_2
-        )))
+    def _derive_addresses(
+        self, pass_point_multiplier: Point, seeds_b: List[bytes], public_key_type: str, network: str
+    ) -> List[Tuple[bytes, PublicKey, str, bytes]]:
+        """
+        Derives factor b, the public key, the address and the address hash of new EC-multiplied keys.
 
-        point_b: bytes = PrivateKey.from_bytes(factor_b).public_key().raw_compressed()
-        point_b_prefix: bytes = integer_to_bytes(
-            (bytes_to_integer(scrypt_hash[63:]) & 1) ^ bytes_to_integer(point_b[:1])
-        )
-        point_b_half_1: bytes = aes.encrypt(integer_to_bytes(
-            bytes_to_integer(point_b[1:17]) ^ bytes_to_integer(derived_half_1)
-        ))
-        point_b_half_2: bytes = aes.encrypt(integer_to_bytes(
-            bytes_to_integer(point_b[17:]) ^ bytes_to_integer(derived_half_2)
-        ))
-        encrypted_point_b: bytes = (
-            point_b_prefix + point_b_half_1 + point_b_half_2
-        )
-        confirmation_code: str = ensure_string(check_encode((
-            integer_to_bytes(CONFIRMATION_CODE_PREFIX) + flag + address_hash + owner_entropy + encrypted_point_b
-        )))
+        The products of the pass point are normalized together with a single field inversion.
+        """
 
-        return dict(
-            encrypted_wif=encrypted_wif,
-            confirmation_code=confirmation_code,
-            public_key=bytes_to_string(
-                public_key.raw(public_key_type=public_key_type)
-            ),
-            seed=bytes_to_string(seed_b),
+        factors_b: List[bytes] = [double_sha256(seed_b) for seed_b in seeds_b]
+        for factor_b in factors_b:
+            if not 0 < bytes_to_integer(factor_b) < N:
+                raise Error("Invalid EC encrypted WIF (Wallet Import Format)")
+
+        public_keys: List[PublicKey] = PublicKey._from_trusted_points_many([
+            pass_point_multiplier * bytes_to_integer(factor_b) for factor_b in factors_b
+        ])
+        addresses: List[str] = P2PKHAddress.encode_many(
+            public_keys,
+            address_prefix=self.cryptocurrency.NETWORKS[network]["address_prefix"],
             public_key_type=public_key_type,
-            address=address
+            alphabet=self.alphabet
         )
+        return [
+            (factor_b, public_key, address, get_checksum(get_bytes(address, unhexlify=False)))
+            for factor_b, public_key, address in zip(factors_b, public_keys, addresses)
+        ]
+
+    def _seal_encrypted_wifs(
+        self,
+        flag: bytes,
+        owner_entropy: bytes,
+        public_key_type: str,
+        batch: List[Tuple[bytes, bytes, PublicKey, str, bytes]],
+        scrypt_hashes: List[bytes]
+    ) -> List[dict]:
+        """
+        Encrypts seed b and point b of new EC-multiplied keys into their encrypted WIFs and confirmation codes.
+
+        The batch holds (seed b, factor b, public key, address, address hash) items, and the AES
+        rounds of the whole batch go through :func:`bip38.aes.encrypt_many`.
+        """
+
+        keys: List[bytes] = [scrypt_hash[32:] for scrypt_hash in scrypt_hashes]
+        encrypted_halves_1: List[bytes] = encrypt_many(keys, [
+            integer_to_bytes(bytes_to_integer(seed_b[:16]) ^ bytes_to_integer(scrypt_hash[:16]), bytes_num=16)
+            for (seed_b, *_), scrypt_hash in zip(batch, scrypt_hashes)
+        ], backend=self.aes_backend)
+        encrypted_halves_2: List[bytes] = encrypt_many(keys, [
+            integer_to_bytes(
+                bytes_to_integer(encrypted_half_1[8:] + seed_b[16:]) ^ bytes_to_integer(scrypt_hash[16:32]), bytes_num=16
+            ) for (seed_b, *_), scrypt_hash, encrypted_half_1 in zip(batch, scrypt_hashes, encrypted_halves_1)
+        ], backend=self.aes_backend)
+
+        points_b: List[bytes] = [
+            public_key.raw_compressed() for public_key in PrivateKey.public_keys_many([
+                factor_b for _, factor_b, *_ in batch
+            ])
+        ]
+        encrypted_points_b: List[bytes] = encrypt_many(keys, [
+            integer_to_bytes(bytes_to_integer(point_b[1:17]) ^ bytes_to_integer(scrypt_hash[:16]), bytes_num=16) +
+            integer_to_bytes(bytes_to_integer(point_b[17:]) ^ bytes_to_integer(scrypt_hash[16:32]), bytes_num=16)
+            for point_b, scrypt_hash in zip(points_b, scrypt_hashes)
+        ], backend=self.aes_backend)
+
+        encrypted_wifs: List[str] = check_encode_many([
+            integer_to_bytes(EC_MULTIPLIED_PRIVATE_KEY_PREFIX) +
+            flag + address_hash + owner_entropy + encrypted_half_1[:8] + encrypted_half_2
+            for (_, _, _, _, address_hash), encrypted_half_1, encrypted_half_2 in zip(
+                batch, encrypted_halves_1, encrypted_halves_2
+            )
+        ], alphabet=self.alphabet)
+        confirmation_codes: List[str] = check_encode_many([
+            integer_to_bytes(CONFIRMATION_CODE_PREFIX) + flag + address_hash + owner_entropy + integer_to_bytes(
+                (bytes_to_integer(scrypt_hash[63:]) & 1) ^ bytes_to_integer(point_b[:1])
+            ) + encrypted_point_b
+            for (_, _, _, _, address_hash), scrypt_hash, point_b, encrypted_point_b in zip(
+                batch, scrypt_hashes, points_b, encrypted_points_b
+            )
+        ], alphabet=self.alphabet)
+
+        results: List[dict] = []
+        for (seed_b, _, public_key, address, _), encrypted_wif, confirmation_code in zip(
+            batch, encrypted_wifs, confirmation_codes
+        ):
+            results.append(dict(
+                encrypted_wif=encrypted_wif,
+                confirmation_code=confirmation_code,
+                public_key=bytes_to_string(
+                    public_key.raw(public_key_type=public_key_type)
+                ),
+                seed=bytes_to_string(seed_b),
+                public_key_type=public_key_type,
+                address=address
+            ))
+        return results
 
     def confirm_code(
         self, passphrase: str, confirmation_code: str, network: Optional[str] = None, detail: bool = False
@@ -388,8 +862,124 @@ class BIP38:
         )
         if network not in self.networks:
             raise NetworkError("Wrong network type", expected=self.networks, got=type(network))
+        flag, address_hash, owner_entropy, encrypted_point_b, lot_and_sequence = self._decode_confirmation_code(
+            confirmation_code=confirmation_code
+        )
+        pass_factor, pass_point = self._pass_factor(
+            passphrase=passphrase, owner_entropy=owner_entropy, lot_and_sequence=lot_and_sequence is not None
+        )
+        salt: bytes = address_hash + owner_entropy
+        scrypt_hash: bytes = self.scrypt_backend.hash(pass_point, salt, 1024, 1, 1, 64)
+        decrypted_half_1, decrypted_half_2 = self.aes_backend.decrypt_blocks(
+            scrypt_hash[32:], encrypted_point_b[1:17], encrypted_point_b[17:]
+        )
+        return self._confirm_point_b(
+            flag=flag,
+            address_hash=address_hash,
+            lot_and_sequence=lot_and_sequence,
+            pass_factor=pass_factor,
+            scrypt_hash=scrypt_hash,
+            encrypted_point_b=encrypted_point_b,
+            decrypted_point_b=decrypted_half_1 + decrypted_half_2,
+            network=network,
+            detail=detail
+        )
+
+    def confirm_codes(
+        self, passphrase: str, confirmation_codes: Iterable[str], network: Optional[str] = None, detail: bool = False
+    ) -> List[Union[str, dict, Error]]:
+        """
+        Confirms the passphrase of many confirmation codes at once.
+
+        Scrypt pre-factors are derived once per owner salt, and the 1024-round scrypt runs and AES rounds
+        of all codes go through the batch APIs of the scrypt and AES backends. Per-item failures
+        are returned in place of the result instead of aborting the whole batch.
+
+        :param passphrase: The passphrase or password.
+        :type passphrase: str
+        :param confirmation_codes: The confirmation codes.
+        :type confirmation_codes: Iterable[str]
+        :param network: Optional network for encryption. Defaults to the class's network if not provided.
+        :type network: Optional[str]
+        :param detail: Whether to return detailed info (default: False).
+        :type detail: bool
+
+        :returns: The addresses, detailed infos or errors, in the same order as the confirmation codes.
+        :rtype: List[Union[str, dict, Error]]
+
+        >>> from bip38 import BIP38
+        >>> from bip38.cryptocurrencies import Bitcoin
+        >>> bip38: BIP38 = BIP38(cryptocurrency=Bitcoin, network="mainnet")
+        >>> bip38.confirm_codes(passphrase="TestingOneTwoThree", confirmation_codes=["cfrm38V8Foq3WpRPMXJD34SF6pGT6ht5ihYMWWMbezkzHgPpA1jVkfbTHwQzvuSA4ReF86PHZJY", "FAKE_CONFIRMATION_CODE"])
+        ['1JbyXoVN4hXWirGB265q9VE4pQ6qbY6kmr', Error('Invalid confirmation code')]
+        """
+
+        network: str = (
+            network if network else self.network
+        )
+        if network not in self.networks:
+            raise NetworkError("Wrong network type", expected=self.networks, got=type(network))
+
+        results: List[Union[str, dict, Error]] = []
+        pending: List[Tuple[int, Tuple[bytes, bytes, bytes, bytes, Optional[bytes]], bytes, bytes]] = []
+        # Without a cache of the instance, a batch still runs the 16384-round scrypt once per owner salt
+        pass_factor_cache: PassFactorCache = (
+            self.pass_factor_cache if self.pass_factor_cache is not None else PassFactorCache()
+        )
+        for index, confirmation_code in enumerate(confirmation_codes):
+            results.append(None)
+            try:
+                decoded: Tuple[bytes, bytes, bytes, bytes, Optional[bytes]] = self._decode_confirmation_code(
+                    confirmation_code=confirmation_code
+                )
+                pass_factor, pass_point = self._pass_factor(
+                    passphrase=passphrase,
+                    owner_entropy=decoded[2],
+                    lot_and_sequence=decoded[4] is not None,
+                    pass_factor_cache=pass_factor_cache
+                )
+            except Error as error:
+                results[index] = error
+                continue
+            pending.append((index, decoded, pass_factor, pass_point))
+
+        scrypt_hashes: List[bytes] = scrypt_many(
+            [pass_point for *_, pass_point in pending],
+            [decoded[1] + decoded[2] for _, decoded, *_ in pending], 1024, 1, 1, 64,
+            backend=self.scrypt_backend
+        )
+        decrypted_points_b: List[bytes] = decrypt_many(
+            [scrypt_hash[32:] for scrypt_hash in scrypt_hashes],
+            [decoded[3][1:] for _, decoded, *_ in pending],
+            backend=self.aes_backend
+        )
+        for (index, decoded, pass_factor, _), scrypt_hash, decrypted_point_b in zip(
+            pending, scrypt_hashes, decrypted_points_b
+        ):
+            flag, address_hash, _, encrypted_point_b, lot_and_sequence = decoded
+            try:
+                results[index] = self._confirm_point_b(
+                    flag=flag,
+                    address_hash=address_hash,
+                    lot_and_sequence=lot_and_sequence,
+                    pass_factor=pass_factor,
+                    scrypt_hash=scrypt_hash,
+                    encrypted_point_b=encrypted_point_b,
+                    decrypted_point_b=decrypted_point_b,
+                    network=network,
+                    detail=detail
+                )
+            except Error as error:
+                results[index] = error
+        return results
+
+    def _decode_confirmation_code(self, confirmation_code: str) -> Tuple[bytes, bytes, bytes, bytes, Optional[bytes]]:
+        """
+        Decodes and validates a confirmation code into its flag, address hash, owner entropy, encrypted point b and lot & sequence.
+        """
+
         try:
-            confirmation_code_decode: bytes = check_decode(confirmation_code)
+            confirmation_code_decode: bytes = check_decode(confirmation_code, alphabet=self.alphabet)
         except ValueError:
             raise Error("Invalid confirmation code")
         if len(confirmation_code_decode) != 51:
@@ -401,34 +991,33 @@ class BIP38:
             raise Error("Invalid confirmation code prefix", expected=prefix_length, got=prefix_got)
 
         flag: bytes = confirmation_code_decode[5:6]
-        address_hash: bytes = confirmation_code_decode[6:10]
         owner_entropy: bytes = confirmation_code_decode[10:18]
-        encrypted_point_b: bytes = confirmation_code_decode[18:]
-
         lot_and_sequence: Optional[bytes] = None
         if bytes_to_integer(flag) in FLAGS["lot_and_sequence"]:
-            owner_salt: bytes = owner_entropy[:4]
             lot_and_sequence = owner_entropy[4:]
-        else:
-            owner_salt: bytes = owner_entropy
+        return flag, confirmation_code_decode[6:10], owner_entropy, confirmation_code_decode[18:], lot_and_sequence
 
-        pass_factor: bytes = scrypt.hash(unicodedata.normalize("NFC", passphrase), owner_salt, 16384, 8, 8, 32)
-        if lot_and_sequence:
-            pass_factor: bytes = double_sha256(pass_factor + owner_entropy)
-        if bytes_to_integer(pass_factor) == 0 or bytes_to_integer(pass_factor) >= N:
-            raise Error("Invalid EC encrypted WIF (Wallet Import Format)")
-
-        pass_point: bytes = PrivateKey.from_bytes(pass_factor).public_key().raw_compressed()
-        salt: bytes = address_hash + owner_entropy
-        scrypt_hash: bytes = scrypt.hash(pass_point, salt, 1024, 1, 1, 64)
-        derived_half_1, derived_half_2, key = encrypted_point_b[1:17], encrypted_point_b[17:], scrypt_hash[32:]
+    def _confirm_point_b(
+        self,
+        flag: bytes,
+        address_hash: bytes,
+        lot_and_sequence: Optional[bytes],
+        pass_factor: bytes,
+        scrypt_hash: bytes,
+        encrypted_point_b: bytes,
+        decrypted_point_b: bytes,
+        network: str,
+        detail: bool
+    ) -> Union[str, dict]:
+        """
+        Recovers point b from its AES-decrypted halves and checks it against the address hash.
+        """
 
-        aes: AESModeOfOperationECB = AESModeOfOperationECB(key)
         point_b_half_1: bytes = integer_to_bytes(
-            bytes_to_integer(aes.decrypt(derived_half_1)) ^ bytes_to_integer(scrypt_hash[:16])
+            bytes_to_integer(decrypted_point_b[:16]) ^ bytes_to_integer(scrypt_hash[:16]), bytes_num=16
         )
         point_b_half_2: bytes = integer_to_bytes(
-            bytes_to_integer(aes.decrypt(derived_half_2)) ^ bytes_to_integer(scrypt_hash[16:32])
+            bytes_to_integer(decrypted_point_b[16:]) ^ bytes_to_integer(scrypt_hash[16:32]), bytes_num=16
         )
         point_b_prefix: bytes = integer_to_bytes(
             bytes_to_integer(encrypted_point_b[:1]) ^ (bytes_to_integer(scrypt_hash[63:]) & 1)
@@ -438,8 +1027,8 @@ class BIP38:
         )
 
         try:
-            public_key: PublicKey = PublicKey.from_point(
-                PublicKey.from_bytes(point_b).point() * bytes_to_integer(pass_factor)
+            public_key: PublicKey = PublicKey._from_trusted_point(
+                self._decompress(point_b) * bytes_to_integer(pass_factor)
             )
             public_key_type: str = "uncompressed"
             if bytes_to_integer(flag) in FLAGS["compression"]:
@@ -450,7 +1039,8 @@ class BIP38:
         address: str = P2PKHAddress.encode(
             public_key=public_key,
             address_prefix=self.cryptocurrency.NETWORKS[network]["address_prefix"],
-            public_key_type=public_key_type
+            public_key_type=public_key_type,
+            alphabet=self.alphabet
         )
         if get_checksum(get_bytes(address, unhexlify=False)) == address_hash:
             lot: Optional[int] = None
@@ -505,99 +1095,329 @@ class BIP38:
         )
         if network not in self.networks:
             raise NetworkError("Wrong network type", expected=self.networks, got=type(network))
-        encrypted_wif_decode: bytes = decode(encrypted_wif)
+        encrypted_wif_decode: bytes = self._decode_encrypted_wif(encrypted_wif)
+        private_key, seed_b, lot_and_sequence = self._decrypt_private_key(
+            encrypted_wif_decode=encrypted_wif_decode, passphrase=passphrase
+        )
+        return self._decrypted(
+            flag=encrypted_wif_decode[2:3],
+            address_hash=encrypted_wif_decode[3:7],
+            lot_and_sequence=lot_and_sequence,
+            private_key=private_key,
+            public_key=PrivateKey.from_bytes(private_key).public_key(),
+            seed_b=seed_b,
+            network=network,
+            detail=detail
+        )
+
+    def decrypt_any(
+        self,
+        encrypted_wif: str,
+        passphrase: str,
+        candidates: Optional[Iterable[Union[Type[ICryptocurrency], Tuple[Type[ICryptocurrency], str]]]] = None,
+        detail: bool = False
+    ) -> List[dict]:
+        """
+        Decrypts an encrypted WIF (Wallet Import Format) for whichever cryptocurrencies and networks it belongs to.
+
+        The scrypt salt is the address hash stored in the encrypted WIF (with the owner salt for EC-multiplied
+        keys), so the private key is decrypted once per alphabet the candidates use, and every candidate then
+        only costs the base58check encoding of its address to compare against the address hash.
+
+        :param encrypted_wif: The encrypted WIF.
+        :type encrypted_wif: str
+        :param passphrase: The passphrase or password.
+        :type passphrase: str
+        :param candidates: Cryptocurrencies (with all their networks) or (cryptocurrency, network) pairs to
+            test (default: every cryptocurrency in :data:`bip38.cryptocurrencies.CRYPTOCURRENCIES`).
+        :type candidates: Optional[Iterable[Union[Type[ICryptocurrency], Tuple[Type[ICryptocurrency], str]]]]
+        :param detail: Whether to return detailed info (default: False).
+        :type detail: bool
+
+        :returns: The matching candidates, in order, as dictionaries with the cryptocurrency name, the
+            network and the decrypted WIF, or the detailed private key info like :meth:`decrypt`.
+        :rtype: List[dict]
+
+        >>> from bip38 import BIP38
+        >>> from bip38.cryptocurrencies import Bitcoin, Litecoin
+        >>> bip38: BIP38 = BIP38(cryptocurrency=Bitcoin, network="mainnet")
+        >>> bip38.decrypt_any(encrypted_wif="6PRL8jj6dLQjBBJjHMdUKLSNLEpjTyAfmt8GnCnfT87NeQ2BU5eAW1tcsS", passphrase="TestingOneTwoThree", candidates=[Bitcoin, Litecoin])
+        [{'cryptocurrency': 'Bitcoin', 'network': 'testnet', 'wif': '938jwjergAxARSWx2YSt9nSBWBz24h8gLhv7EUfgEP1wpMLg6iX'}, {'cryptocurrency': 'Bitcoin', 'network': 'regtest', 'wif': '938jwjergAxARSWx2YSt9nSBWBz24h8gLhv7EUfgEP1wpMLg6iX'}, {'cryptocurrency': 'Litecoin', 'network': 'testnet', 'wif': '938jwjergAxARSWx2YSt9nSBWBz24h8gLhv7EUfgEP1wpMLg6iX'}]
+        """
+
+        pairs: List[Tuple[Type[ICryptocurrency], str]] = []
+        for candidate in (candidates if candidates is not None else CRYPTOCURRENCIES.values()):
+            cryptocurrency, networks = (
+                (candidate[0], [candidate[1]]) if isinstance(candidate, tuple) else (candidate, list(candidate.NETWORKS))
+            )
+            if not isinstance(cryptocurrency, type) or not issubclass(cryptocurrency, ICryptocurrency):
+                raise CryptocurrencyError(
+                    "Invalid cryptocurrency sub-class", expected=Type[ICryptocurrency], got=type(cryptocurrency)
+                )
+            for network in networks:
+                if network not in cryptocurrency.NETWORKS:
+                    raise NetworkError("Wrong network type", expected=list(cryptocurrency.NETWORKS), got=network)
+                pairs.append((cryptocurrency, network))
+        groups: Dict[str, List[Tuple[int, Type[ICryptocurrency], str]]] = {}
+        for index, (cryptocurrency, network) in enumerate(pairs):
+            groups.setdefault(
+                cryptocurrency.ALPHABET if cryptocurrency.ALPHABET else Bitcoin.ALPHABET, []
+            ).append((index, cryptocurrency, network))
+
+        # Keyed by the decoded payload, so alphabets decoding to the same bytes share one decryption
+        decrypted: Dict[bytes, Tuple[bytes, Optional[bytes], Optional[bytes], PublicKey]] = {}
+        error: Optional[Error] = None
+        matches: List[Tuple[int, dict]] = []
+        for alphabet, group in groups.items():
+            try:
+                encrypted_wif_decode: bytes = self._decode_encrypted_wif(encrypted_wif, alphabet=alphabet)
+                if encrypted_wif_decode[:39] not in decrypted:
+                    private_key, seed_b, lot_and_sequence = self._decrypt_private_key(
+                        encrypted_wif_decode=encrypted_wif_decode, passphrase=passphrase
+                    )
+                    decrypted[encrypted_wif_decode[:39]] = (
+                        private_key, seed_b, lot_and_sequence, PrivateKey.from_bytes(private_key).public_key()
+                    )
+            except Error as ex:
+                error = error if error else ex
+                continue
+            private_key, seed_b, lot_and_sequence, public_key = decrypted[encrypted_wif_decode[:39]]
+            flag, address_hash = encrypted_wif_decode[2:3], encrypted_wif_decode[3:7]
+            public_key_hash: bytes = hash160(
+                public_key.raw_compressed() if bytes_to_integer(flag) in FLAGS["compression"] else
+                public_key.raw_uncompressed()
+            )
+            for index, cryptocurrency, network in group:
+                address: str = check_encode(
+                    integer_to_bytes(cryptocurrency.NETWORKS[network]["address_prefix"]) + public_key_hash,
+                    alphabet=alphabet
+                )
+                if get_checksum(get_bytes(address, unhexlify=False)) != address_hash:
+                    continue
+                decrypted_wif: Union[str, dict] = self._decrypted(
+                    flag=flag,
+                    address_hash=address_hash,
+                    lot_and_sequence=lot_and_sequence,
+                    private_key=private_key,
+                    public_key=public_key,
+                    seed_b=seed_b,
+                    network=network,
+                    detail=detail,
+                    cryptocurrency=cryptocurrency
+                )
+                matches.append((index, dict(
+                    cryptocurrency=cryptocurrency.__name__,
+                    network=network,
+                    **(decrypted_wif if detail else dict(wif=decrypted_wif))
+                )))
+
+        if not decrypted and error is not None:
+            raise error
+        if not matches:
+            raise PassphraseError("Incorrect passphrase")
+        return [match for _, match in sorted(matches, key=lambda match: match[0])]
+
+    def reencrypt(
+        self, encrypted_wif: str, old_passphrase: str, new_passphrase: str, network: Optional[str] = None
+    ) -> str:
+        """
+        Re-encrypts an encrypted WIF (Wallet Import Format) under a new passphrase.
+
+        The old passphrase is checked against the address hash like :meth:`decrypt`, and the new ciphertext
+        is keyed by that same address hash, so only the two scrypt runs and one public key derivation are
+        spent, with no WIF, second public key or address encoding. EC-multiplied keys are re-encrypted
+        without EC multiplication, since their pass factor is bound to the owner's intermediate code.
+
+        :param encrypted_wif: The encrypted WIF.
+        :type encrypted_wif: str
+        :param old_passphrase: The current passphrase.
+        :type old_passphrase: str
+        :param new_passphrase: The new passphrase.
+        :type new_passphrase: str
+        :param network: Optional network of the key. Defaults to the class's network if not provided.
+        :type network: Optional[str]
+
+        :returns: The encrypted WIF under the new passphrase.
+        :rtype: str
+
+        >>> from bip38 import BIP38
+        >>> from bip38.cryptocurrencies import Bitcoin
+        >>> bip38: BIP38 = BIP38(cryptocurrency=Bitcoin, network="mainnet")
+        >>> bip38.reencrypt(encrypted_wif="6PRVWUbkzzsbcVac2qwfssoUJAN1Xhrg6bNk8J7Nzm5H7kxEbn2Nh2ZoGg", old_passphrase="TestingOneTwoThree", new_passphrase="Satoshi")
+        '6PRVWUbkyejHFBoq4Kd7MRnXDct1FHDExikmK3K81L7gd4vu8t5diA4ACW'
+        """
+
+        network: str = (
+            network if network else self.network
+        )
+        if network not in self.networks:
+            raise NetworkError("Wrong network type", expected=self.networks, got=type(network))
+        encrypted_wif_decode: bytes = self._decode_encrypted_wif(encrypted_wif)
+        private_key: Optional[bytes] = self._verified_private_key(
+            encrypted_wif_decode=encrypted_wif_decode, passphrase=old_passphrase, network=network
+        )
+        if private_key is None:
+            raise PassphraseError("Incorrect passphrase")
+        return self._encrypt_private_key(
+            private_key=private_key,
+            address_hash=encrypted_wif_decode[3:7],
+            public_key_type=(
+                "compressed" if bytes_to_integer(encrypted_wif_decode[2:3]) in FLAGS["compression"] else "uncompressed"
+            ),
+            passphrase=new_passphrase
+        )
+
+    def try_decrypt(self, encrypted_wif: str, passphrase: str, network: Optional[str] = None) -> Optional[str]:
+        """
+        Decrypts an encrypted WIF (Wallet Import Format), returning None instead of raising for a wrong passphrase.
+
+        Meant for loops testing many keys or passphrases: no exception is raised or caught per wrong
+        passphrase, it returns as soon as the address hash does not match, and the private key is returned
+        as it is, without WIF encoding or detailed info. Malformed encrypted WIFs and networks still raise.
+
+        :param encrypted_wif: The encrypted WIF.
+        :type encrypted_wif: str
+        :param passphrase: The passphrase or password.
+        :type passphrase: str
+        :param network: Optional network of the key. Defaults to the class's network if not provided.
+        :type network: Optional[str]
+
+        :returns: The private key, or None when the passphrase is wrong.
+        :rtype: Optional[str]
+
+        >>> from bip38 import BIP38
+        >>> from bip38.cryptocurrencies import Bitcoin
+        >>> bip38: BIP38 = BIP38(cryptocurrency=Bitcoin, network="mainnet")
+        >>> bip38.try_decrypt(encrypted_wif="6PRVWUbkzzsbcVac2qwfssoUJAN1Xhrg6bNk8J7Nzm5H7kxEbn2Nh2ZoGg", passphrase="TestingOneTwoThree")
+        'cbf4b9f70470856bb4f40f80b87edb90865997ffee6df315ab166d713af433a5'
+        >>> bip38.try_decrypt(encrypted_wif="6PRVWUbkzzsbcVac2qwfssoUJAN1Xhrg6bNk8J7Nzm5H7kxEbn2Nh2ZoGg", passphrase="WrongPassphrase") is None
+        True
+        """
+
+        network: str = (
+            network if network else self.network
+        )
+        if network not in self.networks:
+            raise NetworkError("Wrong network type", expected=self.networks, got=type(network))
+        private_key: Optional[bytes] = self._verified_private_key(
+            encrypted_wif_decode=self._decode_encrypted_wif(encrypted_wif), passphrase=passphrase, network=network
+        )
+        return bytes_to_string(private_key) if private_key is not None else None
+
+    def check_passphrase(self, encrypted_wif: str, passphrase: str, network: Optional[str] = None) -> bool:
+        """
+        Checks whether a passphrase decrypts an encrypted WIF (Wallet Import Format), see :meth:`try_decrypt`.
+
+        :param encrypted_wif: The encrypted WIF.
+        :type encrypted_wif: str
+        :param passphrase: The passphrase or password.
+        :type passphrase: str
+        :param network: Optional network of the key. Defaults to the class's network if not provided.
+        :type network: Optional[str]
+
+        :returns: True when the passphrase is correct, otherwise False.
+        :rtype: bool
+
+        >>> from bip38 import BIP38
+        >>> from bip38.cryptocurrencies import Bitcoin
+        >>> bip38: BIP38 = BIP38(cryptocurrency=Bitcoin, network="mainnet")
+        >>> bip38.check_passphrase(encrypted_wif="6PfQu77ygVyJLZjfvMLyhLMQbYnu5uguoJJ4kMCLqWwPEdfpwANVS76gTX", passphrase="TestingOneTwoThree")
+        True
+        """
+
+        return self.try_decrypt(encrypted_wif=encrypted_wif, passphrase=passphrase, network=network) is not None
+
+    def _verified_private_key(self, encrypted_wif_decode: bytes, passphrase: str, network: str) -> Optional[bytes]:
+        """
+        Decrypts the private key of a decoded encrypted WIF and checks it against the address hash,
+        returning None instead of raising when the passphrase is wrong.
+        """
+
+        self._check_encrypted_wif_decode(encrypted_wif_decode)
+        try:
+            private_key, _, _ = self._decrypt_private_key(
+                encrypted_wif_decode=encrypted_wif_decode, passphrase=passphrase
+            )
+        except Error:
+            # Only a wrong passphrase gets here once the prefix and flag are checked, by deriving
+            # an out of range private key or factor
+            return None
+        if self._address_hash(
+            public_key=PrivateKey.from_bytes(private_key).public_key(),
+            public_key_type=(
+                "compressed" if bytes_to_integer(encrypted_wif_decode[2:3]) in FLAGS["compression"] else "uncompressed"
+            ),
+            network=network
+        ) != encrypted_wif_decode[3:7]:
+            return None
+        return private_key
+
+    def _decode_encrypted_wif(self, encrypted_wif: str, alphabet: Optional[str] = None) -> bytes:
+        """
+        Decodes an encrypted WIF to its 43 bytes payload and checksum, with the cryptocurrency's alphabet by default.
+        """
+
+        try:
+            encrypted_wif_decode: bytes = decode(encrypted_wif, alphabet=alphabet if alphabet else self.alphabet)
+        except ValueError:
+            raise WIFError("Invalid encrypted WIF (Wallet Import Format)")
         if len(encrypted_wif_decode) != 43:
             raise WIFError("Invalid encrypted WIF length", expected=43, got=len(encrypted_wif_decode))
+        return encrypted_wif_decode
 
+    def _decrypt_private_key(
+        self, encrypted_wif_decode: bytes, passphrase: str
+    ) -> Tuple[bytes, Optional[bytes], Optional[bytes]]:
+        """
+        Decrypts the private key of a decoded encrypted WIF, before it is checked against the address hash.
+
+        Returns the private key, the seed b (None for non-EC keys) and the lot & sequence (None when absent).
+        """
+
+        self._check_encrypted_wif_decode(encrypted_wif_decode)
         prefix: bytes = encrypted_wif_decode[:2]
         flag: bytes = encrypted_wif_decode[2:3]
         address_hash: bytes = encrypted_wif_decode[3:7]
 
         if prefix == integer_to_bytes(NO_EC_MULTIPLIED_PRIVATE_KEY_PREFIX):
 
-            if flag == integer_to_bytes(NO_EC_MULTIPLIED_WIF_FLAG):
-                wif_type: Literal["wif", "wif-compressed"] = "wif"
-                public_key_type: str = "uncompressed"
-            elif flag == integer_to_bytes(NO_EC_MULTIPLIED_WIF_COMPRESSED_FLAG):
-                wif_type: Literal["wif", "wif-compressed"] = "wif-compressed"
-                public_key_type: str = "compressed"
-            else:
-                raise Error(
-                    "Invalid flag", expected=[
-                        bytes_to_string(integer_to_bytes(NO_EC_MULTIPLIED_WIF_FLAG)),
-                        bytes_to_string(integer_to_bytes(NO_EC_MULTIPLIED_WIF_COMPRESSED_FLAG))
-                    ], got=bytes_to_string(flag)
-                )
-
-            key: bytes = scrypt.hash(
+            key: bytes = self.scrypt_backend.hash(
                 unicodedata.normalize("NFC", passphrase), address_hash, 16384, 8, 8
             )
             derived_half_1, derived_half_2 = key[0:32], key[32:64]
             encrypted_half_1: bytes = encrypted_wif_decode[7:23]
             encrypted_half_2: bytes = encrypted_wif_decode[23:39]
 
-            aes: AESModeOfOperationECB = AESModeOfOperationECB(derived_half_2)
-            decrypted_half_2: bytes = aes.decrypt(encrypted_half_2)
-            decrypted_half_1: bytes = aes.decrypt(encrypted_half_1)
+            decrypted_half_1, decrypted_half_2 = self.aes_backend.decrypt_blocks(
+                derived_half_2, encrypted_half_1, encrypted_half_2
+            )
 
             private_key: bytes = integer_to_bytes(
-                bytes_to_integer(decrypted_half_1 + decrypted_half_2) ^ bytes_to_integer(derived_half_1)
+                bytes_to_integer(decrypted_half_1 + decrypted_half_2) ^ bytes_to_integer(derived_half_1), bytes_num=32
             )
             if bytes_to_integer(private_key) == 0 or bytes_to_integer(private_key) >= N:
                 raise Error("Invalid Non-EC encrypted WIF (Wallet Import Format)")
+            return private_key, None, None
 
-            public_key: PublicKey = PrivateKey.from_bytes(private_key).public_key()
-            address: str = P2PKHAddress.encode(
-                public_key=public_key,
-                address_prefix=self.cryptocurrency.NETWORKS[network]["address_prefix"],
-                public_key_type=public_key_type
-            )
-            if get_checksum(get_bytes(address, unhexlify=False)) != address_hash:
-                raise PassphraseError("Incorrect passphrase")
-
-            wif: str = private_key_to_wif(
-                private_key=private_key, wif_type=wif_type, cryptocurrency=self.cryptocurrency, network=network
-            )
-            if detail:
-                return dict(
-                    wif=wif,
-                    private_key=bytes_to_string(private_key),
-                    wif_type=wif_type,
-                    public_key=bytes_to_string(public_key.raw(public_key_type=public_key_type)),
-                    public_key_type=public_key_type,
-                    seed=None,
-                    address=address,
-                    lot=None,
-                    sequence=None
-                )
-            return wif
-
-        elif prefix == integer_to_bytes(EC_MULTIPLIED_PRIVATE_KEY_PREFIX):
+        else:
             owner_entropy: bytes = encrypted_wif_decode[7:15]
             encrypted_half_1_half_1: bytes = encrypted_wif_decode[15:23]
             encrypted_half_2: bytes = encrypted_wif_decode[23:-4]
 
             lot_and_sequence: Optional[bytes] = None
             if bytes_to_integer(flag) in FLAGS["lot_and_sequence"]:
-                owner_salt: bytes = owner_entropy[:4]
                 lot_and_sequence = owner_entropy[4:]
-            else:
-                owner_salt: bytes = owner_entropy
 
-            pass_factor: bytes = scrypt.hash(unicodedata.normalize("NFC", passphrase), owner_salt, 16384, 8, 8, 32)
-            if lot_and_sequence:
-                pass_factor: bytes = double_sha256(pass_factor + owner_entropy)
-            if bytes_to_integer(pass_factor) == 0 or bytes_to_integer(pass_factor) >= N:
-                raise Error("Invalid EC encrypted WIF (Wallet Import Format)")
-
-            pre_public_key: PublicKey = PrivateKey.from_bytes(pass_factor).public_key()
+            pass_factor, pass_point = self._pass_factor(
+                passphrase=passphrase, owner_entropy=owner_entropy, lot_and_sequence=lot_and_sequence is not None
+            )
             salt = address_hash + owner_entropy
-            encrypted_seed_b: bytes = scrypt.hash(pre_public_key.raw_compressed(), salt, 1024, 1, 1, 64)
+            encrypted_seed_b: bytes = self.scrypt_backend.hash(pass_point, salt, 1024, 1, 1, 64)
             key: bytes = encrypted_seed_b[32:]
 
-            aes: AESModeOfOperationECB = AESModeOfOperationECB(key)
+            aes: Any = self.aes_backend.new(key)
             encrypted_half_1_half_2_seed_b_last_3 = integer_to_bytes(
-                bytes_to_integer(aes.decrypt(encrypted_half_2)) ^ bytes_to_integer(encrypted_seed_b[16:32])
+                bytes_to_integer(aes.decrypt(encrypted_half_2)) ^ bytes_to_integer(encrypted_seed_b[16:32]), bytes_num=16
             )
             encrypted_half_1_half_2: bytes = encrypted_half_1_half_2_seed_b_last_3[:8]
             encrypted_half_1: bytes = (
@@ -605,55 +1425,468 @@ class BIP38:
             )
 
             seed_b: bytes = integer_to_bytes(
-                bytes_to_integer(aes.decrypt(encrypted_half_1)) ^ bytes_to_integer(encrypted_seed_b[:16])
+                bytes_to_integer(aes.decrypt(encrypted_half_1)) ^ bytes_to_integer(encrypted_seed_b[:16]), bytes_num=16
             ) + encrypted_half_1_half_2_seed_b_last_3[8:]
+            private_key: bytes = self._ec_private_key(pass_factor=pass_factor, seed_b=seed_b)
+            return private_key, seed_b, lot_and_sequence
 
-            factor_b: bytes = double_sha256(seed_b)
-            if bytes_to_integer(factor_b) == 0 or bytes_to_integer(factor_b) >= N:
-                raise Error("Invalid EC encrypted WIF (Wallet Import Format)")
+    @staticmethod
+    def _check_encrypted_wif_decode(encrypted_wif_decode: bytes) -> None:
+        """
+        Checks the prefix and the non-EC flag of a decoded encrypted WIF, before any key derivation.
+        """
 
-            # multiply private key
-            private_key: bytes = integer_to_bytes(
-                (bytes_to_integer(pass_factor) * bytes_to_integer(factor_b)) % N
-            )
-            public_key: PublicKey = PrivateKey.from_bytes(private_key).public_key()
-            wif_type: Literal["wif", "wif-compressed"] = "wif"
-            public_key_type: str = "uncompressed"
-            if bytes_to_integer(flag) in FLAGS["compression"]:
-                public_key_type = "compressed"
-                wif_type = "wif-compressed"
-            address: str = P2PKHAddress.encode(
-                public_key=public_key,
-                address_prefix=self.cryptocurrency.NETWORKS[network]["address_prefix"],
-                public_key_type=public_key_type
-            )
-            if get_checksum(get_bytes(address, unhexlify=False)) == address_hash:
-                wif: str = private_key_to_wif(
-                    private_key=private_key, wif_type=wif_type, cryptocurrency=self.cryptocurrency, network=network
+        prefix: bytes = encrypted_wif_decode[:2]
+        flag: bytes = encrypted_wif_decode[2:3]
+        if prefix == integer_to_bytes(NO_EC_MULTIPLIED_PRIVATE_KEY_PREFIX):
+            if flag not in (
+                integer_to_bytes(NO_EC_MULTIPLIED_WIF_FLAG), integer_to_bytes(NO_EC_MULTIPLIED_WIF_COMPRESSED_FLAG)
+            ):
+                raise Error(
+                    "Invalid flag", expected=[
+                        bytes_to_string(integer_to_bytes(NO_EC_MULTIPLIED_WIF_FLAG)),
+                        bytes_to_string(integer_to_bytes(NO_EC_MULTIPLIED_WIF_COMPRESSED_FLAG))
+                    ], got=bytes_to_string(flag)
                 )
-                lot: Optional[int] = None
-                sequence: Optional[int] = None
-                if detail:
-                    if lot_and_sequence:
-                        sequence: int = bytes_to_integer(lot_and_sequence) % 4096
-                        lot: int = (bytes_to_integer(lot_and_sequence) - sequence) // 4096
-                    return dict(
-                        wif=wif,
-                        private_key=bytes_to_string(private_key),
-                        wif_type=wif_type,
-                        public_key=bytes_to_string(public_key.raw(public_key_type=public_key_type)),
-                        public_key_type=public_key_type,
-                        seed=bytes_to_string(seed_b),
-                        address=address,
-                        lot=lot,
-                        sequence=sequence
-                    )
-                return wif
-            raise PassphraseError("Incorrect passphrase")
-        else:
+        elif prefix != integer_to_bytes(EC_MULTIPLIED_PRIVATE_KEY_PREFIX):
             raise Error(
                 "Invalid prefix", expected=[
                     bytes_to_string(integer_to_bytes(NO_EC_MULTIPLIED_PRIVATE_KEY_PREFIX)),
                     bytes_to_string(integer_to_bytes(EC_MULTIPLIED_PRIVATE_KEY_PREFIX))
                 ], got=bytes_to_string(prefix)
             )
+
+    def decrypt_ec_many(
+        self, encrypted_wifs: Iterable[str], passphrase: str, network: Optional[str] = None, detail: bool = False
+    ) -> List[Union[str, dict, Error]]:
+        """
+        Decrypts many EC-multiplied encrypted WIF (Wallet Import Format) keys sharing one passphrase.
+
+        Scrypt pre-factors are derived once per owner salt, so a whole lot minted from one intermediate
+        code only runs the 16384-round scrypt once, and the 1024-round scrypt runs and AES rounds
+        of all keys go through the batch APIs of the scrypt and AES backends. Per-item failures
+        are returned in place of the result instead of aborting the whole batch.
+
+        :param encrypted_wifs: The EC-multiplied encrypted WIFs.
+        :type encrypted_wifs: Iterable[str]
+        :param passphrase: The passphrase or password.
+        :type passphrase: str
+        :param network: Optional network for decryption. Defaults to the class's network if not provided.
+        :type network: Optional[str]
+        :param detail: Whether to return detailed info (default: False).
+        :type detail: bool
+
+        :returns: The decrypted WIFs, detailed private key infos or errors, in the same order as the encrypted WIFs.
+        :rtype: List[Union[str, dict, Error]]
+
+        >>> from bip38 import BIP38
+        >>> from bip38.cryptocurrencies import Bitcoin
+        >>> bip38: BIP38 = BIP38(cryptocurrency=Bitcoin, network="mainnet")
+        >>> bip38.decrypt_ec_many(encrypted_wifs=["6PfLGnQs6VZnrNpmVKfjotbnQuaJK4KZoPFrAjx1JMJUa1Ft8gnf5WxfKd", "6PRVWUbkzzsbcVac2qwfssoUJAN1Xhrg6bNk8J7Nzm5H7kxEbn2Nh2ZoGg"], passphrase="Satoshi")
+        ['5KJ51SgxWaAYR13zd9ReMhJpwrcX47xTJh2D3fGPG9CM8vkv5sH', WIFError('Invalid EC encrypted WIF prefix')]
+        """
+
+        network: str = (
+            network if network else self.network
+        )
+        if network not in self.networks:
+            raise NetworkError("Wrong network type", expected=self.networks, got=type(network))
+
+        results: List[Union[str, dict, Error]] = []
+        pending: List[Tuple[int, bytes, bytes, bytes, Optional[bytes], bytes]] = []
+        # Without a cache of the instance, a batch still runs the 16384-round scrypt once per owner salt
+        pass_factor_cache: PassFactorCache = (
+            self.pass_factor_cache if self.pass_factor_cache is not None else PassFactorCache()
+        )
+        for index, encrypted_wif in enumerate(encrypted_wifs):
+            results.append(None)
+            try:
+                encrypted_wif_decode: bytes = decode(encrypted_wif, alphabet=self.alphabet)
+                if len(encrypted_wif_decode) != 43:
+                    raise WIFError("Invalid encrypted WIF length", expected=43, got=len(encrypted_wif_decode))
+                if encrypted_wif_decode[:2] != integer_to_bytes(EC_MULTIPLIED_PRIVATE_KEY_PREFIX):
+                    raise WIFError("Invalid EC encrypted WIF prefix")
+                flag: bytes = encrypted_wif_decode[2:3]
+                owner_entropy: bytes = encrypted_wif_decode[7:15]
+                lot_and_sequence: Optional[bytes] = None
+                if bytes_to_integer(flag) in FLAGS["lot_and_sequence"]:
+                    lot_and_sequence = owner_entropy[4:]
+                pass_factor, pass_point = self._pass_factor(
+                    passphrase=passphrase,
+                    owner_entropy=owner_entropy,
+                    lot_and_sequence=lot_and_sequence is not None,
+                    pass_factor_cache=pass_factor_cache
+                )
+            except (Error, ValueError) as error:
+                results[index] = error if isinstance(error, Error) else WIFError("Invalid encrypted WIF")
+                continue
+            pending.append((index, encrypted_wif_decode, pass_factor, pass_point, lot_and_sequence, flag))
+
+        encrypted_seeds_b: List[bytes] = scrypt_many(
+            [item[3] for item in pending], [item[1][3:7] + item[1][7:15] for item in pending], 1024, 1, 1, 64,
+            backend=self.scrypt_backend
+        )
+        keys: List[bytes] = [encrypted_seed_b[32:] for encrypted_seed_b in encrypted_seeds_b]
+        encrypted_halves_1_half_2_seed_b_last_3: List[bytes] = [
+            integer_to_bytes(
+                bytes_to_integer(decrypted_half_2) ^ bytes_to_integer(encrypted_seed_b[16:32]), bytes_num=16
+            ) for decrypted_half_2, encrypted_seed_b in zip(
+                decrypt_many(keys, [item[1][23:39] for item in pending], backend=self.aes_backend), encrypted_seeds_b
+            )
+        ]
+        decrypted_halves_1: List[bytes] = decrypt_many(keys, [
+            item[1][15:23] + encrypted_half_1_half_2_seed_b_last_3[:8]
+            for item, encrypted_half_1_half_2_seed_b_last_3 in zip(pending, encrypted_halves_1_half_2_seed_b_last_3)
+        ], backend=self.aes_backend)
+
+        derived: List[Tuple[int, bytes, Optional[bytes], bytes, bytes, bytes]] = []
+        for (index, encrypted_wif_decode, pass_factor, _, lot_and_sequence, flag), encrypted_seed_b, \
+                encrypted_half_1_half_2_seed_b_last_3, decrypted_half_1 in zip(
+                    pending, encrypted_seeds_b, encrypted_halves_1_half_2_seed_b_last_3, decrypted_halves_1
+                ):
+            seed_b: bytes = integer_to_bytes(
+                bytes_to_integer(decrypted_half_1) ^ bytes_to_integer(encrypted_seed_b[:16]), bytes_num=16
+            ) + encrypted_half_1_half_2_seed_b_last_3[8:]
+            try:
+                private_key: bytes = self._ec_private_key(pass_factor=pass_factor, seed_b=seed_b)
+            except Error as error:
+                results[index] = error
+                continue
+            derived.append((index, flag, lot_and_sequence, encrypted_wif_decode[3:7], seed_b, private_key))
+
+        public_keys: List[PublicKey] = PrivateKey.public_keys_many([item[-1] for item in derived])
+        for (index, flag, lot_and_sequence, address_hash, seed_b, private_key), public_key in zip(derived, public_keys):
+            try:
+                results[index] = self._decrypted(
+                    flag=flag,
+                    address_hash=address_hash,
+                    lot_and_sequence=lot_and_sequence,
+                    private_key=private_key,
+                    public_key=public_key,
+                    seed_b=seed_b,
+                    network=network,
+                    detail=detail
+                )
+            except Error as error:
+                results[index] = error
+        return results
+
+    @staticmethod
+    def _ec_private_key(pass_factor: bytes, seed_b: bytes) -> bytes:
+        """
+        Derives the EC-multiplied private key from its pass factor and seed b.
+        """
+
+        factor_b: bytes = double_sha256(seed_b)
+        if bytes_to_integer(factor_b) == 0 or bytes_to_integer(factor_b) >= N:
+            raise Error("Invalid EC encrypted WIF (Wallet Import Format)")
+
+        # multiply private key
+        return integer_to_bytes(
+            (bytes_to_integer(pass_factor) * bytes_to_integer(factor_b)) % N, bytes_num=32
+        )
+
+    def _decrypted(
+        self,
+        flag: bytes,
+        address_hash: bytes,
+        lot_and_sequence: Optional[bytes],
+        private_key: bytes,
+        public_key: PublicKey,
+        seed_b: Optional[bytes],
+        network: str,
+        detail: bool,
+        cryptocurrency: Optional[Type[ICryptocurrency]] = None
+    ) -> Union[str, dict]:
+        """
+        Checks a decrypted private key and its public key against the address hash, with the
+        cryptocurrency's address and WIF prefixes (default: the instance's cryptocurrency).
+        """
+
+        cryptocurrency = cryptocurrency if cryptocurrency else self.cryptocurrency
+
+        wif_type: Literal["wif", "wif-compressed"] = "wif"
+        public_key_type: str = "uncompressed"
+        if bytes_to_integer(flag) in FLAGS["compression"]:
+            public_key_type = "compressed"
+            wif_type = "wif-compressed"
+        address: str = P2PKHAddress.encode(
+            public_key=public_key,
+            address_prefix=cryptocurrency.NETWORKS[network]["address_prefix"],
+            public_key_type=public_key_type,
+            alphabet=cryptocurrency.ALPHABET if cryptocurrency.ALPHABET else Bitcoin.ALPHABET
+        )
+        if get_checksum(get_bytes(address, unhexlify=False)) == address_hash:
+            wif: str = private_key_to_wif(
+                private_key=private_key, wif_type=wif_type, cryptocurrency=cryptocurrency, network=network
+            )
+            lot: Optional[int] = None
+            sequence: Optional[int] = None
+            if detail:
+                if lot_and_sequence:
+                    sequence: int = bytes_to_integer(lot_and_sequence) % 4096
+                    lot: int = (bytes_to_integer(lot_and_sequence) - sequence) // 4096
+                return dict(
+                    wif=wif,
+                    private_key=bytes_to_string(private_key),
+                    wif_type=wif_type,
+                    public_key=bytes_to_string(public_key.raw(public_key_type=public_key_type)),
+                    public_key_type=public_key_type,
+                    seed=bytes_to_string(seed_b) if seed_b is not None else None,
+                    address=address,
+                    lot=lot,
+                    sequence=sequence
+                )
+            return wif
+        raise PassphraseError("Incorrect passphrase")
+
+    def validate_encrypted_wifs(self, encrypted_wifs: Iterable[str]) -> List[bool]:
+        """
+        Checks many encrypted WIF (Wallet Import Format) strings without decrypting them.
+
+        An encrypted WIF is valid when it is base58check encoded with the cryptocurrency's alphabet
+        and a 39 bytes payload, and carries a non-EC or EC-multiplied prefix with one of its flags.
+        Checksums of large batches are validated in bulk (see :func:`bip38.libs.base58.check_decode_many`).
+
+        :param encrypted_wifs: The encrypted WIFs.
+        :type encrypted_wifs: Iterable[str]
+
+        :returns: Whether each encrypted WIF is valid, in the same order.
+        :rtype: List[bool]
+
+        >>> from bip38 import BIP38
+        >>> from bip38.cryptocurrencies import Bitcoin
+        >>> bip38: BIP38 = BIP38(cryptocurrency=Bitcoin, network="mainnet")
+        >>> bip38.validate_encrypted_wifs(encrypted_wifs=["6PRVWUbkzzsbcVac2qwfssoUJAN1Xhrg6bNk8J7Nzm5H7kxEbn2Nh2ZoGg", "6PRVWUbkzzsbcVac2qwfssoUJAN1Xhrg6bNk8J7Nzm5H7kxEbn2Nh2ZoGh"])
+        [True, False]
+        """
+
+        flags: Dict[bytes, List[int]] = {
+            integer_to_bytes(NO_EC_MULTIPLIED_PRIVATE_KEY_PREFIX): FLAGS["non_ec"],
+            integer_to_bytes(EC_MULTIPLIED_PRIVATE_KEY_PREFIX): FLAGS["ec"]
+        }
+        return [
+            raw is not None and raw[2] in flags.get(raw[:2], []) for raw in check_decode_many(
+                list(encrypted_wifs), width=39, strict=False, alphabet=self.alphabet
+            )
+        ]
+
+    def encrypt_many(
+        self, pairs: Iterable[Tuple[str, str]], network: Optional[str] = None, workers: Optional[int] = None
+    ) -> List[Union[str, Error]]:
+        """
+        Encrypts many Wallet Import Format (WIF) keys across a process pool.
+
+        Identical (WIF, passphrase) pairs are encrypted only once, and per-item failures
+        are returned in place of the encrypted WIF instead of aborting the whole batch.
+
+        :param pairs: The (WIF, passphrase) pairs to be encrypted.
+        :type pairs: Iterable[Tuple[str, str]]
+        :param network: Optional network for encryption. Defaults to the class's network if not provided.
+        :type network: Optional[str]
+        :param workers: Optional number of worker processes (default: CPU count).
+        :type workers: Optional[int]
+
+        :returns: Encrypted WIF keys or errors, in the same order as the pairs.
+        :rtype: List[Union[str, Error]]
+
+        >>> from bip38 import BIP38
+        >>> from bip38.cryptocurrencies import Bitcoin
+        >>> bip38: BIP38 = BIP38(cryptocurrency=Bitcoin, network="mainnet")
+        >>> bip38.encrypt_many(pairs=[("5KN7MzqK5wt2TP1fQCYyHBtDrXdJuXbUzm4A9rKAteGu3Qi5CVR", "TestingOneTwoThree"), ("L44B5gGEpqEDRS9vVPz7QT35jcBG2r3CZwSwQ4fCewXAhAhqGVpP", "TestingOneTwoThree")], workers=2)
+        ['6PRVWUbkzzsbcVac2qwfssoUJAN1Xhrg6bNk8J7Nzm5H7kxEbn2Nh2ZoGg', '6PYNKZ1EAgYgmQfmNVamxyXVWHzK5s6DGhwP4J5o44cvXdoY7sRzhtpUeo']
+        """
+
+        network: str = (
+            network if network else self.network
+        )
+        if network not in self.networks:
+            raise NetworkError("Wrong network type", expected=self.networks, got=type(network))
+        return _map_unique(
+            self, partial(_encrypt, network=network), pairs, workers
+        )
+
+    def decrypt_many(
+        self,
+        items: Iterable[Tuple[str, str]],
+        network: Optional[str] = None,
+        detail: bool = False,
+        workers: Optional[int] = None
+    ) -> List[Union[str, dict, Error]]:
+        """
+        Decrypts many encrypted WIF (Wallet Import Format) keys across a process pool.
+
+        Identical (encrypted WIF, passphrase) items are decrypted only once, and per-item failures
+        (e.g. :class:`bip38.exceptions.PassphraseError`) are returned in place of the result instead
+        of aborting the whole batch.
+
+        :param items: The (encrypted WIF, passphrase) items to be decrypted.
+        :type items: Iterable[Tuple[str, str]]
+        :param network: Optional network for decryption. Defaults to the class's network if not provided.
+        :type network: Optional[str]
+        :param detail: Whether to return detailed info (default: False).
+        :type detail: bool
+        :param workers: Optional number of worker processes (default: CPU count).
+        :type workers: Optional[int]
+
+        :returns: The decrypted WIFs, detailed private key infos or errors, in the same order as the items.
+        :rtype: List[Union[str, dict, Error]]
+
+        >>> from bip38 import BIP38
+        >>> from bip38.cryptocurrencies import Bitcoin
+        >>> bip38: BIP38 = BIP38(cryptocurrency=Bitcoin, network="mainnet")
+        >>> bip38.decrypt_many(items=[("6PRVWUbkzzsbcVac2qwfssoUJAN1Xhrg6bNk8J7Nzm5H7kxEbn2Nh2ZoGg", "TestingOneTwoThree"), ("6PRVWUbkzzsbcVac2qwfssoUJAN1Xhrg6bNk8J7Nzm5H7kxEbn2Nh2ZoGg", "WrongPassphrase")], workers=2)
+        ['5KN7MzqK5wt2TP1fQCYyHBtDrXdJuXbUzm4A9rKAteGu3Qi5CVR', PassphraseError('Incorrect passphrase')]
+        """
+
+        network: str = (
+            network if network else self.network
+        )
+        if network not in self.networks:
+            raise NetworkError("Wrong network type", expected=self.networks, got=type(network))
+        return _map_unique(
+            self, partial(_decrypt, network=network, detail=detail), items, workers
+        )
+
+    def reencrypt_many(
+        self,
+        items: Iterable[Tuple[str, str, str]],
+        network: Optional[str] = None,
+        workers: Optional[int] = None,
+        chunk_size: int = 256
+    ) -> Iterator[Union[str, Error]]:
+        """
+        Re-encrypts a stream of encrypted WIF (Wallet Import Format) keys across a process pool.
+
+        Items are read lazily, ``chunk_size`` at a time, so keystores of any size are rotated in bounded
+        memory, and per-item failures (e.g. :class:`bip38.exceptions.PassphraseError`) are yielded in
+        place of the encrypted WIF instead of aborting the whole stream (see :meth:`reencrypt`).
+
+        :param items: The (encrypted WIF, old passphrase, new passphrase) items to be re-encrypted.
+        :type items: Iterable[Tuple[str, str, str]]
+        :param network: Optional network of the keys. Defaults to the class's network if not provided.
+        :type network: Optional[str]
+        :param workers: Optional number of worker processes (default: CPU count).
+        :type workers: Optional[int]
+        :param chunk_size: The number of items read and dispatched at a time (default: 256).
+        :type chunk_size: int
+
+        :returns: The re-encrypted WIFs or errors, in the same order as the items.
+        :rtype: Iterator[Union[str, Error]]
+
+        >>> from bip38 import BIP38
+        >>> from bip38.cryptocurrencies import Bitcoin
+        >>> bip38: BIP38 = BIP38(cryptocurrency=Bitcoin, network="mainnet")
+        >>> list(bip38.reencrypt_many(items=[("6PRVWUbkzzsbcVac2qwfssoUJAN1Xhrg6bNk8J7Nzm5H7kxEbn2Nh2ZoGg", "TestingOneTwoThree", "Satoshi"), ("6PRVWUbkzzsbcVac2qwfssoUJAN1Xhrg6bNk8J7Nzm5H7kxEbn2Nh2ZoGg", "WrongPassphrase", "Satoshi")], workers=2))
+        ['6PRVWUbkyejHFBoq4Kd7MRnXDct1FHDExikmK3K81L7gd4vu8t5diA4ACW', PassphraseError('Incorrect passphrase')]
+        """
+
+        network: str = (
+            network if network else self.network
+        )
+        if network not in self.networks:
+            raise NetworkError("Wrong network type", expected=self.networks, got=type(network))
+        if chunk_size < 1:
+            raise Error("Invalid chunk size", expected="chunk_size >= 1", got=chunk_size)
+        function: Callable[[BIP38, str, str, str], Union[str, Error]] = partial(_reencrypt, network=network)
+        items: Iterator[Tuple[str, str, str]] = iter(items)
+        workers: int = workers or os.cpu_count() or 1
+        initializer, initargs = self.worker_initializer()
+        executor: Optional[ProcessPoolExecutor] = ProcessPoolExecutor(
+            max_workers=workers, initializer=initializer, initargs=initargs
+        ) if workers > 1 else None
+        try:
+            while True:
+                chunk: List[Tuple[str, str, str]] = list(islice(items, chunk_size))
+                if not chunk:
+                    break
+                if executor is None:
+                    yield from (function(self, *item) for item in chunk)
+                else:
+                    yield from executor.map(
+                        partial(BIP38.in_worker, function), *zip(*chunk), chunksize=max(1, len(chunk) // (workers * 4))
+                    )
+        finally:
+            if executor is not None:
+                executor.shutdown()
+
+
+def backends() -> Dict[str, Dict[str, Any]]:
+    """
+    Reports the cryptographic backends selected on this host.
+
+    :returns: For each primitive, the selected backend, the usable backends and their calibration timings.
+    :rtype: Dict[str, Dict[str, Any]]
+
+    >>> import bip38
+    >>> from bip38.kdf import SCRYPT_BACKENDS
+    >>> bip38.backends()["scrypt"]["selected"] in SCRYPT_BACKENDS
+    True
+    """
+
+    return dict(
+        scrypt=dict(calibrate()),
+        aes=dict(select()),
+        ripemd160=ripemd160_backend()
+    )
+
+
+# BIP38 instance of each worker process, see _initialize
+_bip38: Optional[BIP38] = None
+
+
+def _initialize(settings: Dict[str, Any]) -> None:
+    global _bip38
+    _bip38 = BIP38._from_worker_settings(settings)
+
+
+def _encrypt(bip38: BIP38, wif: str, passphrase: str, network: str) -> Union[str, Error]:
+    try:
+        return bip38.encrypt(wif=wif, passphrase=passphrase, network=network)
+    except Error as error:
+        return error
+
+
+def _decrypt(
+    bip38: BIP38, encrypted_wif: str, passphrase: str, network: str, detail: bool
+) -> Union[str, dict, Error]:
+    try:
+        return bip38.decrypt(encrypted_wif=encrypted_wif, passphrase=passphrase, network=network, detail=detail)
+    except Error as error:
+        return error
+
+
+def _reencrypt(
+    bip38: BIP38, encrypted_wif: str, old_passphrase: str, new_passphrase: str, network: str
+) -> Union[str, Error]:
+    try:
+        return bip38.reencrypt(
+            encrypted_wif=encrypted_wif, old_passphrase=old_passphrase, new_passphrase=new_passphrase, network=network
+        )
+    except Error as error:
+        return error
+
+
+def _map_unique(
+    bip38: BIP38, function: Callable[[BIP38, str, str], Any], items: Iterable[Tuple[str, str]], workers: Optional[int] = None
+) -> List[Any]:
+    # Passphrases are NFC normalized before scrypt, so equal normalized pairs give equal results
+    keys: List[Tuple[str, str]] = [
+        (key, unicodedata.normalize("NFC", passphrase)) for key, passphrase in items
+    ]
+    unique: List[Tuple[str, str]] = list(dict.fromkeys(keys))
+    workers: int = min(workers or os.cpu_count() or 1, len(unique) or 1)
+
+    if workers == 1:
+        results: List[Any] = [function(bip38, *item) for item in unique]
+    else:
+        initializer, initargs = bip38.worker_initializer()
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=initializer, initargs=initargs
+        ) as executor:
+            results: List[Any] = list(executor.map(
+                partial(BIP38.in_worker, function), *zip(*unique), chunksize=max(1, len(unique) // (workers * 4))
+            ))
+
+    mapping: dict = dict(zip(unique, results))
+    return [mapping[key] for key in keys]
@@ -0,0 +1,290 @@
+#!/usr/bin/env python3
+
+# Copyright © 2023-2024, Meheret Tesfaye Batu <meherett.batu@gmail.com>
+# Distributed under the MIT software license, see the accompanying
+# file COPYING or https://opensource.org/license/mit
+
+from typing import (
+    Optional, Sequence, List, Tuple
+)
+from collections import OrderedDict
+
+import hashlib
+import threading
+import unicodedata
+
+from .exceptions import Error
+from .secp256k1 import ecmult
+
+
+class PassFactorCache:
+    """
+    A bounded LRU cache of EC-multiply pre-factors, the 16384-round scrypt of a passphrase and owner salt.
+
+    The pre-factor only depends on the passphrase and the owner salt, so every key minted from one
+    intermediate code shares it, and so does every sequence of a lot: their pass factors are then
+    derived with a double SHA-256 of the pre-factor and owner entropy. Next to the pre-factors, the
+    derived pass factor and compressed pass point of each full owner entropy are kept, so decrypting
+    or confirming the same key again also skips the EC multiplication. Entries are keyed by a SHA-256
+    digest of the NFC normalized passphrase and owner salt or entropy.
+
+    The cache keeps its secrets in its own buffers and zeroes them when evicted or cleared, lookups
+    hand out copies which are not wiped by the cache, so callers should drop them once used.
+
+    :param maxsize: The maximum number of cached entries (default: 128).
+    :type maxsize: int
+
+    >>> from bip38 import BIP38
+    >>> from bip38.cache import PassFactorCache
+    >>> from bip38.cryptocurrencies import Bitcoin
+    >>> bip38: BIP38 = BIP38(cryptocurrency=Bitcoin, network="mainnet", pass_factor_cache=PassFactorCache(maxsize=16))
+    """
+
+    maxsize: int
+    hits: int
+    misses: int
+    derived_hits: int
+    derived_misses: int
+
+    def __init__(self, maxsize: int = 128) -> None:
+
+        if maxsize < 1:
+            raise Error("Invalid cache size", expected="maxsize >= 1", got=maxsize)
+        self.maxsize, self.hits, self.misses = maxsize, 0, 0
+        self.derived_hits, self.derived_misses = 0, 0
+        self._entries: "OrderedDict[bytes, bytearray]" = OrderedDict()
+        self._derived: "OrderedDict[bytes, Tuple[bytearray, bytes]]" = OrderedDict()
+        self._lock: threading.Lock = threading.Lock()
+
+    @staticmethod
+    def key(passphrase: str, owner_salt: bytes) -> bytes:
+        """
+        Computes the cache key of a passphrase and owner salt.
+
+        :param passphrase: The passphrase or password.
+        :type passphrase: str
+        :param owner_salt: The owner salt, 4 bytes with lot & sequence, otherwise 8 bytes,
+            or the 8 bytes owner entropy for :meth:`get_derived`.
+        :type owner_salt: bytes
+
+        :returns: The SHA-256 digest used as cache key.
+        :rtype: bytes
+        """
+
+        return hashlib.sha256(
+            bytes([len(owner_salt)]) + owner_salt + unicodedata.normalize("NFC", passphrase).encode("utf-8")
+        ).digest()
+
+    def get(self, key: bytes) -> Optional[bytes]:
+        """
+        Looks up a cached pre-factor.
+
+        :param key: The cache key.
+        :type key: bytes
+
+        :returns: A copy of the 32 bytes pre-factor, or None when not cached.
+        :rtype: Optional[bytes]
+        """
+
+        with self._lock:
+            entry: Optional[bytearray] = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return bytes(entry)
+
+    def put(self, key: bytes, pre_factor: bytes) -> None:
+        """
+        Stores a pre-factor, evicting the least recently used entries.
+
+        :param key: The cache key.
+        :type key: bytes
+        :param pre_factor: The 32 bytes pre-factor.
+        :type pre_factor: bytes
+
+        :returns: None
+        """
+
+        with self._lock:
+            if key in self._entries:
+                self._wipe(self._entries.pop(key))
+            self._entries[key] = bytearray(pre_factor)
+            while len(self._entries) > self.maxsize:
+                self._wipe(self._entries.popitem(last=False)[1])
+
+    def get_derived(self, key: bytes) -> Optional[Tuple[bytes, bytes]]:
+        """
+        Looks up a cached pass factor and pass point.
+
+        :param key: The cache key of the passphrase and full owner entropy.
+        :type key: bytes
+
+        :returns: A copy of the 32 bytes pass factor and the 33 bytes compressed pass point, or None when not cached.
+        :rtype: Optional[Tuple[bytes, bytes]]
+        """
+
+        with self._lock:
+            entry: Optional[Tuple[bytearray, bytes]] = self._derived.get(key)
+            if entry is None:
+                self.derived_misses += 1
+                return None
+            self._derived.move_to_end(key)
+            self.derived_hits += 1
+            return bytes(entry[0]), entry[1]
+
+    def put_derived(self, key: bytes, pass_factor: bytes, pass_point: bytes) -> None:
+        """
+        Stores a pass factor and pass point, evicting the least recently used entries.
+
+        :param key: The cache key of the passphrase and full owner entropy.
+        :type key: bytes
+        :param pass_factor: The 32 bytes pass factor.
+        :type pass_factor: bytes
+        :param pass_point: The 33 bytes compressed pass point.
+        :type pass_point: bytes
+
+        :returns: None
+        """
+
+        with self._lock:
+            if key in self._derived:
+                self._wipe(self._derived.pop(key)[0])
+            self._derived[key] = (bytearray(pass_factor), bytes(pass_point))
+            while len(self._derived) > self.maxsize:
+                self._wipe(self._derived.popitem(last=False)[1][0])
+
+    def clear(self) -> None:
+        """
+        Wipes and removes every cached entry.
+
+        :returns: None
+        """
+
+        with self._lock:
+            while self._entries:
+                self._wipe(self._entries.popitem()[1])
+            while self._derived:
+                self._wipe(self._derived.popitem()[1][0])
+
+    @staticmethod
+    def _wipe(entry: bytearray) -> None:
+        entry[:] = bytes(len(entry))
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class PointCache:
+    """
+    A bounded LRU cache of decompressed secp256k1 points, keyed by their 33 bytes compressed encoding.
+
+    Pass points and points b are public, so unlike :class:`PassFactorCache` entries are kept
+    as they are. Decompressing costs a 256-bit modular exponentiation, so encrypted WIFs minted
+    and confirmation codes checked against the same intermediate code only pay it once.
+
+    :param maxsize: The maximum number of cached points (default: 1024).
+    :type maxsize: int
+
+    >>> from bip38.cache import PointCache
+    >>> point_cache: PointCache = PointCache(maxsize=16)
+    >>> x, y = point_cache.decompress(bytes.fromhex("0279be667ef9dcbbac55a06295ce870b07029bfcdb2dce28d959f2815b16f81798"))
+    >>> x, y = point_cache.decompress(bytes.fromhex("0279be667ef9dcbbac55a06295ce870b07029bfcdb2dce28d959f2815b16f81798"))
+    >>> point_cache.hits, point_cache.misses
+    (1, 1)
+    """
+
+    maxsize: int
+    hits: int
+    misses: int
+
+    def __init__(self, maxsize: int = 1024) -> None:
+
+        if maxsize < 1:
+            raise Error("Invalid cache size", expected="maxsize >= 1", got=maxsize)
+        self.maxsize, self.hits, self.misses = maxsize, 0, 0
+        self._entries: "OrderedDict[bytes, Tuple[int, int]]" = OrderedDict()
+        self._lock: threading.Lock = threading.Lock()
+
+    def get(self, point: bytes) -> Optional[Tuple[int, int]]:
+        """
+        Looks up a decompressed point.
+
+        :param point: The 33 bytes compressed point.
+        :type point: bytes
+
+        :returns: The affine point (x, y), or None when not cached.
+        :rtype: Optional[Tuple[int, int]]
+        """
+
+        with self._lock:
+            affine: Optional[Tuple[int, int]] = self._entries.get(point)
+            if affine is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(point)
+            self.hits += 1
+            return affine
+
+    def put(self, point: bytes, affine: Tuple[int, int]) -> None:
+        """
+        Stores a decompressed point, evicting the least recently used entries.
+
+        :param point: The 33 bytes compressed point.
+        :type point: bytes
+        :param affine: The affine point (x, y).
+        :type affine: Tuple[int, int]
+
+        :returns: None
+        """
+
+        with self._lock:
+            self._entries[point] = affine
+            self._entries.move_to_end(point)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def decompress(self, point: bytes) -> Tuple[int, int]:
+        """
+        Decompresses a point through the cache, see :func:`bip38.secp256k1.ecmult.decompress`.
+
+        :param point: The 33 bytes compressed point.
+        :type point: bytes
+
+        :returns: The affine point (x, y).
+        :rtype: Tuple[int, int]
+        """
+
+        point = bytes(point)
+        affine: Optional[Tuple[int, int]] = self.get(point)
+        if affine is None:
+            affine = ecmult.decompress(point)
+            self.put(point, affine)
+        return affine
+
+    def decompress_many(self, points: Sequence[bytes]) -> List[Tuple[int, int]]:
+        """
+        Decompresses many points through the cache.
+
+        :param points: The 33 bytes compressed points.
+        :type points: Sequence[bytes]
+
+        :returns: The affine points, in the same order.
+        :rtype: List[Tuple[int, int]]
+        """
+
+        return [self.decompress(point) for point in points]
+
+    def clear(self) -> None:
+        """
+        Removes every cached point.
+
+        :returns: None
+        """
+
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -4,14 +4,88 @@
 # Distributed under the MIT software license, see the accompanying
 # file COPYING or https://opensource.org/license/mit
 
-from typing import Union
+from typing import (
+    Union, Callable, Sequence, List, Dict, Any
+)
 
 import hashlib
 
-from .libs.ripemd160 import ripemd160 as r160
+try:
+    from Crypto.Hash import RIPEMD160 as CryptoRIPEMD160
+except ImportError:  # pragma: no cover
+    CryptoRIPEMD160 = None
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+from .libs.ripemd160 import (
+    ripemd160 as r160, ML, MR, RL, RR, KL, KR
+)
 from .const import CHECKSUM_BYTE_LENGTH
 from .utils import get_bytes
 
+# RIPEMD-160 test vector used to probe every backend before it is selected
+RIPEMD160_TEST_VECTOR: Dict[str, bytes] = {
+    "message": b"abc",
+    "digest": bytes.fromhex("8eb208f7e05d987a9b044a8e98c6b087f15a0bfc")
+}
+# Smallest batch worth hashing with the NumPy kernel instead of the pure-Python fallback
+NUMPY_BATCH_THRESHOLD: int = 32
+
+
+def _hashlib_ripemd160(data: bytes) -> bytes:
+    return hashlib.new("ripemd160", data).digest()
+
+
+def _pycryptodome_ripemd160(data: bytes) -> bytes:
+    return CryptoRIPEMD160.new(data).digest()
+
+
+# RIPEMD-160 implementations in order of preference, the pure-Python one always last
+RIPEMD160_BACKENDS: Dict[str, Callable[[bytes], bytes]] = {
+    "hashlib": _hashlib_ripemd160,
+    "pycryptodome": _pycryptodome_ripemd160,
+    "python": r160
+}
+
+
+def _probe_ripemd160() -> Dict[str, Any]:
+    # OpenSSL 3 may list ripemd160 in hashlib.algorithms_available and still refuse it
+    # (legacy provider not loaded), so every backend is actually run once.
+    usable: List[str] = []
+    for name, function in RIPEMD160_BACKENDS.items():
+        if name == "pycryptodome" and CryptoRIPEMD160 is None:
+            continue
+        try:
+            if function(RIPEMD160_TEST_VECTOR["message"]) == RIPEMD160_TEST_VECTOR["digest"]:
+                usable.append(name)
+        except (ValueError, TypeError):
+            continue
+    return dict(selected=usable[0], available=usable)
+
+
+_selection: Dict[str, Any] = _probe_ripemd160()
+_ripemd160: Callable[[bytes], bytes] = RIPEMD160_BACKENDS[_selection["selected"]]
+
+
+def ripemd160_backend() -> Dict[str, Any]:
+    """
+    Reports the RIPEMD-160 backend resolved when this module was imported.
+
+    Every backend is probed once with a test vector, and the first one returning the
+    right digest is used by :func:`ripemd160` for the lifetime of the process.
+
+    :returns: The selected backend name and the usable backends.
+    :rtype: Dict[str, Any]
+
+    >>> from bip38.crypto import ripemd160_backend
+    >>> ripemd160_backend()["available"][-1]
+    'python'
+    """
+
+    return dict(_selection)
+
 
 def ripemd160(data: Union[str, bytes]) -> bytes:
     """
@@ -24,11 +98,76 @@ def ripemd160(data: Union[str, bytes]) -> bytes:
     :rtype: bytes
     """
 
-    return (
-        hashlib.new("ripemd160", get_bytes(data)).digest()
-        if "ripemd160" in hashlib.algorithms_available else
-        r160(get_bytes(data))
-    )
+    return _ripemd160(get_bytes(data))
+
+
+def _ripemd160_lanes(messages: "numpy.ndarray") -> "numpy.ndarray":
+    count, length = messages.shape
+    blocks: int = (length + 8) // 64 + 1
+    padded = numpy.zeros((count, blocks * 64), dtype=numpy.uint8)
+    padded[:, :length] = messages
+    padded[:, length] = 0x80
+    padded[:, -8:] = numpy.frombuffer((8 * length).to_bytes(8, "little"), dtype=numpy.uint8)
+    words = padded.view("<u4").astype(numpy.uint32)
+
+    # uint32 lanes wrap modulo 2 ** 32 on their own, no masking needed
+    shift = numpy.uint32
+    functions = [
+        lambda x, y, z: x ^ y ^ z,
+        lambda x, y, z: (x & y) | (~x & z),
+        lambda x, y, z: (x | ~y) ^ z,
+        lambda x, y, z: (x & z) | (y & ~z),
+        lambda x, y, z: x ^ (y | ~z)
+    ]
+    state = [numpy.full(count, h, dtype=numpy.uint32) for h in (
+        0x67452301, 0xefcdab89, 0x98badcfe, 0x10325476, 0xc3d2e1f0
+    )]
+    for block in range(blocks):
+        x = [words[:, block * 16 + i] for i in range(16)]
+        left, right = list(state), list(state)
+        for j in range(80):
+            rnd = j >> 4
+            for lanes, m, r, k, f in (
+                (left, ML, RL, KL[rnd], rnd), (right, MR, RR, KR[rnd], 4 - rnd)
+            ):
+                a, b, c, d, e = lanes
+                t = a + functions[f](b, c, d) + x[m[j]] + numpy.uint32(k)
+                t = ((t << shift(r[j])) | (t >> shift(32 - r[j]))) + e
+                lanes[:] = e, t, b, (c << shift(10)) | (c >> shift(22)), d
+        h0, h1, h2, h3, h4 = state
+        state = [
+            h1 + left[2] + right[3], h2 + left[3] + right[4], h3 + left[4] + right[0],
+            h4 + left[0] + right[1], h0 + left[1] + right[2]
+        ]
+    return numpy.stack(state, axis=1).astype("<u4").view(numpy.uint8)
+
+
+def ripemd160_many(items: Sequence[Union[str, bytes]]) -> List[bytes]:
+    """
+    Calculate the RIPEMD-160 hashes of many messages.
+
+    With the pure-Python fallback selected, batches of equal-length messages are
+    hashed together by a NumPy kernel, one vector operation per round for all of them.
+
+    :param items: The data to hash, as bytes or strings.
+    :type items: Sequence[Union[str, bytes]]
+
+    :return: The RIPEMD-160 hash digests, in the same order as the items.
+    :rtype: List[bytes]
+
+    >>> from bip38.crypto import ripemd160_many
+    >>> [digest.hex() for digest in ripemd160_many([b"", b"abc"])]
+    ['9c1185a5c5e9fc54612808977ee8f548b2258d31', '8eb208f7e05d987a9b044a8e98c6b087f15a0bfc']
+    """
+
+    items = [get_bytes(data) for data in items]
+    if _selection["selected"] != "python" or numpy is None or \
+            len(items) < NUMPY_BATCH_THRESHOLD or len(set(map(len, items))) != 1:
+        return [_ripemd160(data) for data in items]
+    digests: bytes = _ripemd160_lanes(numpy.frombuffer(
+        b"".join(items), dtype=numpy.uint8
+    ).reshape(len(items), -1)).tobytes()
+    return [digests[index:index + 20] for index in range(0, len(digests), 20)]
 
 
 def sha256(data: Union[str, bytes]) -> bytes:
@@ -88,3 +227,24 @@ def hash160(data: Union[str, bytes]) -> bytes:
     """
 
     return ripemd160(sha256(data))
+
+
+def hash160_many(items: Sequence[Union[str, bytes]]) -> List[bytes]:
+    """
+    Calculate the HASH160 hashes (RIPEMD-160 of SHA-256) of many messages.
+
+    The SHA-256 digests all have the same length, so the RIPEMD-160 half runs as one batch
+    through :func:`ripemd160_many`.
+
+    :param items: The data to hash, as bytes or strings.
+    :type items: Sequence[Union[str, bytes]]
+
+    :return: The HASH160 hash digests, in the same order as the items.
+    :rtype: List[bytes]
+
+    >>> from bip38.crypto import hash160_many
+    >>> [digest.hex() for digest in hash160_many([b""])]
+    ['b472a266d0bd89c13706a4132ccfb16f7c3b9fcb']
+    """
+
+    return ripemd160_many([sha256(data) for data in items])
@@ -5,7 +5,7 @@
 # file COPYING or https://opensource.org/license/mit
 
 from typing import (
-    Dict, Optional
+    Dict, Optional, Type
 )
 
 
@@ -1665,3 +1665,9 @@ class ZooBC(ICryptocurrency):
             "address_prefix": 0x0
         }
     }
+
+
+# Every cryptocurrency above by class name, e.g. the default candidates of BIP38.decrypt_any
+CRYPTOCURRENCIES: Dict[str, Type[ICryptocurrency]] = {
+    cryptocurrency.__name__: cryptocurrency for cryptocurrency in ICryptocurrency.__subclasses__()
+}
@@ -0,0 +1,598 @@
+#!/usr/bin/env python3
+
+# Copyright © 2023-2024, Meheret Tesfaye Batu <meherett.batu@gmail.com>
+# Distributed under the MIT software license, see the accompanying
+# file COPYING or https://opensource.org/license/mit
+
+from typing import (
+    Type, Union, Optional, Literal, Sequence, List, Dict, Any
+)
+from abc import (
+    ABC, abstractmethod
+)
+from concurrent.futures import (
+    Executor, ProcessPoolExecutor, ThreadPoolExecutor
+)
+
+import hashlib
+import os
+import threading
+import time
+
+try:
+    import scrypt
+except ImportError:  # pragma: no cover
+    scrypt = None
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+try:
+    from .libs._romix import romix as native_ro_mix
+except ImportError:  # pragma: no cover
+    native_ro_mix = None
+
+from .libs.scrypt import (
+    scrypt as python_scrypt, lanes, combine
+)
+from .exceptions import Error
+
+# RFC 7914 test vector used to validate every backend before it is selected
+SCRYPT_TEST_VECTOR: Dict[str, Any] = {
+    "password": b"password",
+    "salt": b"NaCl",
+    "N": 1024,
+    "r": 8,
+    "p": 16,
+    "buflen": 64,
+    "key": bytes.fromhex(
+        "fdbabe1c9d3472007856e7190d01e9fe7c6ad7cbc8237830e77376634b373162"
+        "2eaf30d92e22a3886ff109279d9830dac727afb94a83ee6d8360cbdfa2cc0640"
+    )
+}
+# Parameters of the one-time calibration micro-benchmark
+SCRYPT_CALIBRATION: Dict[str, Any] = {
+    "password": b"calibration", "salt": b"bip38", "N": 1024, "r": 8, "p": 1, "buflen": 64, "rounds": 3
+}
+
+
+def _to_bytes(data: Union[str, bytes]) -> bytes:
+    return data.encode("utf-8") if isinstance(data, str) else data
+
+
+class IScrypt(ABC):
+    """
+    The scrypt backend interface, with the same ``hash`` signature as the ``scrypt`` package.
+
+    Backends are used as classes, every backend must implement :meth:`hash`.
+    """
+
+    NAME: str
+    FALLBACK: bool = False
+
+    @classmethod
+    def is_available(cls) -> bool:
+        """
+        Checks whether the backend can be used on this host.
+
+        :returns: True if the backend is importable, otherwise False.
+        :rtype: bool
+        """
+
+        return True
+
+    @classmethod
+    @abstractmethod
+    def hash(
+        cls, password: Union[str, bytes], salt: Union[str, bytes], N: int = 1 << 14, r: int = 8, p: int = 1, buflen: int = 64
+    ) -> bytes:
+        """
+        Computes scrypt.
+
+        :param password: The password, strings are UTF-8 encoded.
+        :type password: Union[str, bytes]
+        :param salt: The salt, strings are UTF-8 encoded.
+        :type salt: Union[str, bytes]
+        :param N: The CPU/memory cost, a power of 2 greater than 1 (default: 16384).
+        :type N: int
+        :param r: The block size (default: 8).
+        :type r: int
+        :param p: The parallelization (default: 1).
+        :type p: int
+        :param buflen: The output length in bytes (default: 64).
+        :type buflen: int
+
+        :returns: The derived key.
+        :rtype: bytes
+        """
+
+        raise NotImplementedError
+
+    @classmethod
+    def hash_many(
+        cls,
+        passwords: Sequence[Union[str, bytes]],
+        salts: Sequence[Union[str, bytes]],
+        N: int = 1 << 14,
+        r: int = 8,
+        p: int = 1,
+        buflen: int = 64
+    ) -> List[bytes]:
+        """
+        Computes scrypt for many independent (password, salt) inputs sharing the same parameters.
+
+        :param passwords: The passwords, strings are UTF-8 encoded.
+        :type passwords: Sequence[Union[str, bytes]]
+        :param salts: The salts, one per password, strings are UTF-8 encoded.
+        :type salts: Sequence[Union[str, bytes]]
+        :param N: The CPU/memory cost, a power of 2 greater than 1 (default: 16384).
+        :type N: int
+        :param r: The block size (default: 8).
+        :type r: int
+        :param p: The parallelization (default: 1).
+        :type p: int
+        :param buflen: The output length in bytes (default: 64).
+        :type buflen: int
+
+        :returns: The derived keys, in the same order as the inputs.
+        :rtype: List[bytes]
+        """
+
+        if len(passwords) != len(salts):
+            raise Error("Invalid number of salts", expected=len(passwords), got=len(salts))
+        return [
+            cls.hash(password, salt, N, r, p, buflen) for password, salt in zip(passwords, salts)
+        ]
+
+
+class HashlibScrypt(IScrypt):
+    """
+    The OpenSSL scrypt backend, through ``hashlib.scrypt``.
+    """
+
+    NAME = "hashlib"
+
+    @classmethod
+    def is_available(cls) -> bool:
+        return hasattr(hashlib, "scrypt")
+
+    @classmethod
+    def hash(
+        cls, password: Union[str, bytes], salt: Union[str, bytes], N: int = 1 << 14, r: int = 8, p: int = 1, buflen: int = 64
+    ) -> bytes:
+        return hashlib.scrypt(
+            _to_bytes(password), salt=_to_bytes(salt), n=N, r=r, p=p, dklen=buflen,
+            maxmem=128 * r * (N + p + 2) + (1 << 20)
+        )
+
+
+class PyScrypt(IScrypt):
+    """
+    The ``scrypt`` package backend.
+    """
+
+    NAME = "scrypt"
+
+    @classmethod
+    def is_available(cls) -> bool:
+        return scrypt is not None
+
+    @classmethod
+    def hash(
+        cls, password: Union[str, bytes], salt: Union[str, bytes], N: int = 1 << 14, r: int = 8, p: int = 1, buflen: int = 64
+    ) -> bytes:
+        return scrypt.hash(password, salt, N, r, p, buflen)
+
+
+# Salsa20 words in diagonal order, so that both the column and the row rounds
+# operate on four whole rows of the state: (a, b, c, d) = (diagonal 0, 1, 2, 3)
+_SALSA20_DIAGONAL: List[int] = [0, 5, 10, 15, 4, 9, 14, 3, 8, 13, 2, 7, 12, 1, 6, 11]
+_SALSA20_UNDIAGONAL: List[int] = sorted(range(16), key=_SALSA20_DIAGONAL.__getitem__)
+
+
+def _salsa20_8_lanes(x: "numpy.ndarray") -> "numpy.ndarray":
+    # x has shape (16, lanes), with the words in diagonal order
+    a, b, c, d = x[0:4].copy(), x[4:8].copy(), x[8:12].copy(), x[12:16].copy()
+    for _ in range(4):
+        t = a + d; b ^= (t << 7) | (t >> 25)
+        t = b + a; c ^= (t << 9) | (t >> 23)
+        t = c + b; d ^= (t << 13) | (t >> 19)
+        t = d + c; a ^= (t << 18) | (t >> 14)
+        b, c, d = b[[3, 0, 1, 2]], c[[2, 3, 0, 1]], d[[1, 2, 3, 0]]
+        t = a + b; d ^= (t << 7) | (t >> 25)
+        t = d + a; c ^= (t << 9) | (t >> 23)
+        t = c + d; b ^= (t << 13) | (t >> 19)
+        t = b + c; a ^= (t << 18) | (t >> 14)
+        b, c, d = b[[1, 2, 3, 0]], c[[2, 3, 0, 1]], d[[3, 0, 1, 2]]
+    y: "numpy.ndarray" = numpy.concatenate([a, b, c, d])
+    y += x
+    return y
+
+
+def _block_mix_lanes(x: "numpy.ndarray", r: int) -> "numpy.ndarray":
+    # x has shape (2 * r, 16, lanes)
+    y: "numpy.ndarray" = numpy.empty_like(x)
+    t: "numpy.ndarray" = x[-1]
+    for i in range(2 * r):
+        t = _salsa20_8_lanes(t ^ x[i])
+        y[(i // 2) + (i % 2) * r] = t
+    return y
+
+
+def _ro_mix_lanes(x: "numpy.ndarray", n: int, r: int) -> "numpy.ndarray":
+    v: "numpy.ndarray" = numpy.empty((n,) + x.shape, dtype=numpy.uint32)
+    for i in range(n):
+        v[i] = x
+        x = _block_mix_lanes(x, r)
+    columns: "numpy.ndarray" = numpy.arange(x.shape[-1])
+    for _ in range(n):
+        x = _block_mix_lanes(x ^ v[x[-1, 0] & (n - 1), :, :, columns].transpose(1, 2, 0), r)
+    return x
+
+
+class NumpyScrypt(IScrypt):
+    """
+    The NumPy backend, which runs the ROMix lanes of a whole batch of inputs in one vectorized kernel.
+
+    Every lane is a column of ``uint32`` arrays, so a batch costs the same number of NumPy operations
+    as a single input. Batches are split to keep the ROMix tables within :attr:`MAX_MEMORY` bytes.
+    """
+
+    NAME = "numpy"
+    FALLBACK = True
+    MAX_MEMORY: int = 1 << 28
+
+    @classmethod
+    def is_available(cls) -> bool:
+        return numpy is not None
+
+    @classmethod
+    def hash(
+        cls, password: Union[str, bytes], salt: Union[str, bytes], N: int = 1 << 14, r: int = 8, p: int = 1, buflen: int = 64
+    ) -> bytes:
+        return cls.hash_many([password], [salt], N, r, p, buflen)[0]
+
+    @classmethod
+    def hash_many(
+        cls,
+        passwords: Sequence[Union[str, bytes]],
+        salts: Sequence[Union[str, bytes]],
+        N: int = 1 << 14,
+        r: int = 8,
+        p: int = 1,
+        buflen: int = 64
+    ) -> List[bytes]:
+        if N < 2 or N & (N - 1):
+            raise Error("Invalid scrypt cost", expected="power of 2 greater than 1", got=N)
+        if len(passwords) != len(salts):
+            raise Error("Invalid number of salts", expected=len(passwords), got=len(salts))
+
+        passwords: List[bytes] = [_to_bytes(password) for password in passwords]
+        size: int = 128 * r * p
+        chunk: int = max(1, cls.MAX_MEMORY // (128 * r * N * p))
+        keys: List[bytes] = []
+        for start in range(0, len(passwords), chunk):
+            blocks: bytes = b"".join(
+                lane for password, salt in zip(
+                    passwords[start:start + chunk], salts[start:start + chunk]
+                ) for lane in lanes(password, _to_bytes(salt), r, p)
+            )
+            x: "numpy.ndarray" = numpy.frombuffer(blocks, dtype="<u4").reshape(-1, 2 * r, 16)
+            x = numpy.ascontiguousarray(x[:, :, _SALSA20_DIAGONAL].transpose(1, 2, 0), dtype=numpy.uint32)
+            mixed: bytes = _ro_mix_lanes(x, N, r).transpose(2, 0, 1)[:, :, _SALSA20_UNDIAGONAL].astype("<u4").tobytes()
+            keys.extend(
+                combine(password, [mixed[size * index:size * (index + 1)]], buflen)
+                for index, password in enumerate(passwords[start:start + chunk])
+            )
+        return keys
+
+
+class PythonScrypt(IScrypt):
+    """
+    The pure-Python fallback backend, only selected when neither a native nor the NumPy backend is available.
+    """
+
+    NAME = "python"
+    FALLBACK = True
+
+    @classmethod
+    def hash(
+        cls, password: Union[str, bytes], salt: Union[str, bytes], N: int = 1 << 14, r: int = 8, p: int = 1, buflen: int = 64
+    ) -> bytes:
+        if N < 2 or N & (N - 1):
+            raise Error("Invalid scrypt cost", expected="power of 2 greater than 1", got=N)
+        return python_scrypt(_to_bytes(password), _to_bytes(salt), N, r, p, buflen)
+
+
+SCRYPT_BACKENDS: Dict[str, Type[IScrypt]] = {
+    backend.NAME: backend for backend in [
+        HashlibScrypt, PyScrypt, NumpyScrypt, PythonScrypt
+    ]
+}
+
+_calibration: Dict[str, Any] = {}
+_calibration_lock: threading.Lock = threading.Lock()
+
+
+def calibrate(force: bool = False) -> Dict[str, Any]:
+    """
+    Validates the available scrypt backends and selects the fastest one.
+
+    Every native backend is checked against an RFC 7914 test vector and timed with a small
+    micro-benchmark, once per process. Fallback backends are only considered, in registry order,
+    when no native backend is usable.
+
+    :param force: Whether to run the calibration again (default: False).
+    :type force: bool
+
+    :returns: The selected backend name, the usable backends and their timings in seconds.
+    :rtype: Dict[str, Any]
+    """
+
+    with _calibration_lock:
+        if _calibration and not force:
+            return _calibration
+
+        usable: List[str] = []
+        timings: Dict[str, float] = {}
+        for name, backend in SCRYPT_BACKENDS.items():
+            if not backend.is_available():
+                continue
+            if backend.FALLBACK:
+                usable.append(name)
+                continue
+            try:
+                if backend.hash(
+                    SCRYPT_TEST_VECTOR["password"], SCRYPT_TEST_VECTOR["salt"], SCRYPT_TEST_VECTOR["N"],
+                    SCRYPT_TEST_VECTOR["r"], SCRYPT_TEST_VECTOR["p"], SCRYPT_TEST_VECTOR["buflen"]
+                ) != SCRYPT_TEST_VECTOR["key"]:
+                    continue
+                elapsed: List[float] = []
+                for _ in range(SCRYPT_CALIBRATION["rounds"]):
+                    start: float = time.perf_counter()
+                    backend.hash(
+                        SCRYPT_CALIBRATION["password"], SCRYPT_CALIBRATION["salt"], SCRYPT_CALIBRATION["N"],
+                        SCRYPT_CALIBRATION["r"], SCRYPT_CALIBRATION["p"], SCRYPT_CALIBRATION["buflen"]
+                    )
+                    elapsed.append(time.perf_counter() - start)
+            except (ValueError, MemoryError):
+                continue
+            usable.append(name)
+            timings[name] = min(elapsed)
+
+        selected: str = (
+            min(timings, key=timings.get) if timings else
+            next(name for name in usable if SCRYPT_BACKENDS[name].FALLBACK)
+        )
+        _calibration.clear()
+        _calibration.update(
+            selected=selected, available=usable, timings=timings
+        )
+        return _calibration
+
+
+def get_scrypt_backend(name: Optional[str] = None) -> Type[IScrypt]:
+    """
+    Returns a scrypt backend by name, or the calibrated fastest one.
+
+    :param name: Optional backend name, one of :data:`SCRYPT_BACKENDS` (default: the fastest).
+    :type name: Optional[str]
+
+    :returns: The scrypt backend.
+    :rtype: Type[IScrypt]
+
+    >>> from bip38.kdf import get_scrypt_backend
+    >>> get_scrypt_backend("hashlib").hash("password", "NaCl", 1024, 8, 16).hex()[:32]
+    'fdbabe1c9d3472007856e7190d01e9fe'
+    """
+
+    if name is None:
+        return SCRYPT_BACKENDS[calibrate()["selected"]]
+    if name not in SCRYPT_BACKENDS:
+        raise Error("Invalid scrypt backend", expected=list(SCRYPT_BACKENDS.keys()), got=name)
+    if not SCRYPT_BACKENDS[name].is_available():
+        raise Error("Unavailable scrypt backend", detail=f"'{name}' is not available on this host")
+    return SCRYPT_BACKENDS[name]
+
+
+class AutoScrypt(IScrypt):
+    """
+    Delegates to the calibrated fastest scrypt backend, selected on first use.
+    """
+
+    NAME = "auto"
+
+    @classmethod
+    def hash(
+        cls, password: Union[str, bytes], salt: Union[str, bytes], N: int = 1 << 14, r: int = 8, p: int = 1, buflen: int = 64
+    ) -> bytes:
+        return get_scrypt_backend().hash(password, salt, N, r, p, buflen)
+
+    @classmethod
+    def hash_many(
+        cls,
+        passwords: Sequence[Union[str, bytes]],
+        salts: Sequence[Union[str, bytes]],
+        N: int = 1 << 14,
+        r: int = 8,
+        p: int = 1,
+        buflen: int = 64
+    ) -> List[bytes]:
+        return get_scrypt_backend().hash_many(passwords, salts, N, r, p, buflen)
+
+
+class ParallelScrypt:
+    """
+    A scrypt engine that computes the ``p`` independent ROMix lanes in parallel, to lower the latency
+    of a single hash with ``p > 1`` such as the 16384/8/8 scrypt of BIP38 decryption.
+
+    The lanes are derived and recombined with PBKDF2-HMAC-SHA256 exactly as scrypt does, so the
+    output is bit-identical to ``scrypt.hash``. Each lane is mixed by the C ROMix kernel built with
+    the package (``bip38/libs/_romix.c``), which releases the GIL and is at least as fast per lane as
+    OpenSSL running the lanes one after the other, so ``p`` lanes on ``p`` cores take about the time
+    of one. Every lane in flight holds its own ``128 * r * N`` bytes table (16 MiB for BIP38).
+
+    Calls with nothing to parallelize, i.e. a single lane (``p=1``) or a single worker, and every call
+    when the kernel was not compiled (see :meth:`is_available`), are computed by the fallback engine.
+
+    :param workers: Optional number of workers (default: CPU count).
+    :type workers: Optional[int]
+    :param executor: The pool type, either 'thread' or 'process' (default: 'thread', the kernel releases the GIL).
+    :type executor: Literal["thread", "process"]
+    :param fallback: Optional scrypt engine for the calls that are not parallelized (default: the fastest backend).
+    :type fallback: Optional[Any]
+
+    >>> from bip38 import BIP38
+    >>> from bip38.cryptocurrencies import Bitcoin
+    >>> from bip38.kdf import ParallelScrypt
+    >>> bip38: BIP38 = BIP38(cryptocurrency=Bitcoin, network="mainnet", scrypt_backend=ParallelScrypt(workers=8))
+    """
+
+    workers: int
+    executor: Literal["thread", "process"]
+    fallback: Any
+
+    def __init__(
+        self,
+        workers: Optional[int] = None,
+        executor: Literal["thread", "process"] = "thread",
+        fallback: Optional[Any] = None
+    ) -> None:
+
+        if executor not in ["thread", "process"]:
+            raise Error("Invalid executor", expected=["thread", "process"], got=executor)
+        self.workers, self.executor, self.fallback = (
+            (workers or os.cpu_count() or 1), executor, (fallback if fallback is not None else AutoScrypt)
+        )
+        self._pool: Optional[Executor] = None
+        self._lock: threading.Lock = threading.Lock()
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # The pool and its lock stay in the process that created them, e.g. when handed to pool workers
+        return dict(workers=self.workers, executor=self.executor, fallback=self.fallback)
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__init__(**state)
+
+    @staticmethod
+    def is_available() -> bool:
+        """
+        Checks whether the native ROMix lane kernel was compiled when the package was installed.
+
+        :returns: True if the lanes can be computed in parallel, otherwise False.
+        :rtype: bool
+        """
+
+        return native_ro_mix is not None
+
+    def pool(self) -> Executor:
+        """
+        Returns the worker pool, creating it on first use.
+
+        :returns: The thread or process pool executor.
+        :rtype: Executor
+        """
+
+        with self._lock:
+            if self._pool is None:
+                self._pool = (
+                    ThreadPoolExecutor(max_workers=self.workers)
+                    if self.executor == "thread" else
+                    ProcessPoolExecutor(max_workers=self.workers)
+                )
+            return self._pool
+
+    def close(self) -> None:
+        """
+        Shuts down the worker pool.
+
+        :returns: None
+        """
+
+        with self._lock:
+            if self._pool is not None:
+                self._pool.shutdown()
+                self._pool = None
+
+    def hash(
+        self, password: Union[str, bytes], salt: Union[str, bytes], N: int = 1 << 14, r: int = 8, p: int = 1, buflen: int = 64
+    ) -> bytes:
+        """
+        Computes scrypt, running its ROMix lanes in parallel.
+
+        :param password: The password, strings are UTF-8 encoded.
+        :type password: Union[str, bytes]
+        :param salt: The salt, strings are UTF-8 encoded.
+        :type salt: Union[str, bytes]
+        :param N: The CPU/memory cost, a power of 2 greater than 1 (default: 16384).
+        :type N: int
+        :param r: The block size (default: 8).
+        :type r: int
+        :param p: The parallelization, i.e. the number of lanes (default: 1).
+        :type p: int
+        :param buflen: The output length in bytes (default: 64).
+        :type buflen: int
+
+        :returns: The derived key.
+        :rtype: bytes
+
+        >>> from bip38.kdf import ParallelScrypt
+        >>> ParallelScrypt(workers=2).hash(password="password", salt="NaCl", N=1024, r=8, p=16).hex()
+        'fdbabe1c9d3472007856e7190d01e9fe7c6ad7cbc8237830e77376634b3731622eaf30d92e22a3886ff109279d9830dac727afb94a83ee6d8360cbdfa2cc0640'
+        """
+
+        if N < 2 or N & (N - 1):
+            raise Error("Invalid scrypt cost", expected="power of 2 greater than 1", got=N)
+        if p == 1 or self.workers == 1 or not self.is_available():
+            return self.fallback.hash(password, salt, N, r, p, buflen)
+        password: bytes = _to_bytes(password)
+
+        inputs: List[bytes] = lanes(password, _to_bytes(salt), r, p)
+        return combine(password, list(self.pool().map(native_ro_mix, inputs, [N] * p, [r] * p)), buflen)
+
+
+def scrypt_many(
+    passwords: Sequence[Union[str, bytes]],
+    salts: Sequence[Union[str, bytes]],
+    N: int = 1 << 14,
+    r: int = 8,
+    p: int = 1,
+    buflen: int = 64,
+    backend: Optional[Any] = None
+) -> List[bytes]:
+    """
+    Computes scrypt for many independent (password, salt) inputs, batched when the backend supports it.
+
+    :param passwords: The passwords, strings are UTF-8 encoded.
+    :type passwords: Sequence[Union[str, bytes]]
+    :param salts: The salts, one per password, strings are UTF-8 encoded.
+    :type salts: Sequence[Union[str, bytes]]
+    :param N: The CPU/memory cost, a power of 2 greater than 1 (default: 16384).
+    :type N: int
+    :param r: The block size (default: 8).
+    :type r: int
+    :param p: The parallelization (default: 1).
+    :type p: int
+    :param buflen: The output length in bytes (default: 64).
+    :type buflen: int
+    :param backend: Optional scrypt backend or engine (default: the fastest backend).
+    :type backend: Optional[Any]
+
+    :returns: The derived keys, in the same order as the inputs.
+    :rtype: List[bytes]
+
+    >>> from bip38.kdf import scrypt_many
+    >>> [key.hex()[:16] for key in scrypt_many(["", "password"], ["", "NaCl"], 16, 1, 1, backend="numpy")]
+    ['77d6576238657b20', 'aec6b7483ed26e08']
+    """
+
+    backend: Any = (
+        AutoScrypt if backend is None else get_scrypt_backend(backend) if isinstance(backend, str) else backend
+    )
+    if hasattr(backend, "hash_many"):
+        return backend.hash_many(passwords, salts, N, r, p, buflen)
+    if len(passwords) != len(salts):
+        raise Error("Invalid number of salts", expected=len(passwords), got=len(salts))
+    return [
+        backend.hash(password, salt, N, r, p, buflen) for password, salt in zip(passwords, salts)
+    ]
@@ -0,0 +1,177 @@
+/*
+ * Native scrypt ROMix (RFC 7914, section 5) of a single lane, with the GIL released,
+ * so that the independent lanes of one scrypt hash can be mixed on several threads.
+ *
+ * The lane is taken and returned as the 128 * r bytes B[i] produced and consumed by the
+ * PBKDF2-HMAC-SHA256 stages of scrypt, see bip38.libs.scrypt.lanes and combine.
+ */
+
+#define PY_SSIZE_T_CLEAN
+#include <Python.h>
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+/* Called through a volatile pointer so that the wipes before free are not optimized away */
+static void *(*const volatile wipe)(void *, int, size_t) = memset;
+
+#define ROTL(a, b) (((a) << (b)) | ((a) >> (32 - (b))))
+
+static void salsa20_8(uint32_t b[16])
+{
+    uint32_t x[16];
+    int i;
+
+    memcpy(x, b, sizeof(x));
+    for (i = 0; i < 8; i += 2) {
+        /* Column round */
+        x[4] ^= ROTL(x[0] + x[12], 7);   x[8] ^= ROTL(x[4] + x[0], 9);
+        x[12] ^= ROTL(x[8] + x[4], 13);  x[0] ^= ROTL(x[12] + x[8], 18);
+        x[9] ^= ROTL(x[5] + x[1], 7);    x[13] ^= ROTL(x[9] + x[5], 9);
+        x[1] ^= ROTL(x[13] + x[9], 13);  x[5] ^= ROTL(x[1] + x[13], 18);
+        x[14] ^= ROTL(x[10] + x[6], 7);  x[2] ^= ROTL(x[14] + x[10], 9);
+        x[6] ^= ROTL(x[2] + x[14], 13);  x[10] ^= ROTL(x[6] + x[2], 18);
+        x[3] ^= ROTL(x[15] + x[11], 7);  x[7] ^= ROTL(x[3] + x[15], 9);
+        x[11] ^= ROTL(x[7] + x[3], 13);  x[15] ^= ROTL(x[11] + x[7], 18);
+        /* Row round */
+        x[1] ^= ROTL(x[0] + x[3], 7);    x[2] ^= ROTL(x[1] + x[0], 9);
+        x[3] ^= ROTL(x[2] + x[1], 13);   x[0] ^= ROTL(x[3] + x[2], 18);
+        x[6] ^= ROTL(x[5] + x[4], 7);    x[7] ^= ROTL(x[6] + x[5], 9);
+        x[4] ^= ROTL(x[7] + x[6], 13);   x[5] ^= ROTL(x[4] + x[7], 18);
+        x[11] ^= ROTL(x[10] + x[9], 7);  x[8] ^= ROTL(x[11] + x[10], 9);
+        x[9] ^= ROTL(x[8] + x[11], 13);  x[10] ^= ROTL(x[9] + x[8], 18);
+        x[12] ^= ROTL(x[15] + x[14], 7); x[13] ^= ROTL(x[12] + x[15], 9);
+        x[14] ^= ROTL(x[13] + x[12], 13); x[15] ^= ROTL(x[14] + x[13], 18);
+    }
+    for (i = 0; i < 16; i++) {
+        b[i] += x[i];
+    }
+}
+
+/* BlockMix of the 2 * r blocks of b into y, even blocks first, then odd blocks */
+static void block_mix(const uint32_t *b, uint32_t *y, size_t r)
+{
+    uint32_t x[16];
+    size_t i;
+    int k;
+
+    memcpy(x, &b[(2 * r - 1) * 16], sizeof(x));
+    for (i = 0; i < 2 * r; i++) {
+        for (k = 0; k < 16; k++) {
+            x[k] ^= b[i * 16 + k];
+        }
+        salsa20_8(x);
+        memcpy(&y[((i & 1) ? r + i / 2 : i / 2) * 16], x, sizeof(x));
+    }
+}
+
+static void ro_mix(uint32_t *x, uint32_t *y, uint32_t *v, size_t r, uint64_t n)
+{
+    size_t words = 32 * r, k;
+    uint64_t i, j;
+
+    /* x and y take turns as the BlockMix input, n is even so the result ends up in x */
+    for (i = 0; i < n; i += 2) {
+        memcpy(&v[i * words], x, words * 4);
+        block_mix(x, y, r);
+        memcpy(&v[(i + 1) * words], y, words * 4);
+        block_mix(y, x, r);
+    }
+    for (i = 0; i < n; i += 2) {
+        j = (x[(2 * r - 1) * 16] | ((uint64_t) x[(2 * r - 1) * 16 + 1] << 32)) & (n - 1);
+        for (k = 0; k < words; k++) {
+            x[k] ^= v[j * words + k];
+        }
+        block_mix(x, y, r);
+        j = (y[(2 * r - 1) * 16] | ((uint64_t) y[(2 * r - 1) * 16 + 1] << 32)) & (n - 1);
+        for (k = 0; k < words; k++) {
+            y[k] ^= v[j * words + k];
+        }
+        block_mix(y, x, r);
+    }
+}
+
+static PyObject *romix(PyObject *self, PyObject *args)
+{
+    Py_buffer lane;
+    unsigned long long n;
+    Py_ssize_t r;
+    uint32_t *x, *y, *v;
+    unsigned char *data;
+    PyObject *result;
+    size_t words, k;
+
+    if (!PyArg_ParseTuple(args, "y*Kn", &lane, &n, &r)) {
+        return NULL;
+    }
+    if (r < 1 || (size_t) r > SIZE_MAX / 128) {
+        PyBuffer_Release(&lane);
+        PyErr_SetString(PyExc_ValueError, "Invalid scrypt block size");
+        return NULL;
+    }
+    if (n < 2 || (n & (n - 1)) || n > SIZE_MAX / (128 * (size_t) r)) {
+        PyBuffer_Release(&lane);
+        PyErr_SetString(PyExc_ValueError, "Invalid scrypt cost");
+        return NULL;
+    }
+    if ((size_t) lane.len != 128 * (size_t) r) {
+        PyBuffer_Release(&lane);
+        PyErr_SetString(PyExc_ValueError, "Invalid scrypt lane length");
+        return NULL;
+    }
+
+    words = 32 * (size_t) r;
+    x = (uint32_t *) malloc(words * 4);
+    y = (uint32_t *) malloc(words * 4);
+    v = (uint32_t *) malloc((size_t) n * words * 4);
+    if (x == NULL || y == NULL || v == NULL) {
+        free(x);
+        free(y);
+        free(v);
+        PyBuffer_Release(&lane);
+        return PyErr_NoMemory();
+    }
+    data = (unsigned char *) lane.buf;
+    for (k = 0; k < words; k++) {
+        x[k] = (uint32_t) data[4 * k] | ((uint32_t) data[4 * k + 1] << 8) |
+            ((uint32_t) data[4 * k + 2] << 16) | ((uint32_t) data[4 * k + 3] << 24);
+    }
+    PyBuffer_Release(&lane);
+
+    Py_BEGIN_ALLOW_THREADS
+    ro_mix(x, y, v, (size_t) r, (uint64_t) n);
+    Py_END_ALLOW_THREADS
+
+    result = PyBytes_FromStringAndSize(NULL, (Py_ssize_t) (words * 4));
+    if (result != NULL) {
+        data = (unsigned char *) PyBytes_AS_STRING(result);
+        for (k = 0; k < words; k++) {
+            data[4 * k] = (unsigned char) x[k];
+            data[4 * k + 1] = (unsigned char) (x[k] >> 8);
+            data[4 * k + 2] = (unsigned char) (x[k] >> 16);
+            data[4 * k + 3] = (unsigned char) (x[k] >> 24);
+        }
+    }
+    /* The table and the lane are derived from the password, zero them before they are freed */
+    wipe(v, 0, (size_t) n * words * 4);
+    wipe(x, 0, words * 4);
+    wipe(y, 0, words * 4);
+    free(x);
+    free(y);
+    free(v);
+    return result;
+}
+
+static PyMethodDef methods[] = {
+    {"romix", romix, METH_VARARGS, "romix(lane, n, r) -> bytes\n\nMixes a 128 * r bytes scrypt lane with ROMix."},
+    {NULL, NULL, 0, NULL}
+};
+
+static struct PyModuleDef module = {
+    PyModuleDef_HEAD_INIT, "bip38.libs._romix", "Native scrypt ROMix lane kernel.", -1, methods
+};
+
+PyMODINIT_FUNC PyInit__romix(void)
+{
+    return PyModule_Create(&module);
+}
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+
+# Pure-Python AES (FIPS 197) on 32-bit big-endian words, using the classic
+# T-table formulation: every round is 16 table lookups and 16 XORs per block.
+
+import struct
+
+
+def _tables():
+    """Build the S-boxes and the encryption/decryption T-tables."""
+    exp, log = [0] * 256, [0] * 256
+    x = 1
+    for i in range(255):
+        exp[i], log[x] = x, i
+        x ^= ((x << 1) ^ (0x1b if x & 0x80 else 0)) & 0xff
+    exp[255] = exp[0]
+
+    def mul(a, b):
+        return exp[(log[a] + log[b]) % 255] if a and b else 0
+
+    sbox, inv_sbox = [0] * 256, [0] * 256
+    for a in range(256):
+        b = exp[255 - log[a]] if a else 0
+        s = b
+        for _ in range(4):
+            b = ((b << 1) | (b >> 7)) & 0xff
+            s ^= b
+        s ^= 0x63
+        sbox[a], inv_sbox[s] = s, a
+
+    te, td = [[0] * 256 for _ in range(4)], [[0] * 256 for _ in range(4)]
+    for a in range(256):
+        s, i = sbox[a], inv_sbox[a]
+        e = (mul(s, 2) << 24) | (s << 16) | (s << 8) | mul(s, 3)
+        d = (mul(i, 14) << 24) | (mul(i, 9) << 16) | (mul(i, 13) << 8) | mul(i, 11)
+        for t in range(4):
+            te[t][a], td[t][a] = e, d
+            e = ((e >> 8) | (e << 24)) & 0xffffffff
+            d = ((d >> 8) | (d << 24)) & 0xffffffff
+    return sbox, inv_sbox, te, td
+
+
+SBOX, INV_SBOX, (TE0, TE1, TE2, TE3), (TD0, TD1, TD2, TD3) = _tables()
+RCON = [0x01, 0x02, 0x04, 0x08, 0x10, 0x20, 0x40, 0x80, 0x1b, 0x36]
+
+
+def expand_key(key):
+    """Expand a 16, 24 or 32 bytes key into its encryption round keys."""
+    if len(key) not in (16, 24, 32):
+        raise ValueError("Invalid key size")
+    nk = len(key) // 4
+    w = list(struct.unpack(">%dI" % nk, key))
+    for i in range(nk, 4 * (nk + 7)):
+        t = w[i - 1]
+        if i % nk == 0:
+            t = (
+                (SBOX[(t >> 16) & 0xff] << 24) | (SBOX[(t >> 8) & 0xff] << 16) |
+                (SBOX[t & 0xff] << 8) | SBOX[t >> 24]
+            ) ^ (RCON[i // nk - 1] << 24)
+        elif nk > 6 and i % nk == 4:
+            t = (
+                (SBOX[t >> 24] << 24) | (SBOX[(t >> 16) & 0xff] << 16) |
+                (SBOX[(t >> 8) & 0xff] << 8) | SBOX[t & 0xff]
+            )
+        w.append(w[i - nk] ^ t)
+    return w
+
+
+def invert_key(w):
+    """Derive the equivalent inverse cipher round keys from the encryption round keys."""
+    rounds = len(w) // 4 - 1
+    d = []
+    for r in range(rounds, -1, -1):
+        for t in w[4 * r:4 * r + 4]:
+            if 0 < r < rounds:
+                t = (
+                    TD0[SBOX[t >> 24]] ^ TD1[SBOX[(t >> 16) & 0xff]] ^
+                    TD2[SBOX[(t >> 8) & 0xff]] ^ TD3[SBOX[t & 0xff]]
+                )
+            d.append(t)
+    return d
+
+
+def encrypt_block(w, block):
+    """Encrypt one 16 bytes block with expanded round keys."""
+    s0, s1, s2, s3 = struct.unpack(">4I", block)
+    s0 ^= w[0]; s1 ^= w[1]; s2 ^= w[2]; s3 ^= w[3]
+    for k in range(4, len(w) - 4, 4):
+        s0, s1, s2, s3 = (
+            TE0[s0 >> 24] ^ TE1[(s1 >> 16) & 0xff] ^ TE2[(s2 >> 8) & 0xff] ^ TE3[s3 & 0xff] ^ w[k],
+            TE0[s1 >> 24] ^ TE1[(s2 >> 16) & 0xff] ^ TE2[(s3 >> 8) & 0xff] ^ TE3[s0 & 0xff] ^ w[k + 1],
+            TE0[s2 >> 24] ^ TE1[(s3 >> 16) & 0xff] ^ TE2[(s0 >> 8) & 0xff] ^ TE3[s1 & 0xff] ^ w[k + 2],
+            TE0[s3 >> 24] ^ TE1[(s0 >> 16) & 0xff] ^ TE2[(s1 >> 8) & 0xff] ^ TE3[s2 & 0xff] ^ w[k + 3]
+        )
+    k = len(w) - 4
+    return struct.pack(
+        ">4I",
+        ((SBOX[s0 >> 24] << 24) | (SBOX[(s1 >> 16) & 0xff] << 16) |
+         (SBOX[(s2 >> 8) & 0xff] << 8) | SBOX[s3 & 0xff]) ^ w[k],
+        ((SBOX[s1 >> 24] << 24) | (SBOX[(s2 >> 16) & 0xff] << 16) |
+         (SBOX[(s3 >> 8) & 0xff] << 8) | SBOX[s0 & 0xff]) ^ w[k + 1],
+        ((SBOX[s2 >> 24] << 24) | (SBOX[(s3 >> 16) & 0xff] << 16) |
+         (SBOX[(s0 >> 8) & 0xff] << 8) | SBOX[s1 & 0xff]) ^ w[k + 2],
+        ((SBOX[s3 >> 24] << 24) | (SBOX[(s0 >> 16) & 0xff] << 16) |
+         (SBOX[(s1 >> 8) & 0xff] << 8) | SBOX[s2 & 0xff]) ^ w[k + 3]
+    )
+
+
+def decrypt_block(d, block):
+    """Decrypt one 16 bytes block with inverse cipher round keys."""
+    s0, s1, s2, s3 = struct.unpack(">4I", block)
+    s0 ^= d[0]; s1 ^= d[1]; s2 ^= d[2]; s3 ^= d[3]
+    for k in range(4, len(d) - 4, 4):
+        s0, s1, s2, s3 = (
+            TD0[s0 >> 24] ^ TD1[(s3 >> 16) & 0xff] ^ TD2[(s2 >> 8) & 0xff] ^ TD3[s1 & 0xff] ^ d[k],
+            TD0[s1 >> 24] ^ TD1[(s0 >> 16) & 0xff] ^ TD2[(s3 >> 8) & 0xff] ^ TD3[s2 & 0xff] ^ d[k + 1],
+            TD0[s2 >> 24] ^ TD1[(s1 >> 16) & 0xff] ^ TD2[(s0 >> 8) & 0xff] ^ TD3[s3 & 0xff] ^ d[k + 2],
+            TD0[s3 >> 24] ^ TD1[(s2 >> 16) & 0xff] ^ TD2[(s1 >> 8) & 0xff] ^ TD3[s0 & 0xff] ^ d[k + 3]
+        )
+    k = len(d) - 4
+    return struct.pack(
+        ">4I",
+        ((INV_SBOX[s0 >> 24] << 24) | (INV_SBOX[(s3 >> 16) & 0xff] << 16) |
+         (INV_SBOX[(s2 >> 8) & 0xff] << 8) | INV_SBOX[s1 & 0xff]) ^ d[k],
+        ((INV_SBOX[s1 >> 24] << 24) | (INV_SBOX[(s0 >> 16) & 0xff] << 16) |
+         (INV_SBOX[(s3 >> 8) & 0xff] << 8) | INV_SBOX[s2 & 0xff]) ^ d[k + 1],
+        ((INV_SBOX[s2 >> 24] << 24) | (INV_SBOX[(s1 >> 16) & 0xff] << 16) |
+         (INV_SBOX[(s0 >> 8) & 0xff] << 8) | INV_SBOX[s3 & 0xff]) ^ d[k + 2],
+        ((INV_SBOX[s3 >> 24] << 24) | (INV_SBOX[(s2 >> 16) & 0xff] << 16) |
+         (INV_SBOX[(s1 >> 8) & 0xff] << 8) | INV_SBOX[s0 & 0xff]) ^ d[k + 3]
+    )
+
+
+class AES:
+    """AES in ECB mode, expanding the key once and the inverse key only when first decrypting."""
+
+    def __init__(self, key):
+        self._w = expand_key(key)
+        self._d = None
+
+    def encrypt(self, data):
+        if len(data) % 16:
+            raise ValueError("Data must be a multiple of 16 bytes")
+        return b"".join(encrypt_block(self._w, data[i:i + 16]) for i in range(0, len(data), 16))
+
+    def decrypt(self, data):
+        if len(data) % 16:
+            raise ValueError("Data must be a multiple of 16 bytes")
+        if self._d is None:
+            self._d = invert_key(self._w)
+        return b"".join(decrypt_block(self._d, data[i:i + 16]) for i in range(0, len(data), 16))
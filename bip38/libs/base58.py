@@ -4,18 +4,81 @@ from hashlib import sha256
 
 import six
 
-__base58_alphabet = "123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz"
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
 
+BASE58_ALPHABET = "123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz"
 
-def string_to_int(data):
-    val = 0
+# Number of base58 digits converted per big integer operation, 58 ** 10 < 2 ** 64
+CHUNK_DIGITS = 10
+# Fixed-width batches: base58 digits per radix limb (58 ** 5 < 2 ** 30, so that
+# limb * 58 ** 5 + carry fits in 64 bits), and the smallest batch worth vectorizing
+LIMB_DIGITS = 5
+LIMB_RADIX = 58 ** LIMB_DIGITS
+NUMPY_BATCH_THRESHOLD = 128
 
-    if type(data) == str:
-        data = bytearray(data)
 
-    for (i, c) in enumerate(data[::-1]):
-        val += (256 ** i) * c
-    return val
+def digits_width(width):
+    """Return the number of base58 digits needed for any width bytes value."""
+    digits = 0
+    while 58 ** digits < 256 ** width:
+        digits += 1
+    return digits
+
+
+def bytes_to_digits(data):
+    """Convert a (N, width) uint8 array to a (N, digits_width(width)) array of big-endian base58 digits."""
+    count, width = data.shape
+    digits = digits_width(width)
+    groups = -(-digits // LIMB_DIGITS)
+    # Big-endian 32-bit limbs, divided by 58 ** 5 in place once per group of five digits
+    limbs = numpy.pad(data, ((0, 0), ((-width) % 4, 0))).view(">u4").astype(numpy.uint64)
+    out = numpy.zeros((count, groups * LIMB_DIGITS), dtype=numpy.uint8)
+    radix = numpy.uint64(LIMB_RADIX)
+    for group in range(groups):
+        remainder = numpy.zeros(count, dtype=numpy.uint64)
+        for index in range(limbs.shape[1]):
+            current = (remainder << numpy.uint64(32)) | limbs[:, index]
+            limbs[:, index] = current // radix
+            remainder = current % radix
+        for position in range(LIMB_DIGITS):
+            out[:, (groups - group) * LIMB_DIGITS - position - 1] = remainder % numpy.uint64(58)
+            remainder //= numpy.uint64(58)
+    return out[:, groups * LIMB_DIGITS - digits:]
+
+
+def digits_to_bytes(digits, width):
+    """Convert a (N, D) array of big-endian base58 digits to a (N, width) uint8 array and an overflow mask."""
+    count = digits.shape[0]
+    digits = numpy.pad(digits.astype(numpy.uint64), ((0, 0), ((-digits.shape[1]) % LIMB_DIGITS, 0)))
+    weights = numpy.array([58 ** (LIMB_DIGITS - 1 - i) for i in range(LIMB_DIGITS)], dtype=numpy.uint64)
+    groups = digits.reshape(count, -1, LIMB_DIGITS) @ weights
+    # Little-endian 32-bit limbs, multiplied by 58 ** 5 and added to once per group of five digits
+    limbs = numpy.zeros((count, -(-width // 4)), dtype=numpy.uint64)
+    overflow = numpy.zeros(count, dtype=bool)
+    radix, mask = numpy.uint64(LIMB_RADIX), numpy.uint64(0xffffffff)
+    for group in range(groups.shape[1]):
+        carry = groups[:, group]
+        for index in range(limbs.shape[1]):
+            current = limbs[:, index] * radix + carry
+            limbs[:, index] = current & mask
+            carry = current >> numpy.uint64(32)
+        overflow |= carry != 0
+    data = limbs[:, ::-1].astype(">u4").view(numpy.uint8)
+    pad = data.shape[1] - width
+    overflow |= data[:, :pad].any(axis=1)
+    return numpy.ascontiguousarray(data[:, pad:]), overflow
+
+
+def _leading_zeros(array):
+    nonzero = array != 0
+    return numpy.where(nonzero.any(axis=1), nonzero.argmax(axis=1), array.shape[1])
+
+
+def _checksum(raw):
+    return sha256(sha256(raw).digest()).digest()[:4]
 
 
 def ensure_string(data):
@@ -26,49 +89,186 @@ def ensure_string(data):
     return data
 
 
-def encode(data, alphabet=__base58_alphabet):
-    enc = ""
-    val = string_to_int(data)
-    while val >= len(alphabet):
-        val, mod = divmod(val, len(alphabet))
-        enc = alphabet[mod] + enc
-    if val:
-        enc = alphabet[val] + enc
+class Base58:
+    """Base58 codec bound to one alphabet, with precomputed encode/decode tables."""
 
-    n = len(data) - len(data.lstrip(b"\0"))
-    return alphabet[0] * n + enc
+    def __init__(self, alphabet=BASE58_ALPHABET):
+        if len(alphabet) != 58 or len(set(alphabet)) != 58:
+            raise ValueError("Invalid base58 alphabet")
+        self.alphabet = alphabet
+        self._zero = alphabet[0]
+        self._chunk = 58 ** CHUNK_DIGITS
+        # Two digits per lookup: every chunk is split into CHUNK_DIGITS // 2 pairs
+        self._pairs = [a + b for a in alphabet for b in alphabet]
+        self._table = [-1] * 256
+        for index, char in enumerate(alphabet.encode("ascii")):
+            self._table[char] = index
+        self._powers = [58 ** i for i in range(CHUNK_DIGITS + 1)]
+        if numpy is not None:
+            self._encode_array = numpy.frombuffer(alphabet.encode("ascii"), dtype=numpy.uint8)
+            self._decode_array = numpy.array([255 if digit < 0 else digit for digit in self._table], dtype=numpy.uint8)
 
+    def _encode_chunk(self, value):
+        pairs = []
+        for _ in range(CHUNK_DIGITS // 2):
+            value, mod = divmod(value, 3364)
+            pairs.append(self._pairs[mod])
+        return "".join(reversed(pairs))
 
-def check_encode(raw, alphabet=__base58_alphabet):
-    chk = sha256(sha256(raw).digest()).digest()[:4]
-    return encode(raw + chk, alphabet)
+    def encode(self, data):
+        data = bytes(data)
+        stripped = data.lstrip(b"\0")
+        value = int.from_bytes(stripped, "big")
+        chunks = []
+        while value >= self._chunk:
+            value, mod = divmod(value, self._chunk)
+            chunks.append(self._encode_chunk(mod))
+        head = ""
+        while value:
+            value, mod = divmod(value, 58)
+            head = self.alphabet[mod] + head
+        return self._zero * (len(data) - len(stripped)) + head + "".join(reversed(chunks))
 
+    def decode(self, data):
+        if isinstance(data, str):
+            try:
+                data = data.encode("ascii")
+            except UnicodeEncodeError:
+                raise ValueError("Invalid base58 character")
+        table = self._table
+        digits = [table[char] for char in data]
+        if -1 in digits:
+            raise ValueError("Invalid base58 character")
+        prefix = 0
+        for digit in digits:
+            if digit:
+                break
+            prefix += 1
+        value = 0
+        for start in range(prefix, len(digits), CHUNK_DIGITS):
+            chunk = 0
+            for digit in digits[start:start + CHUNK_DIGITS]:
+                chunk = chunk * 58 + digit
+            value = value * self._powers[min(CHUNK_DIGITS, len(digits) - start)] + chunk
+        return b"\0" * prefix + value.to_bytes((value.bit_length() + 7) // 8, "big")
 
-def decode(data, alphabet=__base58_alphabet):
-    if bytes != str:
-        data = bytes(data, "ascii")
+    def check_encode(self, raw):
+        return self.encode(raw + _checksum(raw))
 
-    val = 0
-    prefix = 0
-    for c in data:
-        val = (val * len(alphabet)) + alphabet.encode("utf-8").find(c)
-        if val == 0:
-            prefix += 1
+    def check_decode(self, enc):
+        dec = self.decode(enc)
+        raw, chk = dec[:-4], dec[-4:]
+        if chk != _checksum(raw):
+            raise ValueError("base58 decoding checksum error")
+        return raw
 
-    dec = bytearray()
-    while val > 0:
-        val, mod = divmod(val, 256)
-        dec.append(mod)
+    def encode_many(self, items):
+        return [self.encode(data) for data in items]
 
-    dec.extend(bytearray(prefix))
+    def decode_many(self, items):
+        return [self.decode(data) for data in items]
 
-    return bytes(dec[::-1])
+    def encode_array(self, data):
+        """Encode a (N, width) uint8 array of equal-width payloads."""
+        digits = bytes_to_digits(data)
+        zero_bytes, zero_digits = _leading_zeros(data), _leading_zeros(digits)
+        rows = self._encode_array[digits].tobytes()
+        size = digits.shape[1]
+        return [
+            self._zero * zeros + rows[index * size + skip:(index + 1) * size].decode("ascii")
+            for index, (zeros, skip) in enumerate(zip(zero_bytes.tolist(), zero_digits.tolist()))
+        ]
 
+    def decode_array(self, items, width):
+        """Decode equal-width strings to a (N, width) uint8 array and a validity mask."""
+        size = digits_width(width)
+        text = "".join(
+            item.rjust(size, self._zero) if len(item) <= size else "?" * size for item in items
+        ).encode("ascii", "replace")
+        digits = self._decode_array[numpy.frombuffer(text, dtype=numpy.uint8)].reshape(len(items), size)
+        valid = (digits != 255).all(axis=1)
+        digits[~valid] = 0
+        data, overflow = digits_to_bytes(digits, width)
+        prefix = numpy.array([len(item) - len(item.lstrip(self._zero)) for item in items], dtype=numpy.int64)
+        return data, valid & ~overflow & (_leading_zeros(data) == numpy.minimum(prefix, width))
 
-def check_decode(enc, alphabet=__base58_alphabet):
-    dec = decode(enc, alphabet)
-    raw, chk = dec[:-4], dec[-4:]
-    if chk != sha256(sha256(raw).digest()).digest()[:4]:
-        raise ValueError("base58 decoding checksum error")
-    else:
-        return raw
+    def check_encode_many(self, items):
+        items = [bytes(raw) for raw in items]
+        if numpy is None or len(items) < NUMPY_BATCH_THRESHOLD or len(set(map(len, items))) != 1:
+            return [self.check_encode(raw) for raw in items]
+        return self.encode_array(numpy.frombuffer(
+            b"".join(raw + _checksum(raw) for raw in items), dtype=numpy.uint8
+        ).reshape(len(items), -1))
+
+    def check_decode_array(self, items, width):
+        """Decode equal-width base58check strings to a (N, width) uint8 array and a validity mask."""
+        data, valid = self.decode_array(items, width + 4)
+        rows = data.tobytes()
+        size = width + 4
+        for index in numpy.flatnonzero(valid).tolist():
+            row = rows[index * size:(index + 1) * size]
+            valid[index] = _checksum(row[:-4]) == row[-4:]
+        return numpy.ascontiguousarray(data[:, :-4]), valid
+
+    def check_decode_many(self, items, width=None, strict=True):
+        """Decode base58check strings, to None instead of raising ValueError for invalid ones when not strict."""
+        if width is None or numpy is None or len(items) < NUMPY_BATCH_THRESHOLD:
+            raws = []
+            for enc in items:
+                try:
+                    raw = self.check_decode(enc)
+                    if width is not None and len(raw) != width:
+                        raise ValueError("base58 decoding width error")
+                except ValueError:
+                    if strict:
+                        raise
+                    raw = None
+                raws.append(raw)
+            return raws
+        data, valid = self.check_decode_array(items, width)
+        if strict and not valid.all():
+            raise ValueError("base58 decoding checksum error")
+        return [row.tobytes() if ok else None for row, ok in zip(data, valid.tolist())]
+
+
+_codecs = {}
+
+
+def get_codec(alphabet=BASE58_ALPHABET):
+    """Return the shared codec of an alphabet, building its tables on first use."""
+    codec = _codecs.get(alphabet)
+    if codec is None:
+        codec = _codecs.setdefault(alphabet, Base58(alphabet))
+    return codec
+
+
+def encode(data, alphabet=BASE58_ALPHABET):
+    return get_codec(alphabet).encode(data)
+
+
+def check_encode(raw, alphabet=BASE58_ALPHABET):
+    return get_codec(alphabet).check_encode(raw)
+
+
+def decode(data, alphabet=BASE58_ALPHABET):
+    return get_codec(alphabet).decode(data)
+
+
+def check_decode(enc, alphabet=BASE58_ALPHABET):
+    return get_codec(alphabet).check_decode(enc)
+
+
+def encode_many(items, alphabet=BASE58_ALPHABET):
+    return get_codec(alphabet).encode_many(items)
+
+
+def decode_many(items, alphabet=BASE58_ALPHABET):
+    return get_codec(alphabet).decode_many(items)
+
+
+def check_encode_many(items, alphabet=BASE58_ALPHABET):
+    return get_codec(alphabet).check_encode_many(items)
+
+
+def check_decode_many(items, width=None, strict=True, alphabet=BASE58_ALPHABET):
+    return get_codec(alphabet).check_decode_many(items, width, strict)
@@ -78,27 +78,57 @@ def rol(x, i):
     return ((x << i) | ((x & 0xffffffff) >> (32 - i))) & 0xffffffff
 
 
-def compress(h0, h1, h2, h3, h4, block):
-    """Compress state (h0, h1, h2, h3, h4) with block."""
-    # Left path variables.
-    al, bl, cl, dl, el = h0, h1, h2, h3, h4
-    # Right path variables.
-    ar, br, cr, dr, er = h0, h1, h2, h3, h4
-    # Message variables.
-    x = [struct.unpack("<L", block[4*i:4*(i+1)])[0] for i in range(16)]
-
-    # Iterate over the 80 rounds of the compression.
-    for j in range(80):
-        rnd = j >> 4
-        # Perform left side of the transformation.
-        al = rol(al + fi(bl, cl, dl, rnd) + x[ML[j]] + KL[rnd], RL[j]) + el
-        al, bl, cl, dl, el = el, al, bl, rol(cl, 10), dl
-        # Perform right side of the transformation.
-        ar = rol(ar + fi(br, cr, dr, 4 - rnd) + x[MR[j]] + KR[rnd], RR[j]) + er
-        ar, br, cr, dr, er = er, ar, br, rol(cr, 10), dr
-
-    # Compose old state, left transform, and right transform into new state.
-    return h1 + cl + dr, h2 + dl + er, h3 + el + ar, h4 + al + br, h0 + bl + cr
+# Boolean functions f1 to f5 as expression templates over (b, c, d).
+F = [
+    "({1} ^ {2} ^ {3})",
+    "(({1} & {2}) | (~{1} & {3}))",
+    "(({1} | ~{2}) ^ {3})",
+    "(({1} & {3}) | ({2} & ~{3}))",
+    "({1} ^ ({2} | ~{3}))"
+]
+
+
+def compress_source():
+    """Generate the fully unrolled compression function from the schedule tables.
+
+    Every round becomes straight-line code with its message word, rotation count,
+    constant and boolean function inlined, and the five working variables are
+    renamed from round to round instead of being shifted.
+    """
+    words = ", ".join("x%d" % i for i in range(16))
+    lines = [
+        "def compress(h0, h1, h2, h3, h4, block):",
+        "    %s = unpack('<16L', block)" % words,
+        "    al, bl, cl, dl, el = ar, br, cr, dr, er = h0, h1, h2, h3, h4"
+    ]
+    for side, m, r, k, f in (("l", ML, RL, KL, lambda i: i), ("r", MR, RR, KR, lambda i: 4 - i)):
+        names = [n + side for n in "abcde"]
+        for j in range(80):
+            a, b, c, d, e = names
+            constant = (" + 0x%08x" % k[j >> 4]) if k[j >> 4] else ""
+            lines += [
+                "    t = (%s + %s + x%d%s) & 0xffffffff" % (a, F[f(j >> 4)].format(a, b, c, d), m[j], constant),
+                "    %s = (((t << %d) | (t >> %d)) + %s) & 0xffffffff" % (a, r[j], 32 - r[j], e),
+                "    %s = ((%s << 10) | (%s >> 22)) & 0xffffffff" % (c, c, c)
+            ]
+            names = [e, a, b, c, d]
+    # 80 renamings bring every variable back to its own name.
+    lines.append(
+        "    return ((h1 + cl + dr) & 0xffffffff, (h2 + dl + er) & 0xffffffff, (h3 + el + ar) & 0xffffffff,"
+        " (h4 + al + br) & 0xffffffff, (h0 + bl + cr) & 0xffffffff)"
+    )
+    return "\n".join(lines)
+
+
+def _compile_compress():
+    namespace = {"unpack": struct.unpack}
+    exec(compile(compress_source(), "<ripemd160-compress>", "exec"), namespace)
+    compress = namespace["compress"]
+    compress.__doc__ = "Compress state (h0, h1, h2, h3, h4) with block."
+    return compress
+
+
+compress = _compile_compress()
 
 
 def ripemd160(data):
@@ -107,17 +137,15 @@ def ripemd160(data):
     state = (0x67452301, 0xefcdab89, 0x98badcfe, 0x10325476, 0xc3d2e1f0)
     # Process full 64-byte blocks in the input.
     for b in range(len(data) >> 6):
-        args = list(state) + [data[64*b:64*(b+1)]]
-        state = compress(*args)
+        state = compress(*state, data[64*b:64*(b+1)])
     # Construct final blocks (with padding and size).
     pad = b"\x80" + b"\x00" * ((119 - len(data)) & 63)
     fin = data[len(data) & ~63:] + pad + struct.pack("<Q", 8 * len(data))
     # Process final blocks.
     for b in range(len(fin) >> 6):
-        args = list(state) + [fin[64*b:64*(b+1)]]
-        state = compress(*args)
+        state = compress(*state, fin[64*b:64*(b+1)])
     # Produce output.
-    return b"".join(struct.pack("<L", h & 0xffffffff) for h in state)
+    return struct.pack("<5L", *state)
 
 
 class TestFrameworkKey(unittest.TestCase):
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+
+# Pure-Python scrypt (RFC 7914), split into its PBKDF2 and ROMix stages so
+# that the independent ROMix lanes can be computed separately.
+
+import hashlib
+import struct
+
+
+def salsa20_8(b):
+    """Apply the Salsa20/8 core to a list of 16 little-endian 32-bit words."""
+    x0, x1, x2, x3, x4, x5, x6, x7, x8, x9, x10, x11, x12, x13, x14, x15 = b
+    for _ in range(4):
+        # Column round.
+        t = (x0 + x12) & 0xffffffff; x4 ^= ((t << 7) | (t >> 25)) & 0xffffffff
+        t = (x4 + x0) & 0xffffffff; x8 ^= ((t << 9) | (t >> 23)) & 0xffffffff
+        t = (x8 + x4) & 0xffffffff; x12 ^= ((t << 13) | (t >> 19)) & 0xffffffff
+        t = (x12 + x8) & 0xffffffff; x0 ^= ((t << 18) | (t >> 14)) & 0xffffffff
+        t = (x5 + x1) & 0xffffffff; x9 ^= ((t << 7) | (t >> 25)) & 0xffffffff
+        t = (x9 + x5) & 0xffffffff; x13 ^= ((t << 9) | (t >> 23)) & 0xffffffff
+        t = (x13 + x9) & 0xffffffff; x1 ^= ((t << 13) | (t >> 19)) & 0xffffffff
+        t = (x1 + x13) & 0xffffffff; x5 ^= ((t << 18) | (t >> 14)) & 0xffffffff
+        t = (x10 + x6) & 0xffffffff; x14 ^= ((t << 7) | (t >> 25)) & 0xffffffff
+        t = (x14 + x10) & 0xffffffff; x2 ^= ((t << 9) | (t >> 23)) & 0xffffffff
+        t = (x2 + x14) & 0xffffffff; x6 ^= ((t << 13) | (t >> 19)) & 0xffffffff
+        t = (x6 + x2) & 0xffffffff; x10 ^= ((t << 18) | (t >> 14)) & 0xffffffff
+        t = (x15 + x11) & 0xffffffff; x3 ^= ((t << 7) | (t >> 25)) & 0xffffffff
+        t = (x3 + x15) & 0xffffffff; x7 ^= ((t << 9) | (t >> 23)) & 0xffffffff
+        t = (x7 + x3) & 0xffffffff; x11 ^= ((t << 13) | (t >> 19)) & 0xffffffff
+        t = (x11 + x7) & 0xffffffff; x15 ^= ((t << 18) | (t >> 14)) & 0xffffffff
+        # Row round.
+        t = (x0 + x3) & 0xffffffff; x1 ^= ((t << 7) | (t >> 25)) & 0xffffffff
+        t = (x1 + x0) & 0xffffffff; x2 ^= ((t << 9) | (t >> 23)) & 0xffffffff
+        t = (x2 + x1) & 0xffffffff; x3 ^= ((t << 13) | (t >> 19)) & 0xffffffff
+        t = (x3 + x2) & 0xffffffff; x0 ^= ((t << 18) | (t >> 14)) & 0xffffffff
+        t = (x5 + x4) & 0xffffffff; x6 ^= ((t << 7) | (t >> 25)) & 0xffffffff
+        t = (x6 + x5) & 0xffffffff; x7 ^= ((t << 9) | (t >> 23)) & 0xffffffff
+        t = (x7 + x6) & 0xffffffff; x4 ^= ((t << 13) | (t >> 19)) & 0xffffffff
+        t = (x4 + x7) & 0xffffffff; x5 ^= ((t << 18) | (t >> 14)) & 0xffffffff
+        t = (x10 + x9) & 0xffffffff; x11 ^= ((t << 7) | (t >> 25)) & 0xffffffff
+        t = (x11 + x10) & 0xffffffff; x8 ^= ((t << 9) | (t >> 23)) & 0xffffffff
+        t = (x8 + x11) & 0xffffffff; x9 ^= ((t << 13) | (t >> 19)) & 0xffffffff
+        t = (x9 + x8) & 0xffffffff; x10 ^= ((t << 18) | (t >> 14)) & 0xffffffff
+        t = (x15 + x14) & 0xffffffff; x12 ^= ((t << 7) | (t >> 25)) & 0xffffffff
+        t = (x12 + x15) & 0xffffffff; x13 ^= ((t << 9) | (t >> 23)) & 0xffffffff
+        t = (x13 + x12) & 0xffffffff; x14 ^= ((t << 13) | (t >> 19)) & 0xffffffff
+        t = (x14 + x13) & 0xffffffff; x15 ^= ((t << 18) | (t >> 14)) & 0xffffffff
+    return [
+        (x0 + b[0]) & 0xffffffff, (x1 + b[1]) & 0xffffffff,
+        (x2 + b[2]) & 0xffffffff, (x3 + b[3]) & 0xffffffff,
+        (x4 + b[4]) & 0xffffffff, (x5 + b[5]) & 0xffffffff,
+        (x6 + b[6]) & 0xffffffff, (x7 + b[7]) & 0xffffffff,
+        (x8 + b[8]) & 0xffffffff, (x9 + b[9]) & 0xffffffff,
+        (x10 + b[10]) & 0xffffffff, (x11 + b[11]) & 0xffffffff,
+        (x12 + b[12]) & 0xffffffff, (x13 + b[13]) & 0xffffffff,
+        (x14 + b[14]) & 0xffffffff, (x15 + b[15]) & 0xffffffff
+    ]
+
+
+def block_mix(b, r):
+    """Apply scrypt BlockMix to a list of 32 * r words."""
+    x = b[-16:]
+    even, odd = [], []
+    for i in range(0, 2 * r, 2):
+        x = salsa20_8([u ^ v for u, v in zip(x, b[16 * i:16 * i + 16])])
+        even.extend(x)
+        x = salsa20_8([u ^ v for u, v in zip(x, b[16 * i + 16:16 * i + 32])])
+        odd.extend(x)
+    return even + odd
+
+
+def ro_mix(b, n, r):
+    """Apply scrypt ROMix to one 128 * r bytes lane."""
+    words = 32 * r
+    x = list(struct.unpack("<%dI" % words, b))
+    v = []
+    for _ in range(n):
+        v.append(x)
+        x = block_mix(x, r)
+    last = (2 * r - 1) * 16
+    for _ in range(n):
+        x = block_mix([u ^ w for u, w in zip(x, v[x[last] & (n - 1)])], r)
+    return struct.pack("<%dI" % words, *x)
+
+
+def lanes(password, salt, r, p):
+    """Derive the p independent 128 * r bytes ROMix input lanes."""
+    b = hashlib.pbkdf2_hmac("sha256", password, salt, 1, p * 128 * r)
+    return [b[128 * r * i:128 * r * (i + 1)] for i in range(p)]
+
+
+def combine(password, mixed, dklen):
+    """Derive the scrypt output key from the mixed lanes."""
+    return hashlib.pbkdf2_hmac("sha256", password, b"".join(mixed), 1, dklen)
+
+
+def scrypt(password, salt, n, r, p, dklen=64):
+    """Compute scrypt serially in pure Python."""
+    if n < 2 or n & (n - 1):
+        raise ValueError("n must be a power of 2 greater than 1")
+    return combine(password, [ro_mix(lane, n, r) for lane in lanes(password, salt, r, p)], dklen)
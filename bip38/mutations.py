@@ -0,0 +1,299 @@
+#!/usr/bin/env python3
+
+# Copyright © 2023-2024, Meheret Tesfaye Batu <meherett.batu@gmail.com>
+# Distributed under the MIT software license, see the accompanying
+# file COPYING or https://opensource.org/license/mit
+
+from typing import (
+    Optional, Sequence, Iterator, Set, Dict, Tuple
+)
+
+import hashlib
+import math
+import unicodedata
+
+from .exceptions import Error
+
+# Mutation rules, in the order their candidates are generated
+RULES: Tuple[str, ...] = ("case", "swap", "delete", "keyboard", "unicode")
+
+# Rows of a US QWERTY keyboard, each row offset by half a key from the one above
+KEYBOARD_ROWS: Tuple[str, ...] = ("1234567890-=", "qwertyuiop[]\\", "asdfghjkl;'", "zxcvbnm,./")
+
+# Characters commonly typed in place of each other by keyboard layouts and input methods
+UNICODE_VARIANTS: Dict[str, str] = {
+    " ": "\u00a0",
+    "\u00a0": " ",
+    "'": "\u2019\u2018`",
+    "\u2019": "'",
+    "\u2018": "'",
+    "\"": "\u201c\u201d",
+    "\u201c": "\"",
+    "\u201d": "\"",
+    "-": "\u2013\u2014",
+    "\u2013": "-",
+    "\u2014": "-",
+    ".": "\u2026"
+}
+
+
+def _keyboard_neighbours() -> Dict[str, str]:
+    neighbours: Dict[str, str] = {}
+    for row, keys in enumerate(KEYBOARD_ROWS):
+        for column, key in enumerate(keys):
+            around: str = keys[max(column - 1, 0):column] + keys[column + 1:column + 2]
+            if row > 0:
+                around += KEYBOARD_ROWS[row - 1][column:column + 2]
+            if row < len(KEYBOARD_ROWS) - 1:
+                around += KEYBOARD_ROWS[row + 1][max(column - 1, 0):column + 1]
+            neighbours[key] = around
+    return neighbours
+
+
+# Adjacent keys of every unshifted key, see KEYBOARD_ROWS
+KEYBOARD_NEIGHBOURS: Dict[str, str] = _keyboard_neighbours()
+
+
+class BloomFilter:
+    """
+    A compact, bounded set of strings, with false positives but no false negatives.
+
+    Membership is kept in a bit array sized for ``capacity`` strings at ``error_rate`` false positives,
+    about 43 bits per string at the default rate. A false positive reports a string that was never added
+    as seen, so deduplicating with the filter can drop a distinct string, at a rate of up to ``error_rate``.
+    Once ``capacity`` strings are added, new strings are reported as unseen without being stored, so the
+    false positive rate never exceeds ``error_rate`` and later duplicates are let through.
+
+    :param capacity: The maximum number of strings stored (default: 1,000,000).
+    :type capacity: int
+    :param error_rate: The false positive rate at capacity (default: 1e-9).
+    :type error_rate: float
+
+    >>> from bip38.mutations import BloomFilter
+    >>> bloom_filter: BloomFilter = BloomFilter(capacity=1000)
+    >>> bloom_filter.add("TestingOneTwoThree"), bloom_filter.add("TestingOneTwoThree")
+    (True, False)
+    """
+
+    __slots__ = ("capacity", "size", "hashes", "count", "_bits")
+
+    capacity: int
+    size: int
+    hashes: int
+    count: int
+
+    def __init__(self, capacity: int = 1_000_000, error_rate: float = 1e-9) -> None:
+
+        if capacity < 1:
+            raise Error("Invalid filter capacity", expected="capacity >= 1", got=capacity)
+        if not 0 < error_rate < 1:
+            raise Error("Invalid filter error rate", expected="0 < error_rate < 1", got=error_rate)
+        self.capacity, self.count = capacity, 0
+        self.size = max(64, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self._bits: bytearray = bytearray((self.size + 7) // 8)
+
+    def _positions(self, item: str) -> Iterator[int]:
+        # Double hashing, the k positions are derived from the two halves of a single digest
+        digest: bytes = hashlib.blake2b(item.encode("utf-8"), digest_size=16).digest()
+        first, second = int.from_bytes(digest[:8], "little"), int.from_bytes(digest[8:], "little") | 1
+        for index in range(self.hashes):
+            yield (first + index * second) % self.size
+
+    def __contains__(self, item: str) -> bool:
+        return all(self._bits[position >> 3] >> (position & 7) & 1 for position in self._positions(item))
+
+    def add(self, item: str) -> bool:
+        """
+        Adds a string, unless the filter is full.
+
+        :param item: The string.
+        :type item: str
+
+        :returns: False if the string was (probably) added before, True otherwise.
+        :rtype: bool
+        """
+
+        positions: Tuple[int, ...] = tuple(self._positions(item))
+        if all(self._bits[position >> 3] >> (position & 7) & 1 for position in positions):
+            return False
+        if self.count < self.capacity:
+            for position in positions:
+                self._bits[position >> 3] |= 1 << (position & 7)
+            self.count += 1
+        return True
+
+    def clear(self) -> None:
+        """
+        Removes every string.
+
+        :returns: None
+        """
+
+        self._bits[:] = bytes(len(self._bits))
+        self.count = 0
+
+    def __len__(self) -> int:
+        return self.count
+
+
+class Mutations:
+    """
+    Lazily generates candidate passphrases around a remembered passphrase, for the typos that were
+    likely made when it was set.
+
+    The remembered passphrase comes first, then every candidate one mutation away, then two away,
+    and so on up to ``depth``. Rules, in order:
+
+    * ``case``: caps lock and the whole passphrase lower or upper cased or capitalized, then a single
+      character with its case flipped.
+    * ``swap``: two adjacent characters swapped.
+    * ``delete``: a single character deleted.
+    * ``keyboard``: a single character replaced by an adjacent key of a US QWERTY keyboard.
+    * ``unicode``: a single character replaced by its variants: without diacritics, its compatibility
+      form (e.g. full-width letters) and typographic lookalikes (e.g. curly quotes, no-break space).
+
+    :class:`bip38.BIP38` normalizes every passphrase to NFC before scrypt, so candidates are yielded NFC
+    normalized and those equal to an earlier one are skipped. The first ``capacity`` distinct candidates
+    are tracked in an exact set, and none of them is ever dropped. Past it, candidates are tracked in a
+    :class:`BloomFilter`, where a false positive drops a distinct candidate, which is then never tested
+    (a fraction of up to ``error_rate`` of them), and once the filter is full too, duplicates are tested
+    again. The order is deterministic, so the stream can be given to :meth:`bip38.recovery.Recovery.run`
+    and resumed from a checkpoint.
+
+    :param passphrase: The remembered passphrase.
+    :type passphrase: str
+    :param rules: Optional mutation rules to apply (default: all of ``RULES``).
+    :type rules: Optional[Sequence[str]]
+    :param depth: The maximum number of mutations per candidate (default: 1).
+    :type depth: int
+    :param capacity: The number of candidates deduplicated exactly, and then by the filter (default: 1,000,000).
+    :type capacity: int
+    :param error_rate: The false positive rate of the deduplication filter past ``capacity`` (default: 1e-9).
+    :type error_rate: float
+
+    >>> from bip38.mutations import Mutations
+    >>> from bip38.recovery import Recovery
+    >>> list(Mutations(passphrase="ab", rules=["case", "swap"]))
+    ['ab', 'AB', 'Ab', 'aB', 'ba']
+    >>> recovery: Recovery = Recovery(encrypted_wif="6PRVWUbkzzsbcVac2qwfssoUJAN1Xhrg6bNk8J7Nzm5H7kxEbn2Nh2ZoGg", workers=1)
+    >>> recovery.run(candidates=Mutations(passphrase="tESTINGoNEtWOtHREE"))["passphrase"]
+    'TestingOneTwoThree'
+    """
+
+    passphrase: str
+    rules: Tuple[str, ...]
+    depth: int
+    capacity: int
+    error_rate: float
+    skipped: int
+
+    def __init__(
+        self,
+        passphrase: str,
+        rules: Optional[Sequence[str]] = None,
+        depth: int = 1,
+        capacity: int = 1_000_000,
+        error_rate: float = 1e-9
+    ) -> None:
+
+        rules = RULES if rules is None else tuple(rules)
+        for rule in rules:
+            if rule not in RULES:
+                raise Error("Invalid mutation rule", expected=list(RULES), got=rule)
+        if depth < 0:
+            raise Error("Invalid mutation depth", expected="depth >= 0", got=depth)
+        if capacity < 1:
+            raise Error("Invalid filter capacity", expected="capacity >= 1", got=capacity)
+        if not 0 < error_rate < 1:
+            raise Error("Invalid filter error rate", expected="0 < error_rate < 1", got=error_rate)
+        self.passphrase, self.rules, self.depth = passphrase, rules, depth
+        self.capacity, self.error_rate = capacity, error_rate
+        self.skipped = 0
+
+    def __iter__(self) -> Iterator[str]:
+        # Every iteration has its own state, so that re-iterating, even concurrently, yields the same stream
+        seen: Set[str] = set()
+        overflow: Optional[BloomFilter] = None
+        self.skipped = 0
+        for distance in range(self.depth + 1):
+            for candidate in self._level(distance):
+                candidate = unicodedata.normalize("NFC", candidate)
+                if candidate in seen:
+                    unseen: bool = False
+                elif len(seen) < self.capacity:
+                    seen.add(candidate)
+                    unseen = True
+                else:
+                    if overflow is None:
+                        overflow = BloomFilter(capacity=self.capacity, error_rate=self.error_rate)
+                    unseen = overflow.add(candidate)
+                if unseen:
+                    yield candidate
+                else:
+                    self.skipped += 1
+
+    def _level(self, distance: int) -> Iterator[str]:
+        # Candidates exactly ``distance`` mutations away, regenerated rather than kept in memory
+        if distance == 0:
+            yield self.passphrase
+            return
+        for candidate in self._level(distance - 1):
+            yield from self.mutate(candidate, self.rules)
+
+    @staticmethod
+    def mutate(passphrase: str, rules: Sequence[str] = RULES) -> Iterator[str]:
+        """
+        Generates the candidates a single mutation away from a passphrase, not deduplicated.
+
+        :param passphrase: The passphrase.
+        :type passphrase: str
+        :param rules: The mutation rules to apply (default: all of ``RULES``).
+        :type rules: Sequence[str]
+
+        :returns: The mutated passphrases.
+        :rtype: Iterator[str]
+
+        >>> from bip38.mutations import Mutations
+        >>> list(Mutations.mutate(passphrase="q1", rules=["keyboard"]))
+        ['w1', '11', '21', 'a1', 'q2', 'qq']
+        """
+
+        for rule in RULES:
+            if rule not in rules:
+                continue
+            if rule == "case":
+                yield from (
+                    passphrase.swapcase(), passphrase.lower(), passphrase.upper(), passphrase.capitalize()
+                )
+                for index, character in enumerate(passphrase):
+                    if character.swapcase() != character:
+                        yield passphrase[:index] + character.swapcase() + passphrase[index + 1:]
+            elif rule == "swap":
+                for index in range(len(passphrase) - 1):
+                    yield passphrase[:index] + passphrase[index + 1] + passphrase[index] + passphrase[index + 2:]
+            elif rule == "delete":
+                for index in range(len(passphrase)):
+                    yield passphrase[:index] + passphrase[index + 1:]
+            elif rule == "keyboard":
+                for index, character in enumerate(passphrase):
+                    for neighbour in KEYBOARD_NEIGHBOURS.get(character.lower(), ""):
+                        if character.isupper():
+                            neighbour = neighbour.upper()
+                        yield passphrase[:index] + neighbour + passphrase[index + 1:]
+            else:
+                for index, character in enumerate(passphrase):
+                    for variant in _unicode_variants(character):
+                        yield passphrase[:index] + variant + passphrase[index + 1:]
+
+
+def _unicode_variants(character: str) -> Iterator[str]:
+    stripped: str = "".join(
+        mark for mark in unicodedata.normalize("NFD", character) if not unicodedata.combining(mark)
+    )
+    if stripped != character:
+        yield stripped
+    compatibility: str = unicodedata.normalize("NFKC", character)
+    if compatibility not in (character, stripped):
+        yield compatibility
+    yield from UNICODE_VARIANTS.get(character, "")
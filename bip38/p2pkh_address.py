@@ -5,15 +5,19 @@
 # file COPYING or https://opensource.org/license/mit
 
 from typing import (
-    Any, Union
+    Any, Union, Iterable, List
 )
 
 from .libs.base58 import (
-    ensure_string, check_encode, check_decode
+    ensure_string, check_encode, check_decode, check_encode_many
+)
+from .secp256k1 import (
+    PublicKey, CompactPublicKey
 )
-from .secp256k1 import PublicKey
 from .cryptocurrencies import Bitcoin
-from .crypto import hash160
+from .crypto import (
+    hash160, hash160_many
+)
 from .exceptions import AddressError
 from .utils import (
     get_bytes, integer_to_bytes, bytes_to_string
@@ -26,7 +30,7 @@ class P2PKHAddress:
     alphabet: str = Bitcoin.ALPHABET
 
     @classmethod
-    def encode(cls, public_key: Union[bytes, str, PublicKey], **kwargs: Any) -> str:
+    def encode(cls, public_key: Union[bytes, str, PublicKey, CompactPublicKey], **kwargs: Any) -> str:
         """
         Encode a public key into an address using a specified address prefix and alphabet.
 
@@ -46,7 +50,7 @@ class P2PKHAddress:
             kwargs.get("address_prefix", cls.address_prefix)
         )
 
-        if not isinstance(public_key, PublicKey):
+        if not isinstance(public_key, (PublicKey, CompactPublicKey)):
             public_key: PublicKey = PublicKey.from_bytes(get_bytes(public_key))
 
         public_key_hash: bytes = hash160(
@@ -61,6 +65,43 @@ class P2PKHAddress:
             )
         ))
 
+    @classmethod
+    def encode_many(cls, public_keys: Iterable[Union[bytes, str, PublicKey, CompactPublicKey]], **kwargs: Any) -> List[str]:
+        """
+        Encode many public keys into addresses, hashing and base58check encoding the equal-width payloads as batches.
+
+        :param public_keys: The public keys to encode.
+        :type public_keys: Iterable[Union[bytes, str, PublicKey, CompactPublicKey]]
+        :param kwargs: Additional keyword arguments, like :meth:`encode`.
+        :type kwargs: Any
+
+        :return: The encoded addresses, in the same order as the public keys.
+        :rtype: List[str]
+
+        >>> from bip38.p2pkh_address import P2PKHAddress
+        >>> P2PKHAddress.encode_many(["02d2ce831dd06e5c1f5b1121ef34c2af4bcb01b126e309234adbc3561b60c9360e"] * 2, public_key_type="uncompressed")
+        ['1Jq6MksXQVWzrznvZzxkV6oY57oWXD9TXB', '1Jq6MksXQVWzrznvZzxkV6oY57oWXD9TXB']
+        """
+
+        address_prefix: bytes = integer_to_bytes(
+            kwargs.get("address_prefix", cls.address_prefix)
+        )
+        raws: List[bytes] = []
+        for public_key in public_keys:
+            if not isinstance(public_key, (PublicKey, CompactPublicKey)):
+                public_key: PublicKey = PublicKey.from_bytes(get_bytes(public_key))
+            raws.append(
+                public_key.raw_compressed()
+                if kwargs.get("public_key_type", "compressed") == "compressed" else
+                public_key.raw_uncompressed()
+            )
+
+        return check_encode_many(
+            [address_prefix + public_key_hash for public_key_hash in hash160_many(raws)], alphabet=kwargs.get(
+                "alphabet", cls.alphabet
+            )
+        )
+
     @classmethod
     def decode(cls, address: str, **kwargs: Any) -> str:
         """
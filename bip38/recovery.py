@@ -0,0 +1,265 @@
+#!/usr/bin/env python3
+
+# Copyright © 2023-2024, Meheret Tesfaye Batu <meherett.batu@gmail.com>
+# Distributed under the MIT software license, see the accompanying
+# file COPYING or https://opensource.org/license/mit
+
+from typing import (
+    Type, Union, Optional, Iterable, Iterator, Callable, Deque, List, Tuple, Any
+)
+from collections import deque
+from concurrent.futures import (
+    Future, ProcessPoolExecutor
+)
+from itertools import islice
+
+import json
+import os
+import tempfile
+import time
+
+from .bip38 import BIP38
+from .cache import PassFactorCache
+from .cryptocurrencies import (
+    ICryptocurrency, Bitcoin
+)
+from .exceptions import (
+    Error, WIFError
+)
+
+# Checkpoint file format version, see Recovery.save
+CHECKPOINT_VERSION: int = 1
+
+
+class Recovery:
+    """
+    Recovers the passphrase of a BIP38 encrypted WIF (Wallet Import Format) from a stream of candidate passphrases.
+
+    Candidates are tested in chunks across a process pool with :meth:`bip38.BIP38.check_passphrase`, which
+    rules out a wrong passphrase on the address hash check without raising, so non-EC and EC-multiplied keys
+    alike only cost their scrypt runs per candidate. Every worker process builds one :class:`bip38.BIP38`
+    with the same backends and cache size. Throughput is reported through a progress callback, and the
+    number of candidates tested is checkpointed to a file, so that an interrupted run resumes where it stopped
+    when given the same candidate stream. Checkpoints never contain passphrases.
+
+    Worker processes use the shared generator table file named by ``BIP38_SECP256K1_TABLE``, when set
+    (see :func:`bip38.secp256k1.ecmult.generator_table`).
+
+    :param encrypted_wif: The encrypted WIF to recover.
+    :type encrypted_wif: str
+    :param cryptocurrency: The cryptocurrency class of the key (default: Bitcoin).
+    :type cryptocurrency: Type[ICryptocurrency]
+    :param network: The network of the key (default: 'mainnet').
+    :type network: str
+    :param workers: Optional number of worker processes (default: CPU count).
+    :type workers: Optional[int]
+    :param chunk_size: The number of candidates tested per task (default: 16).
+    :type chunk_size: int
+    :param checkpoint: Optional checkpoint file path, read on start and written as the run progresses.
+    :type checkpoint: Optional[str]
+    :param checkpoint_interval: The minimum number of seconds between checkpoint writes (default: 30.0).
+    :type checkpoint_interval: float
+    :param pass_factor_cache: Optional EC-multiply pass factor cache, see :class:`bip38.BIP38` (default: None).
+    :type pass_factor_cache: Optional[PassFactorCache]
+    :param scrypt_backend: Optional scrypt backend name or engine, see :class:`bip38.BIP38` (default: the fastest).
+    :type scrypt_backend: Optional[Union[str, Any]]
+    :param aes_backend: Optional AES backend name or backend, see :class:`bip38.BIP38` (default: the selected one).
+    :type aes_backend: Optional[Union[str, Any]]
+
+    >>> from bip38.recovery import Recovery
+    >>> recovery: Recovery = Recovery(encrypted_wif="6PRVWUbkzzsbcVac2qwfssoUJAN1Xhrg6bNk8J7Nzm5H7kxEbn2Nh2ZoGg", workers=1)
+    >>> recovery.run(candidates=["TestingOneTwo", "TestingOneTwoThree"])["passphrase"]
+    'TestingOneTwoThree'
+    """
+
+    encrypted_wif: str
+    cryptocurrency: Type[ICryptocurrency]
+    network: str
+    workers: int
+    chunk_size: int
+    checkpoint: Optional[str]
+    checkpoint_interval: float
+    tested: int
+
+    def __init__(
+        self,
+        encrypted_wif: str,
+        cryptocurrency: Type[ICryptocurrency] = Bitcoin,
+        network: str = "mainnet",
+        workers: Optional[int] = None,
+        chunk_size: int = 16,
+        checkpoint: Optional[str] = None,
+        checkpoint_interval: float = 30.0,
+        pass_factor_cache: Optional[PassFactorCache] = None,
+        scrypt_backend: Optional[Union[str, Any]] = None,
+        aes_backend: Optional[Union[str, Any]] = None
+    ) -> None:
+
+        bip38: BIP38 = BIP38(
+            cryptocurrency=cryptocurrency,
+            network=network,
+            pass_factor_cache=pass_factor_cache,
+            scrypt_backend=scrypt_backend,
+            aes_backend=aes_backend
+        )
+        if not bip38.validate_encrypted_wifs([encrypted_wif])[0]:
+            raise WIFError("Invalid encrypted WIF (Wallet Import Format)")
+        if chunk_size < 1:
+            raise Error("Invalid chunk size", expected="chunk_size >= 1", got=chunk_size)
+        self.encrypted_wif, self.cryptocurrency, self.network = encrypted_wif, cryptocurrency, network
+        self.workers, self.chunk_size = (workers or os.cpu_count() or 1), chunk_size
+        self.checkpoint, self.checkpoint_interval = checkpoint, checkpoint_interval
+        self.tested = self.load() if checkpoint is not None else 0
+        self._bip38: BIP38 = bip38
+
+    def load(self) -> int:
+        """
+        Reads the number of candidates already tested from the checkpoint file.
+
+        :returns: The number of tested candidates, 0 when the checkpoint file does not exist.
+        :rtype: int
+        """
+
+        try:
+            with open(self.checkpoint, "r", encoding="utf-8") as file:
+                state: dict = json.load(file)
+        except FileNotFoundError:
+            return 0
+        except ValueError as ex:
+            raise Error("Invalid recovery checkpoint file") from ex
+        if state.get("version") != CHECKPOINT_VERSION:
+            raise Error("Invalid recovery checkpoint version", expected=CHECKPOINT_VERSION, got=state.get("version"))
+        if (state.get("encrypted_wif"), state.get("network")) != (self.encrypted_wif, self.network):
+            raise Error(
+                "Recovery checkpoint of another key", expected=self.encrypted_wif, got=state.get("encrypted_wif")
+            )
+        return int(state["tested"])
+
+    def save(self) -> None:
+        """
+        Atomically writes the number of candidates tested to the checkpoint file.
+
+        :returns: None
+        """
+
+        directory: str = os.path.dirname(os.path.abspath(self.checkpoint))
+        descriptor, temporary = tempfile.mkstemp(dir=directory, prefix=".recovery-")
+        try:
+            with os.fdopen(descriptor, "w", encoding="utf-8") as file:
+                json.dump(dict(
+                    version=CHECKPOINT_VERSION,
+                    encrypted_wif=self.encrypted_wif,
+                    network=self.network,
+                    tested=self.tested
+                ), file)
+            os.replace(temporary, self.checkpoint)
+        except BaseException:
+            os.unlink(temporary)
+            raise
+
+    def run(
+        self,
+        candidates: Iterable[str],
+        progress: Optional[Callable[[dict], None]] = None,
+        progress_interval: float = 5.0
+    ) -> Optional[dict]:
+        """
+        Tests candidate passphrases in order until one decrypts the encrypted WIF.
+
+        When resuming from a checkpoint, the candidates already tested are skipped, so the stream must
+        yield the same candidates in the same order as the interrupted run.
+
+        :param candidates: The candidate passphrases.
+        :type candidates: Iterable[str]
+        :param progress: Optional callback, called with the progress at most every ``progress_interval``
+            seconds and when the run ends: the candidates tested in total and in this run, the elapsed
+            seconds and the candidates per second of this run.
+        :type progress: Optional[Callable[[dict], None]]
+        :param progress_interval: The minimum number of seconds between progress reports (default: 5.0).
+        :type progress_interval: float
+
+        :returns: The passphrase and the detailed private key info like :meth:`bip38.BIP38.decrypt`, or None
+            when no candidate matches.
+        :rtype: Optional[dict]
+        """
+
+        def chunks() -> Iterator[List[str]]:
+            stream: Iterator[str] = islice(iter(candidates), self.tested, None)
+            while True:
+                chunk: List[str] = list(islice(stream, self.chunk_size))
+                if not chunk:
+                    return
+                yield chunk
+
+        start: float = time.monotonic()
+        tested: int = self.tested
+        reported, saved = start, start
+
+        def report() -> None:
+            if progress is not None:
+                elapsed: float = time.monotonic() - start
+                progress(dict(
+                    tested=self.tested,
+                    new=self.tested - tested,
+                    elapsed=elapsed,
+                    rate=(self.tested - tested) / elapsed if elapsed > 0 else 0.0
+                ))
+
+        found: Optional[str] = None
+        results: Iterator[Tuple[List[str], Optional[int]]] = self._map(chunks())
+        try:
+            for chunk, index in results:
+                if index is not None:
+                    found = chunk[index]
+                    self.tested += index + 1
+                    break
+                self.tested += len(chunk)
+                now: float = time.monotonic()
+                if now - reported >= progress_interval:
+                    report()
+                    reported = now
+                if self.checkpoint is not None and now - saved >= self.checkpoint_interval:
+                    self.save()
+                    saved = now
+        finally:
+            results.close()
+            if self.checkpoint is not None:
+                self.save()
+        report()
+
+        if found is None:
+            return None
+        return dict(passphrase=found, **self._bip38.decrypt(
+            encrypted_wif=self.encrypted_wif, passphrase=found, detail=True
+        ))
+
+    def _map(self, chunks: Iterator[List[str]]) -> Iterator[Tuple[List[str], Optional[int]]]:
+        # Chunks are submitted ahead of the results, a bounded number at a time, and yielded in order
+        if self.workers == 1:
+            for chunk in chunks:
+                yield chunk, _test(self._bip38, self.encrypted_wif, chunk)
+            return
+
+        initializer, initargs = self._bip38.worker_initializer()
+        executor: ProcessPoolExecutor = ProcessPoolExecutor(
+            max_workers=self.workers, initializer=initializer, initargs=initargs
+        )
+        pending: Deque[Tuple[List[str], Future]] = deque()
+        try:
+            for chunk in chunks:
+                pending.append((chunk, executor.submit(BIP38.in_worker, _test, self.encrypted_wif, chunk)))
+                if len(pending) >= self.workers * 2:
+                    chunk, future = pending.popleft()
+                    yield chunk, future.result()
+            while pending:
+                chunk, future = pending.popleft()
+                yield chunk, future.result()
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+
+def _test(bip38: BIP38, encrypted_wif: str, candidates: List[str]) -> Optional[int]:
+    for index, candidate in enumerate(candidates):
+        if bip38.check_passphrase(encrypted_wif=encrypted_wif, passphrase=candidate):
+            return index
+    return None
@@ -6,6 +6,9 @@
 
 from ecdsa.ecdsa import generator_secp256k1
 
+from .keys import (
+    CompactPublicKey, CompactPrivateKey
+)
 from .point import Point
 from .public_key import PublicKey
 from .private_key import PrivateKey
@@ -0,0 +1,705 @@
+#!/usr/bin/env python3
+
+# Copyright © 2023-2024, Meheret Tesfaye Batu <meherett.batu@gmail.com>
+# Distributed under the MIT software license, see the accompanying
+# file COPYING or https://opensource.org/license/mit
+
+from typing import (
+    Optional, Sequence, List, Dict, Tuple, Union
+)
+
+import hashlib
+import mmap
+import os
+import secrets
+import struct
+import tempfile
+import threading
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    fcntl = None
+
+from ..exceptions import Secp256k1Error
+
+# secp256k1 domain parameters (SEC 2, section 2.4.1), y ** 2 = x ** 3 + 7 over GF(P)
+P: int = 0xfffffffffffffffffffffffffffffffffffffffffffffffffffffffefffffc2f
+N: int = 0xfffffffffffffffffffffffffffffffebaaedce6af48a03bbfd25e8cd0364141
+B: int = 7
+GX: int = 0x79be667ef9dcbbac55a06295ce870b07029bfcdb2dce28d959f2815b16f81798
+GY: int = 0x483ada7726a3c4655da4fbfc0e1108a8fd17b448a68554199c47d08ffb10d4b8
+# P = 3 (mod 4), so the square root of a quadratic residue a is a ** ((P + 1) / 4)
+SQRT_EXPONENT: int = (P + 1) // 4
+
+# GLV endomorphism (x, y) -> (BETA * x, y) = LAMBDA * (x, y), and the short basis
+# (A1, B1), (A2, B2) of the lattice of (k1, k2) with k1 + k2 * LAMBDA = 0 (mod N)
+BETA: int = 0x7ae96a2b657c07106e64479eac3434e99cf0497512f58995c1396c28719501ee
+LAMBDA: int = 0x5363ad4cc05c30e0a5261c028812645a122e22ea20816678df02967c1b23bd72
+A1: int = 0x3086d221a7d46bcde86c90e49284eb15
+B1: int = -0xe4437ed6010e88286f547fa90abfe4c3
+A2: int = 0x114ca50f7a8e2f3f657c1108d9d44cfd8
+B2: int = A1
+# Width of the wNAF recoding of both GLV half scalars, odd multiples up to 2 ** (GLV_WINDOW - 1) - 1
+GLV_WINDOW: int = 5
+
+# Bits per signed window of the in-memory generator table, every window holds
+# the affine multiples 1 .. 2 ** (WINDOW - 1) of 2 ** (WINDOW * i) * G, and of
+# the larger table files shared between processes
+WINDOW: int = 8
+FILE_WINDOW: int = 12
+# Bits per signed window of the in-memory tables of other bases, see Point.precomputed
+PRECOMPUTED_WINDOW: int = 5
+
+# Generator table file layout: header (magic, format version, window bits, windows,
+# points per window, SHA-256 of the payload), then 64 bytes big-endian x || y per point
+TABLE_MAGIC: bytes = b"BIP38GTB"
+TABLE_VERSION: int = 1
+TABLE_HEADER: struct.Struct = struct.Struct(">8sIIII32s")
+# Random points of a table checked against multiples of the generator when it is verified
+TABLE_SAMPLES: int = 4
+# Environment variable naming a table file to use instead of the in-memory table
+TABLE_ENVIRONMENT: str = "BIP38_SECP256K1_TABLE"
+
+Affine = Tuple[int, int]
+Jacobian = Tuple[int, int, int]
+
+# Jacobian point at infinity, any point with Z == 0
+INFINITY: Jacobian = (0, 1, 0)
+
+
+def jacobian_double(point: Jacobian) -> Jacobian:
+    """
+    Doubles a Jacobian point, with the a = 0 formulas (dbl-2009-l).
+
+    :param point: The Jacobian point (X, Y, Z).
+    :type point: Tuple[int, int, int]
+
+    :returns: The Jacobian point 2 * point.
+    :rtype: Tuple[int, int, int]
+    """
+
+    x, y, z = point
+    if not z or not y:
+        return INFINITY
+    a = x * x % P
+    b = y * y % P
+    c = b * b % P
+    d = 2 * ((x + b) ** 2 - a - c) % P
+    e = 3 * a
+    x3 = (e * e - 2 * d) % P
+    return x3, (e * (d - x3) - 8 * c) % P, 2 * y * z % P
+
+
+def jacobian_add_affine(point: Jacobian, other: Affine) -> Jacobian:
+    """
+    Adds an affine point to a Jacobian point (mixed addition, Z2 = 1).
+
+    :param point: The Jacobian point (X1, Y1, Z1).
+    :type point: Tuple[int, int, int]
+    :param other: The affine point (x2, y2).
+    :type other: Tuple[int, int]
+
+    :returns: The Jacobian point point + other.
+    :rtype: Tuple[int, int, int]
+    """
+
+    x1, y1, z1 = point
+    if not z1:
+        return other[0], other[1], 1
+    zz = z1 * z1 % P
+    h = (other[0] * zz - x1) % P
+    r = (other[1] * zz * z1 - y1) % P
+    if not h:
+        return jacobian_double(point) if not r else INFINITY
+    hh = h * h % P
+    hhh = h * hh % P
+    v = x1 * hh % P
+    x3 = (r * r - hhh - 2 * v) % P
+    return x3, (r * (v - x3) - y1 * hhh) % P, z1 * h % P
+
+
+def jacobian_add(point: Jacobian, other: Jacobian) -> Jacobian:
+    """
+    Adds two Jacobian points (add-2007-bl).
+
+    :param point: The Jacobian point (X1, Y1, Z1).
+    :type point: Tuple[int, int, int]
+    :param other: The Jacobian point (X2, Y2, Z2).
+    :type other: Tuple[int, int, int]
+
+    :returns: The Jacobian point point + other.
+    :rtype: Tuple[int, int, int]
+    """
+
+    x1, y1, z1 = point
+    x2, y2, z2 = other
+    if not z1:
+        return other
+    if not z2:
+        return point
+    z1z1 = z1 * z1 % P
+    z2z2 = z2 * z2 % P
+    u1 = x1 * z2z2 % P
+    s1 = y1 * z2 * z2z2 % P
+    h = (x2 * z1z1 - u1) % P
+    r = (y2 * z1 * z1z1 - s1) % P
+    if not h:
+        return jacobian_double(point) if not r else INFINITY
+    hh = h * h % P
+    hhh = h * hh % P
+    v = u1 * hh % P
+    x3 = (r * r - hhh - 2 * v) % P
+    return x3, (r * (v - x3) - s1 * hhh) % P, z1 * z2 * h % P
+
+
+def to_affine(point: Jacobian) -> Optional[Affine]:
+    """
+    Converts a Jacobian point to affine coordinates.
+
+    :param point: The Jacobian point (X, Y, Z).
+    :type point: Tuple[int, int, int]
+
+    :returns: The affine point (x, y), or None for the point at infinity.
+    :rtype: Optional[Tuple[int, int]]
+    """
+
+    x, y, z = point
+    if not z:
+        return None
+    if z == 1:
+        return x, y
+    zi = pow(z, -1, P)
+    zzi = zi * zi % P
+    return x * zzi % P, y * zzi * zi % P
+
+
+def batch_to_affine(points: Sequence[Jacobian]) -> List[Optional[Affine]]:
+    """
+    Converts many Jacobian points to affine coordinates with a single field inversion
+    (Montgomery's simultaneous inversion trick).
+
+    :param points: The Jacobian points.
+    :type points: Sequence[Tuple[int, int, int]]
+
+    :returns: The affine points, None for the points at infinity.
+    :rtype: List[Optional[Tuple[int, int]]]
+    """
+
+    prefix: List[int] = []
+    acc: int = 1
+    for _, _, z in points:
+        prefix.append(acc)
+        if z:
+            acc = acc * z % P
+    inverse: int = pow(acc, -1, P)
+    result: List[Optional[Affine]] = [None] * len(points)
+    for index in range(len(points) - 1, -1, -1):
+        x, y, z = points[index]
+        if not z:
+            continue
+        zi = inverse * prefix[index] % P
+        inverse = inverse * z % P
+        zzi = zi * zi % P
+        result[index] = (x * zzi % P, y * zzi * zi % P)
+    return result
+
+
+def decompress(point: bytes) -> Affine:
+    """
+    Decompresses a 33 bytes SEC1 compressed point with a single modular exponentiation.
+
+    :param point: The compressed point, 0x02 or 0x03 (parity of y) and the 32 bytes big-endian x.
+    :type point: bytes
+
+    :returns: The affine point (x, y).
+    :rtype: Tuple[int, int]
+
+    >>> from bip38.secp256k1.ecmult import decompress, GX, GY
+    >>> decompress(bytes.fromhex("0279be667ef9dcbbac55a06295ce870b07029bfcdb2dce28d959f2815b16f81798")) == (GX, GY)
+    True
+    """
+
+    if len(point) != 33 or point[0] not in (2, 3):
+        raise Secp256k1Error("Invalid compressed point bytes")
+    x: int = int.from_bytes(point[1:], "big")
+    if x >= P:
+        raise Secp256k1Error("Invalid compressed point bytes")
+    y_squared: int = (x * x * x + B) % P
+    y: int = pow(y_squared, SQRT_EXPONENT, P)
+    if y * y % P != y_squared:
+        raise Secp256k1Error("Invalid compressed point bytes")
+    return x, (y if y & 1 == point[0] & 1 else P - y)
+
+
+def decompress_many(points: Sequence[bytes]) -> List[Affine]:
+    """
+    Decompresses many 33 bytes SEC1 compressed points, once per distinct encoding.
+
+    :param points: The compressed points.
+    :type points: Sequence[bytes]
+
+    :returns: The affine points, in the same order.
+    :rtype: List[Tuple[int, int]]
+    """
+
+    decompressed: Dict[bytes, Affine] = {}
+    for point in points:
+        point = bytes(point)
+        if point not in decompressed:
+            decompressed[point] = decompress(point)
+    return [decompressed[bytes(point)] for point in points]
+
+
+def glv_split(scalar: int) -> Tuple[int, int]:
+    """
+    Splits a scalar into two half-length scalars with the GLV endomorphism.
+
+    :param scalar: The scalar, reduced modulo the group order.
+    :type scalar: int
+
+    :returns: The signed scalars (k1, k2) of about 128 bits, with k1 + k2 * LAMBDA = scalar (mod N).
+    :rtype: Tuple[int, int]
+
+    >>> from bip38.secp256k1.ecmult import glv_split, LAMBDA, N
+    >>> k1, k2 = glv_split(0xdeadbeef * 2 ** 200)
+    >>> (k1 + k2 * LAMBDA) % N == 0xdeadbeef * 2 ** 200 % N
+    True
+    """
+
+    scalar %= N
+    # Rounded divisions, c1 = round(B2 * k / N) and c2 = round(-B1 * k / N)
+    c1 = (B2 * scalar + N // 2) // N
+    c2 = (-B1 * scalar + N // 2) // N
+    return scalar - c1 * A1 - c2 * A2, -c1 * B1 - c2 * B2
+
+
+def wnaf(scalar: int, width: int) -> List[int]:
+    """
+    Recodes a non-negative scalar into its width-w non-adjacent form.
+
+    :param scalar: The non-negative scalar.
+    :type scalar: int
+    :param width: The window width, at least 2.
+    :type width: int
+
+    :returns: The digits, least significant first, each zero or odd with absolute value below 2 ** (width - 1).
+    :rtype: List[int]
+
+    >>> from bip38.secp256k1.ecmult import wnaf
+    >>> wnaf(7, 3)
+    [-1, 0, 0, 1]
+    """
+
+    digits: List[int] = []
+    size, half, mask = 1 << width, 1 << (width - 1), (1 << width) - 1
+    while scalar:
+        digit = 0
+        if scalar & 1:
+            digit = scalar & mask
+            if digit >= half:
+                digit -= size
+            scalar -= digit
+        digits.append(digit)
+        scalar >>= 1
+    return digits
+
+
+def _odd_multiples(point: Affine, count: int) -> List[Affine]:
+    doubled: Jacobian = jacobian_double((point[0], point[1], 1))
+    multiples: List[Jacobian] = [(point[0], point[1], 1)]
+    for _ in range(count - 1):
+        multiples.append(jacobian_add(multiples[-1], doubled))
+    return batch_to_affine(multiples)
+
+
+def multiply(point: Affine, scalar: int) -> Jacobian:
+    """
+    Multiplies an arbitrary point by a scalar, with the GLV endomorphism and wNAF.
+
+    The scalar is split into two 128 bits halves, so the two interleaved wNAF chains only
+    need half the doublings of a plain double-and-add, and the odd multiples of the point
+    give those of its endomorphism image for a multiplication by BETA each.
+
+    :param point: The affine point (x, y), on the curve.
+    :type point: Tuple[int, int]
+    :param scalar: The scalar, reduced modulo the group order.
+    :type scalar: int
+
+    :returns: The Jacobian point scalar * point.
+    :rtype: Tuple[int, int, int]
+
+    >>> from bip38.secp256k1.ecmult import multiply, to_affine, generator_multiply, GX, GY
+    >>> to_affine(multiply((GX, GY), 0xdeadbeef)) == generator_multiply(0xdeadbeef)
+    True
+    """
+
+    k1, k2 = glv_split(scalar)
+    count: int = 1 << (GLV_WINDOW - 2)
+    table: List[Affine] = _odd_multiples(point, count)
+    chains: List[Tuple[List[int], List[Affine], List[Affine]]] = []
+    for k, beta in ((k1, 1), (k2, BETA)):
+        if not k:
+            continue
+        # (x, y) -> (BETA * x, y) maps the odd multiples of point onto those of LAMBDA * point
+        positive: List[Affine] = [(x * beta % P, y) for x, y in table]
+        negative: List[Affine] = [(x, P - y) for x, y in positive]
+        if k < 0:
+            k, positive, negative = -k, negative, positive
+        chains.append((wnaf(k, GLV_WINDOW), positive, negative))
+
+    # Doublings inlined, the accumulator (x, y, z) starts at infinity
+    x, y, z = INFINITY
+    for index in range(max((len(digits) for digits, _, _ in chains), default=0) - 1, -1, -1):
+        if z:
+            a = x * x % P
+            b = y * y % P
+            c = b * b % P
+            d = 2 * ((x + b) ** 2 - a - c) % P
+            e = 3 * a
+            z = 2 * y * z % P
+            x = (e * e - 2 * d) % P
+            y = (e * (d - x) - 8 * c) % P
+        for digits, positive, negative in chains:
+            if index < len(digits):
+                digit = digits[index]
+                if digit > 0:
+                    x, y, z = jacobian_add_affine((x, y, z), positive[digit >> 1])
+                elif digit < 0:
+                    x, y, z = jacobian_add_affine((x, y, z), negative[-digit >> 1])
+    return x, y, z
+
+
+class GeneratorTable:
+    """
+    A signed window fixed-base table of the secp256k1 generator (or, built in memory, of any other base).
+
+    The affine points are kept serialized in one flat buffer, either in memory or a read-only
+    ``mmap`` of a table file, so that every process opening the same file (or forked after it
+    was opened) shares one copy through the page cache. Table files are versioned and carry a
+    SHA-256 checksum of their payload. The checksum only proves the payload is intact, so when a
+    table is loaded its first point is also checked to be the generator, and a few random points
+    to be the multiples of the generator they stand for.
+
+    :param data: The serialized table, header included.
+    :type data: Union[bytes, mmap.mmap]
+    :param verify: Whether to verify the payload checksum and points (default: True).
+    :type verify: bool
+
+    >>> from bip38.secp256k1.ecmult import GeneratorTable, GX, GY
+    >>> GeneratorTable.build(window=4).multiply(1) == (GX, GY)
+    True
+    """
+
+    window: int
+    windows: int
+    count: int
+    base: Affine
+
+    def __init__(self, data: Union[bytes, mmap.mmap], verify: bool = True) -> None:
+
+        if len(data) < TABLE_HEADER.size:
+            raise Secp256k1Error("Invalid generator table", expected=f">= {TABLE_HEADER.size} bytes", got=len(data))
+        magic, version, window, windows, count, checksum = TABLE_HEADER.unpack(data[:TABLE_HEADER.size])
+        if magic != TABLE_MAGIC:
+            raise Secp256k1Error("Invalid generator table magic", expected=TABLE_MAGIC, got=magic)
+        if version != TABLE_VERSION:
+            raise Secp256k1Error("Unsupported generator table version", expected=TABLE_VERSION, got=version)
+        if not 2 <= window <= 16 or windows != -(-257 // window) or count != 1 << (window - 1) or \
+                len(data) != TABLE_HEADER.size + windows * count * 64:
+            raise Secp256k1Error("Invalid generator table layout")
+        if verify and hashlib.sha256(data[TABLE_HEADER.size:]).digest() != checksum:
+            raise Secp256k1Error("Invalid generator table checksum")
+        self.window, self.windows, self.count, self.base = window, windows, count, (GX, GY)
+        self._data: Union[bytes, mmap.mmap] = data
+        if verify:
+            self._verify_points()
+
+    def _point(self, index: int) -> Affine:
+        offset: int = TABLE_HEADER.size + index * 64
+        return (
+            int.from_bytes(self._data[offset:offset + 32], "big"),
+            int.from_bytes(self._data[offset + 32:offset + 64], "big")
+        )
+
+    def _verify_points(self) -> None:
+        # Point i * count + j is (j + 1) * 2 ** (window * i) * G, recomputed with the GLV multiplication
+        for index in [0] + [secrets.randbelow(self.windows * self.count) for _ in range(TABLE_SAMPLES)]:
+            window, multiple = divmod(index, self.count)
+            if self._point(index) != to_affine(multiply((GX, GY), (multiple + 1) << (self.window * window))):
+                raise Secp256k1Error("Invalid generator table point", got=index)
+
+    @classmethod
+    def build(cls, window: int = WINDOW, base: Affine = (GX, GY)) -> "GeneratorTable":
+        """
+        Computes a generator table in memory.
+
+        :param window: The bits per signed window, from 2 to 16 (default: WINDOW).
+        :type window: int
+        :param base: The affine base point (default: the generator).
+        :type base: Tuple[int, int]
+
+        :returns: The generator table.
+        :rtype: GeneratorTable
+        """
+
+        if not 2 <= window <= 16:
+            raise Secp256k1Error("Invalid generator table window", expected="2 <= window <= 16", got=window)
+        windows, count = -(-257 // window), 1 << (window - 1)
+        payload: List[bytes] = []
+        # Base of the current window, 2 ** (window * i) * base
+        point: Affine = base
+        for _ in range(windows):
+            multiples: List[Jacobian] = [(point[0], point[1], 1)]
+            for _ in range(count - 1):
+                multiples.append(jacobian_add_affine(multiples[-1], point))
+            # 2 ** window * point, the base of the next window, is twice the last multiple
+            multiples.append(jacobian_double(multiples[-1]))
+            points: List[Affine] = batch_to_affine(multiples)
+            point = points.pop()
+            payload.extend(x.to_bytes(32, "big") + y.to_bytes(32, "big") for x, y in points)
+        data: bytes = b"".join(payload)
+        table: GeneratorTable = cls(TABLE_HEADER.pack(
+            TABLE_MAGIC, TABLE_VERSION, window, windows, count, hashlib.sha256(data).digest()
+        ) + data, verify=False)
+        table.base = base
+        return table
+
+    @classmethod
+    def load(cls, path: str, verify: bool = True) -> "GeneratorTable":
+        """
+        Maps a generator table file read-only into memory.
+
+        :param path: The table file path.
+        :type path: str
+        :param verify: Whether to verify the payload checksum and points (default: True).
+        :type verify: bool
+
+        :returns: The generator table backed by the file.
+        :rtype: GeneratorTable
+        """
+
+        with open(path, "rb") as file:
+            data: mmap.mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            return cls(data, verify=verify)
+        except Secp256k1Error:
+            data.close()
+            raise
+
+    @classmethod
+    def open(cls, path: str, window: int = FILE_WINDOW) -> "GeneratorTable":
+        """
+        Maps a generator table file, building and saving it first if it is missing or invalid.
+
+        Concurrent callers serialize on an exclusive lock next to the file, so a cold-started
+        pool builds the table once and every other process only maps the saved file.
+
+        :param path: The table file path.
+        :type path: str
+        :param window: The bits per signed window of a table to build (default: FILE_WINDOW).
+        :type window: int
+
+        :returns: The generator table backed by the file.
+        :rtype: GeneratorTable
+        """
+
+        try:
+            return cls.load(path)
+        except (OSError, ValueError, Secp256k1Error):
+            pass
+        directory: str = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        with open(path + ".lock", "a+b") as lock:
+            if fcntl is not None:
+                fcntl.flock(lock.fileno(), fcntl.LOCK_EX)
+            try:
+                # Another process may have saved it while this one was waiting for the lock
+                return cls.load(path)
+            except (OSError, ValueError, Secp256k1Error):
+                cls.build(window=window).save(path)
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock.fileno(), fcntl.LOCK_UN)
+        return cls.load(path)
+
+    def save(self, path: str) -> None:
+        """
+        Writes the table to a file atomically, through a temporary file renamed over it.
+
+        :param path: The table file path.
+        :type path: str
+
+        :returns: None
+        """
+
+        if self.base != (GX, GY):
+            raise Secp256k1Error("Only generator tables can be saved")
+        descriptor, temporary = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)), suffix=".tmp")
+        try:
+            with os.fdopen(descriptor, "wb") as file:
+                file.write(self._data[:])
+            os.chmod(temporary, 0o644)
+            os.replace(temporary, path)
+        except BaseException:
+            os.unlink(temporary)
+            raise
+
+    def close(self) -> None:
+        """
+        Unmaps a file backed table.
+
+        :returns: None
+        """
+
+        if isinstance(self._data, mmap.mmap):
+            self._data.close()
+
+    def multiply(self, scalar: int) -> Optional[Affine]:
+        """
+        Multiplies the base by a scalar.
+
+        :param scalar: The scalar, reduced modulo the group order.
+        :type scalar: int
+
+        :returns: The affine point scalar * base, or None for the point at infinity.
+        :rtype: Optional[Tuple[int, int]]
+        """
+
+        return to_affine(self.multiply_jacobian(scalar))
+
+    def multiply_jacobian(self, scalar: int) -> Jacobian:
+        """
+        Multiplies the base by a scalar, leaving the product in Jacobian coordinates.
+
+        The scalar is recoded into signed windows, so the product costs one table lookup
+        and one mixed addition per window, and no doubling at all.
+
+        :param scalar: The scalar, reduced modulo the group order.
+        :type scalar: int
+
+        :returns: The Jacobian point scalar * base.
+        :rtype: Tuple[int, int, int]
+        """
+
+        data, start, stride = self._data, TABLE_HEADER.size, self.count * 64
+        scalar %= N
+        size, half, mask = 1 << self.window, self.count, (1 << self.window) - 1
+        from_bytes = int.from_bytes
+        # Mixed additions inlined, the accumulator (x1, y1, z1) starts at infinity
+        x1, y1, z1 = INFINITY
+        while scalar:
+            digit = scalar & mask
+            scalar >>= self.window
+            if digit:
+                if digit > half:
+                    # Negative digit, -multiple is (x, P - y); the carry moves into the next window
+                    scalar += 1
+                    offset = start + (size - digit - 1) * 64
+                    x2 = from_bytes(data[offset:offset + 32], "big")
+                    y2 = P - from_bytes(data[offset + 32:offset + 64], "big")
+                else:
+                    offset = start + (digit - 1) * 64
+                    x2 = from_bytes(data[offset:offset + 32], "big")
+                    y2 = from_bytes(data[offset + 32:offset + 64], "big")
+                if not z1:
+                    x1, y1, z1 = x2, y2, 1
+                else:
+                    zz = z1 * z1 % P
+                    h = (x2 * zz - x1) % P
+                    r = (y2 * zz * z1 - y1) % P
+                    if not h:
+                        x1, y1, z1 = jacobian_double((x1, y1, z1)) if not r else INFINITY
+                    else:
+                        hh = h * h % P
+                        hhh = h * hh % P
+                        v = x1 * hh % P
+                        x3 = (r * r - hhh - 2 * v) % P
+                        x1, y1, z1 = x3, (r * (v - x3) - y1 * hhh) % P, z1 * h % P
+            start += stride
+        return x1, y1, z1
+
+
+_generator_table: List[GeneratorTable] = []
+_generator_table_lock = threading.Lock()
+
+
+def generator_table() -> GeneratorTable:
+    """
+    Returns the generator table of this process.
+
+    Unless :func:`use_generator_table` installed one, it is the file named by the
+    ``BIP38_SECP256K1_TABLE`` environment variable (built there once if missing), or
+    else a table computed in memory on first use.
+
+    :returns: The generator table.
+    :rtype: GeneratorTable
+    """
+
+    if not _generator_table:
+        with _generator_table_lock:
+            if not _generator_table:
+                path: Optional[str] = os.environ.get(TABLE_ENVIRONMENT)
+                _generator_table.append(
+                    GeneratorTable.open(path) if path else GeneratorTable.build()
+                )
+    return _generator_table[0]
+
+
+def use_generator_table(path: Optional[str] = None, window: int = FILE_WINDOW) -> GeneratorTable:
+    """
+    Installs a generator table for this process.
+
+    Call it in the parent before forking workers, or in the initializer of spawned
+    workers; every process then maps the same read-only file.
+
+    :param path: The table file path, built there once if missing; None for an in-memory table.
+    :type path: Optional[str]
+    :param window: The bits per signed window of a table to build (default: FILE_WINDOW).
+    :type window: int
+
+    :returns: The installed generator table.
+    :rtype: GeneratorTable
+    """
+
+    table: GeneratorTable = GeneratorTable.open(path, window=window) if path else GeneratorTable.build(window=window)
+    with _generator_table_lock:
+        _generator_table[:] = [table]
+    return table
+
+
+def generator_multiply(scalar: int) -> Optional[Affine]:
+    """
+    Multiplies the generator by a scalar with the generator table of this process.
+
+    :param scalar: The scalar, reduced modulo the group order.
+    :type scalar: int
+
+    :returns: The affine point scalar * G, or None for the point at infinity.
+    :rtype: Optional[Tuple[int, int]]
+
+    >>> from bip38.secp256k1.ecmult import generator_multiply, GX, GY
+    >>> generator_multiply(1) == (GX, GY)
+    True
+    """
+
+    return generator_table().multiply(scalar)
+
+
+def generator_multiply_many(scalars: Sequence[int]) -> List[Optional[Affine]]:
+    """
+    Multiplies the generator by many scalars, sharing one field inversion between all the products.
+
+    :param scalars: The scalars, reduced modulo the group order.
+    :type scalars: Sequence[int]
+
+    :returns: The affine points scalar * G, None for the points at infinity.
+    :rtype: List[Optional[Tuple[int, int]]]
+
+    >>> from bip38.secp256k1.ecmult import generator_multiply_many, generator_multiply
+    >>> generator_multiply_many([1, 2]) == [generator_multiply(1), generator_multiply(2)]
+    True
+    """
+
+    table: GeneratorTable = generator_table()
+    return batch_to_affine([table.multiply_jacobian(scalar) for scalar in scalars])
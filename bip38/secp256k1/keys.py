@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+
+# Copyright © 2023-2024, Meheret Tesfaye Batu <meherett.batu@gmail.com>
+# Distributed under the MIT software license, see the accompanying
+# file COPYING or https://opensource.org/license/mit
+
+from typing import (
+    Optional, Sequence, List, Dict, Union
+)
+
+from . import ecmult
+from ..const import PRIVATE_KEY_LENGTH
+from ..exceptions import Secp256k1Error
+
+
+class CompactPublicKey:
+    """
+    A compact secp256k1 public key, the affine coordinates of its point as two ints.
+
+    Encodings are computed on first use and cached. The constructor trusts its
+    coordinates; use :meth:`from_coordinates` or :meth:`from_bytes` for untrusted input.
+
+    :param x: The x of the point.
+    :type x: int
+    :param y: The y of the point.
+    :type y: int
+
+    >>> from bip38.secp256k1.keys import CompactPrivateKey
+    >>> CompactPrivateKey(1).public_key().raw_compressed().hex()
+    '0279be667ef9dcbbac55a06295ce870b07029bfcdb2dce28d959f2815b16f81798'
+    """
+
+    __slots__ = ("x", "y", "_compressed", "_uncompressed")
+
+    x: int
+    y: int
+
+    def __init__(self, x: int, y: int) -> None:
+
+        self.x, self.y = x, y
+        self._compressed: Optional[bytes] = None
+        self._uncompressed: Optional[bytes] = None
+
+    @classmethod
+    def from_coordinates(cls, x: int, y: int) -> "CompactPublicKey":
+        """
+        Creates a public key from affine coordinates, checking them against the curve.
+
+        :param x: The x of the point.
+        :type x: int
+        :param y: The y of the point.
+        :type y: int
+
+        :return: The public key.
+        :rtype: CompactPublicKey
+        """
+
+        # secp256k1 has cofactor 1, so any affine point on the curve is a valid public key
+        if not (0 <= x < ecmult.P and 0 <= y < ecmult.P) or (y * y - x * x * x - ecmult.B) % ecmult.P:
+            raise Secp256k1Error("Invalid public key point")
+        return cls(x, y)
+
+    @classmethod
+    def from_bytes(cls, public_key: bytes) -> "CompactPublicKey":
+        """
+        Decodes an uncompressed (65 or 64 bytes) or compressed (33 bytes) public key.
+
+        :param public_key: The encoded public key.
+        :type public_key: bytes
+
+        :return: The public key.
+        :rtype: CompactPublicKey
+        """
+
+        if len(public_key) == 33:
+            try:
+                key: CompactPublicKey = cls(*ecmult.decompress(public_key))
+            except Secp256k1Error as ex:
+                raise Secp256k1Error("Invalid public key bytes") from ex
+            key._compressed = bytes(public_key)
+            return key
+        if len(public_key) == 65 and public_key[0] == 4:
+            public_key = public_key[1:]
+        if len(public_key) != 64:
+            raise Secp256k1Error("Invalid public key bytes")
+        try:
+            return cls.from_coordinates(int.from_bytes(public_key[:32], "big"), int.from_bytes(public_key[32:], "big"))
+        except Secp256k1Error as ex:
+            raise Secp256k1Error("Invalid public key bytes") from ex
+
+    @classmethod
+    def from_bytes_many(cls, public_keys: Sequence[bytes]) -> List["CompactPublicKey"]:
+        """
+        Decodes many public keys, decompressing every distinct compressed encoding once.
+
+        :param public_keys: The encoded public keys.
+        :type public_keys: Sequence[bytes]
+
+        :return: The public keys, in the same order.
+        :rtype: List[CompactPublicKey]
+        """
+
+        decoded: Dict[bytes, CompactPublicKey] = {}
+        for public_key in public_keys:
+            public_key = bytes(public_key)
+            if public_key not in decoded:
+                decoded[public_key] = cls.from_bytes(public_key)
+        return [decoded[bytes(public_key)] for public_key in public_keys]
+
+    def raw(self, public_key_type: str) -> bytes:
+        """
+        Returns the compressed or uncompressed encoding.
+
+        :param public_key_type: Either 'compressed' or 'uncompressed'.
+        :type public_key_type: str
+
+        :return: The encoded public key.
+        :rtype: bytes
+        """
+
+        return self.raw_compressed() if public_key_type == "compressed" else self.raw_uncompressed()
+
+    def raw_compressed(self) -> bytes:
+        """
+        Returns the 33 bytes compressed encoding.
+
+        :return: The compressed public key.
+        :rtype: bytes
+        """
+
+        if self._compressed is None:
+            self._compressed = (b"\x03" if self.y & 1 else b"\x02") + self.x.to_bytes(32, "big")
+        return self._compressed
+
+    def raw_uncompressed(self) -> bytes:
+        """
+        Returns the 65 bytes uncompressed encoding.
+
+        :return: The uncompressed public key.
+        :rtype: bytes
+        """
+
+        if self._uncompressed is None:
+            self._uncompressed = b"\x04" + self.x.to_bytes(32, "big") + self.y.to_bytes(32, "big")
+        return self._uncompressed
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, CompactPublicKey) and (self.x, self.y) == (other.x, other.y)
+
+    def __hash__(self) -> int:
+        return hash((self.x, self.y))
+
+
+class CompactPrivateKey:
+    """
+    A compact secp256k1 private key, its secret exponent as an int.
+
+    The public key is derived with the fixed-base generator table on first use and cached.
+
+    :param secret_exponent: The secret exponent, between 1 and the curve order.
+    :type secret_exponent: int
+    """
+
+    __slots__ = ("secret_exponent", "_public_key")
+
+    secret_exponent: int
+
+    def __init__(self, secret_exponent: int) -> None:
+
+        if not 1 <= secret_exponent < ecmult.N:
+            raise Secp256k1Error("Invalid private key secret exponent")
+        self.secret_exponent = secret_exponent
+        self._public_key: Optional[CompactPublicKey] = None
+
+    @classmethod
+    def from_bytes(cls, private_key: bytes) -> "CompactPrivateKey":
+        """
+        Decodes a 32 bytes big-endian private key.
+
+        :param private_key: The private key bytes.
+        :type private_key: bytes
+
+        :return: The private key.
+        :rtype: CompactPrivateKey
+        """
+
+        secret_exponent: int = int.from_bytes(private_key, "big")
+        if len(private_key) != PRIVATE_KEY_LENGTH or not 1 <= secret_exponent < ecmult.N:
+            raise Secp256k1Error("Invalid private key bytes")
+        return cls(secret_exponent)
+
+    @classmethod
+    def public_keys_many(cls, private_keys: Sequence[Union[bytes, "CompactPrivateKey"]]) -> List[CompactPublicKey]:
+        """
+        Derives the public keys of many private keys, sharing a single field inversion.
+
+        :param private_keys: The private keys, as bytes or instances.
+        :type private_keys: Sequence[Union[bytes, CompactPrivateKey]]
+
+        :return: The public keys, in the same order as the private keys.
+        :rtype: List[CompactPublicKey]
+        """
+
+        instances: List[CompactPrivateKey] = [
+            private_key if isinstance(private_key, CompactPrivateKey) else cls.from_bytes(private_key)
+            for private_key in private_keys
+        ]
+        pending: List[CompactPrivateKey] = [instance for instance in instances if instance._public_key is None]
+        for instance, (x, y) in zip(pending, ecmult.generator_multiply_many(
+            [instance.secret_exponent for instance in pending]
+        )):
+            instance._public_key = CompactPublicKey(x, y)
+        return [instance._public_key for instance in instances]
+
+    def raw(self) -> bytes:
+        """
+        Returns the 32 bytes big-endian private key.
+
+        :return: The private key bytes.
+        :rtype: bytes
+        """
+
+        return self.secret_exponent.to_bytes(PRIVATE_KEY_LENGTH, "big")
+
+    def public_key(self) -> CompactPublicKey:
+        """
+        Returns the public key, deriving it on first use.
+
+        :return: The public key.
+        :rtype: CompactPublicKey
+        """
+
+        if self._public_key is None:
+            x, y = ecmult.generator_multiply(self.secret_exponent)
+            self._public_key = CompactPublicKey(x, y)
+        return self._public_key
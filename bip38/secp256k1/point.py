@@ -4,13 +4,18 @@
 # Distributed under the MIT software license, see the accompanying
 # file COPYING or https://opensource.org/license/mit
 
-from typing import Any
-from ecdsa.ecdsa import curve_secp256k1
+from typing import (
+    Any, Optional, Sequence, List, Tuple
+)
+from ecdsa.ecdsa import (
+    curve_secp256k1, generator_secp256k1
+)
 from ecdsa.ellipticcurve import (
-    Point as _Point, PointJacobi
+    Point as _Point, PointJacobi, INFINITY
 )
 from ecdsa import keys
 
+from . import ecmult
 from ..const import COORDINATE_POINT_LENGTH
 from ..exceptions import Secp256k1Error
 from ..utils import (
@@ -20,6 +25,8 @@ from ..utils import (
 
 class Point:
 
+    __slots__ = ("point", "_jacobian", "_table")
+
     point: PointJacobi
 
     def __init__(self, point_obj: PointJacobi) -> None:
@@ -30,6 +37,10 @@ class Point:
         :type point_obj: PointJacobi
         """
         self.point = point_obj
+        # Jacobian coordinates of points computed by the secp256k1 engine, and the
+        # fixed-base table of points returned by precomputed()
+        self._jacobian: Optional[Tuple[int, int, int]] = None
+        self._table: Optional[ecmult.GeneratorTable] = None
 
     @classmethod
     def from_bytes(cls, point: bytes) -> "Point":
@@ -43,6 +54,12 @@ class Point:
         :rtype: IPoint
         """
 
+        if len(point) == 33:
+            try:
+                x, y = ecmult.decompress(point)
+            except Secp256k1Error as ex:
+                raise Secp256k1Error("Invalid point key bytes") from ex
+            return cls.from_jacobian(x, y, 1)
         try:
             return cls(
                 PointJacobi.from_bytes(
@@ -77,6 +94,70 @@ class Point:
             )
         )
 
+    @classmethod
+    def from_jacobian(cls, x: int, y: int, z: int) -> "Point":
+        """
+        Creates a point from Jacobian coordinates, keeping them for :meth:`normalize_many`.
+
+        :param x: The X of the point.
+        :type x: int
+        :param y: The Y of the point.
+        :type y: int
+        :param z: The Z of the point, 0 for the point at infinity.
+        :type z: int
+
+        :return: An instance of IPoint representing the point (x / z ** 2, y / z ** 3).
+        :rtype: IPoint
+        """
+
+        if not z:
+            return cls(INFINITY)
+        point: "Point" = cls(PointJacobi(curve_secp256k1, x, y, z, ecmult.N))
+        point._jacobian = (x, y, z)
+        return point
+
+    @classmethod
+    def normalize_many(cls, points: Sequence["Point"]) -> List["Point"]:
+        """
+        Converts many points to affine coordinates, sharing a single field inversion
+        between all of them (Montgomery's trick).
+
+        :param points: The points to normalize.
+        :type points: Sequence[IPoint]
+
+        :return: The points with Z = 1, in the same order; points at infinity are kept as they are.
+        :rtype: List[IPoint]
+        """
+
+        jacobians: List[Tuple[int, int, int]] = [
+            point._jacobian if point._jacobian is not None else (
+                (point.point.x(), point.point.y(), 1) if point.point.x() is not None else ecmult.INFINITY
+            ) for point in points
+        ]
+        return [
+            point if affine is None else cls.from_jacobian(affine[0], affine[1], 1)
+            for point, affine in zip(points, ecmult.batch_to_affine(jacobians))
+        ]
+
+    def precomputed(self) -> "Point":
+        """
+        Returns the point with a fixed-base precomputation table, so that
+        repeated scalar multiplications of it are table-driven.
+
+        :return: An instance of IPoint with a precomputation table.
+        :rtype: IPoint
+        """
+
+        point: "Point" = self.__class__(
+            PointJacobi(
+                curve_secp256k1, self.point.x(), self.point.y(), 1, generator_secp256k1.order()
+            )
+        )
+        point._table = ecmult.GeneratorTable.build(
+            window=ecmult.PRECOMPUTED_WINDOW, base=(self.point.x(), self.point.y())
+        )
+        return point
+
     def underlying_object(self) -> Any:
         """
         Returns the underlying point object.
@@ -189,6 +270,14 @@ class Point:
         :rtype: IPoint
         """
 
+        if self.point is generator_secp256k1:
+            # The generator goes through the fixed-base table
+            return self.from_jacobian(*ecmult.generator_table().multiply_jacobian(scalar))
+        elif self._table is not None:
+            return self.from_jacobian(*self._table.multiply_jacobian(scalar))
+        elif self.point.x() is not None:
+            # Any other point goes through the GLV endomorphism
+            return self.from_jacobian(*ecmult.multiply((self.point.x(), self.point.y()), scalar))
         return self.__class__(self.point * scalar)
 
     def __rmul__(self, scalar: int) -> "Point":
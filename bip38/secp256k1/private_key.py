@@ -4,30 +4,83 @@
 # Distributed under the MIT software license, see the accompanying
 # file COPYING or https://opensource.org/license/mit
 
-from typing import Any
-from ecdsa import SigningKey
-from ecdsa import (
-    curves, keys
+from typing import (
+    Any, Optional, Sequence, List, Union
 )
+from ecdsa import SigningKey
+from ecdsa import curves
 
 from ..const import PRIVATE_KEY_LENGTH
 from ..exceptions import Secp256k1Error
+from .keys import CompactPrivateKey
 from .public_key import PublicKey
 
 
 class PrivateKey:
+    """
+    A secp256k1 private key, an adapter over :class:`CompactPrivateKey` that adds the ecdsa
+    signing key.
+    """
 
-    signing_key: SigningKey
+    __slots__ = ("_key", "_signing_key")
 
-    def __init__(self, signing_key: SigningKey) -> None:
+    def __init__(self, signing_key: Optional[SigningKey] = None, secret_exponent: Optional[int] = None) -> None:
         """
-        Initializes an instance with a signing key.
+        Initializes an instance with a signing key or a secret exponent.
+
+        The ecdsa signing key multiplies the generator with its generic implementation when it is
+        created, so from a secret exponent it is only built if :meth:`underlying_object` is called.
 
         :param signing_key: The signing key to be used for cryptographic operations.
-        :type signing_key: SigningKey
+        :type signing_key: Optional[SigningKey]
+        :param secret_exponent: The secret exponent, between 1 and the curve order.
+        :type secret_exponent: Optional[int]
         """
 
-        self.signing_key = signing_key
+        if signing_key is not None:
+            secret_exponent = signing_key.privkey.secret_multiplier
+        elif secret_exponent is None:
+            raise Secp256k1Error("Invalid private key secret exponent")
+        self._key: CompactPrivateKey = CompactPrivateKey(secret_exponent)
+        self._signing_key: Optional[SigningKey] = signing_key
+
+    @classmethod
+    def from_compact(cls, key: CompactPrivateKey) -> "PrivateKey":
+        """
+        Wraps a compact private key, sharing its cached public key.
+
+        :param key: The compact private key.
+        :type key: CompactPrivateKey
+
+        :return: An instance of the private key.
+        :rtype: PrivateKey
+        """
+
+        private_key: "PrivateKey" = cls.__new__(cls)
+        private_key._key, private_key._signing_key = key, None
+        return private_key
+
+    def compact(self) -> CompactPrivateKey:
+        """
+        Returns the compact private key this instance wraps.
+
+        :return: The compact private key.
+        :rtype: CompactPrivateKey
+        """
+
+        return self._key
+
+    @property
+    def secret_exponent(self) -> int:
+        return self._key.secret_exponent
+
+    @property
+    def signing_key(self) -> SigningKey:
+        if self._signing_key is None:
+            self._signing_key = SigningKey.from_secret_exponent(
+                self.secret_exponent, curve=curves.SECP256k1
+            )
+        return self._signing_key
 
     @classmethod
     def from_bytes(cls, private_key: bytes) -> "PrivateKey":
@@ -41,14 +94,27 @@ class PrivateKey:
         :rtype: PrivateKey
         """
 
-        try:
-            return cls(
-                SigningKey.from_string(
-                    private_key, curve=curves.SECP256k1
-                )
-            )
-        except keys.MalformedPointError as ex:
-            raise Secp256k1Error("Invalid private key bytes") from ex
+        return cls.from_compact(CompactPrivateKey.from_bytes(private_key))
+
+    @classmethod
+    def public_keys_many(cls, private_keys: Sequence[Union[bytes, "PrivateKey"]]) -> List[PublicKey]:
+        """
+        Derives the public keys of many private keys, sharing a single field inversion
+        between all of them (Montgomery's trick) to convert the products to affine coordinates.
+
+        :param private_keys: The private keys, as bytes or instances.
+        :type private_keys: Sequence[Union[bytes, PrivateKey]]
+
+        :return: The public keys, in the same order as the private keys.
+        :rtype: List[IPublicKey]
+        """
+
+        return [
+            PublicKey.from_compact(public_key) for public_key in CompactPrivateKey.public_keys_many([
+                private_key._key if isinstance(private_key, PrivateKey) else private_key
+                for private_key in private_keys
+            ])
+        ]
 
     @staticmethod
     def length() -> int:
@@ -79,7 +145,7 @@ class PrivateKey:
         :rtype: bytes
         """
 
-        return self.signing_key.to_string()
+        return self._key.raw()
 
     def public_key(self) -> PublicKey:
         """
@@ -89,4 +155,6 @@ class PrivateKey:
         :rtype: IPublicKey
         """
 
-        return PublicKey(self.signing_key.get_verifying_key())
+        if self._signing_key is not None:
+            return PublicKey(self._signing_key.get_verifying_key())
+        return PublicKey.from_compact(self._key.public_key())
@@ -4,23 +4,37 @@
 # Distributed under the MIT software license, see the accompanying
 # file COPYING or https://opensource.org/license/mit
 
-from typing import Any
+from typing import (
+    Any, Optional, Sequence, List, Dict
+)
 from ecdsa import VerifyingKey
 from ecdsa.ecdsa import curve_secp256k1
+from ecdsa.ellipticcurve import PointJacobi
 from ecdsa import (
     curves, ellipticcurve, keys
 )
 
+from . import ecmult
 from ..const import (
     COMPRESSED_PUBLIC_KEY_LENGTH, UNCOMPRESSED_PUBLIC_KEY_LENGTH
 )
 from ..exceptions import Secp256k1Error
+from .keys import CompactPublicKey
 from .point import Point
 
 
 class PublicKey:
+    """
+    A secp256k1 public key, an adapter over :class:`CompactPublicKey` that adds the ecdsa
+    verifying key.
+
+    The point and its cached encodings live in the compact key, and the ecdsa verifying key is
+    only built if :meth:`underlying_object` is called. Keys built from bytes, coordinates or points
+    are fully validated; keys derived inside the library from points it computed itself take the
+    private trusted path and skip the on-curve checks.
+    """
 
-    verify_key: VerifyingKey
+    __slots__ = ("_key", "_verify_key")
 
     def __init__(self, verify_key: VerifyingKey) -> None:
         """
@@ -30,7 +44,59 @@ class PublicKey:
         :type verify_key: VerifyingKey
         """
 
-        self.verify_key = verify_key
+        point: Any = verify_key.pubkey.point
+        self._key: CompactPublicKey = CompactPublicKey(point.x(), point.y())
+        self._verify_key: Optional[VerifyingKey] = verify_key
+
+    @classmethod
+    def _from_trusted(cls, x: int, y: int) -> "PublicKey":
+        # Internal constructor for affine points computed by this library, which are on the curve
+        # by construction; anything decoded from outside goes through from_bytes/from_coordinates.
+        return cls.from_compact(CompactPublicKey(x, y))
+
+    @classmethod
+    def from_compact(cls, key: CompactPublicKey) -> "PublicKey":
+        """
+        Wraps a compact public key, sharing its coordinates and cached encodings.
+
+        :param key: The compact public key.
+        :type key: CompactPublicKey
+
+        :return: An instance of the public key.
+        :rtype: PublicKey
+        """
+
+        public_key: "PublicKey" = cls.__new__(cls)
+        public_key._key, public_key._verify_key = key, None
+        return public_key
+
+    def compact(self) -> CompactPublicKey:
+        """
+        Returns the compact public key this instance wraps.
+
+        :return: The compact public key.
+        :rtype: CompactPublicKey
+        """
+
+        return self._key
+
+    @property
+    def x(self) -> int:
+        return self._key.x
+
+    @property
+    def y(self) -> int:
+        return self._key.y
+
+    @property
+    def verify_key(self) -> VerifyingKey:
+        if self._verify_key is None:
+            self._verify_key = VerifyingKey.from_public_point(
+                ellipticcurve.Point(curve_secp256k1, self.x, self.y, ecmult.N),
+                curve=curves.SECP256k1,
+                validate_point=False
+            )
+        return self._verify_key
 
     @classmethod
     def from_bytes(cls, public_key: bytes) -> "PublicKey":
@@ -44,6 +110,9 @@ class PublicKey:
         :rtype: PublicKey
         """
 
+        if len(public_key) == COMPRESSED_PUBLIC_KEY_LENGTH:
+            # Dedicated secp256k1 square root, instead of the generic ecdsa decoder
+            return cls.from_compact(CompactPublicKey.from_bytes(public_key))
         try:
             return cls(
                 VerifyingKey.from_string(
@@ -53,10 +122,30 @@ class PublicKey:
         except keys.MalformedPointError as ex:
             raise Secp256k1Error("Invalid public key bytes") from ex
 
+    @classmethod
+    def from_bytes_many(cls, public_keys: Sequence[bytes]) -> List["PublicKey"]:
+        """
+        Create public key instances from many bytes representations, decompressing
+        every distinct compressed public key once.
+
+        :param public_keys: The bytes representations of the public keys.
+        :type public_keys: Sequence[bytes]
+
+        :return: The public keys, in the same order.
+        :rtype: List[PublicKey]
+        """
+
+        decoded: Dict[bytes, PublicKey] = {}
+        for public_key in public_keys:
+            public_key = bytes(public_key)
+            if public_key not in decoded:
+                decoded[public_key] = cls.from_bytes(public_key)
+        return [decoded[bytes(public_key)] for public_key in public_keys]
+
     @classmethod
     def from_point(cls, point: Point) -> "PublicKey":
         """
-        Create a public key instance from an elliptic curve point.
+        Create a public key instance from an elliptic curve point, checking it against the curve.
 
         :param point: The elliptic curve point representing the public key.
         :type point: Point
@@ -65,17 +154,59 @@ class PublicKey:
         :rtype: PublicKey
         """
 
-        try:
-            return cls(
-                VerifyingKey.from_public_point(
-                    ellipticcurve.Point(
-                        curve_secp256k1, point.x(), point.y()
-                    ),
-                    curve=curves.SECP256k1
-                )
-            )
-        except keys.MalformedPointError as ex:
-            raise Secp256k1Error("Invalid public key point") from ex
+        return cls.from_points_many([point])[0]
+
+    @classmethod
+    def from_points_many(cls, points: Sequence[Point]) -> List["PublicKey"]:
+        """
+        Create public key instances from many elliptic curve points, normalizing
+        them to affine coordinates with a single field inversion and checking
+        each of them against the curve.
+
+        :param points: The elliptic curve points representing the public keys.
+        :type points: Sequence[Point]
+
+        :return: The public keys, in the same order as the points.
+        :rtype: List[PublicKey]
+        """
+
+        public_keys: List["PublicKey"] = []
+        for point in Point.normalize_many(points):
+            if point.x() is None:
+                raise Secp256k1Error("Invalid public key point")
+            public_keys.append(cls.from_coordinates(point.x(), point.y()))
+        return public_keys
+
+    @classmethod
+    def _from_trusted_point(cls, point: Point) -> "PublicKey":
+        # Internal counterpart of from_point for products this library computed from validated points
+        return cls._from_trusted_points_many([point])[0]
+
+    @classmethod
+    def _from_trusted_points_many(cls, points: Sequence[Point]) -> List["PublicKey"]:
+        # Internal counterpart of from_points_many, skipping the on-curve check of every point
+        public_keys: List["PublicKey"] = []
+        for point in Point.normalize_many(points):
+            if point.x() is None:
+                raise Secp256k1Error("Invalid public key point")
+            public_keys.append(cls._from_trusted(point.x(), point.y()))
+        return public_keys
+
+    @classmethod
+    def from_coordinates(cls, x: int, y: int) -> "PublicKey":
+        """
+        Create a public key instance from the affine coordinates of its point.
+
+        :param x: The x of the point.
+        :type x: int
+        :param y: The y of the point.
+        :type y: int
+
+        :return: An instance of the public key with the given coordinates.
+        :rtype: PublicKey
+        """
+
+        return cls.from_compact(CompactPublicKey.from_coordinates(x, y))
 
     @staticmethod
     def compressed_length() -> int:
@@ -127,7 +258,7 @@ class PublicKey:
         :rtype: bytes
         """
 
-        return self.verify_key.to_string("compressed")
+        return self._key.raw_compressed()
 
     def raw_uncompressed(self) -> bytes:
         """
@@ -137,7 +268,7 @@ class PublicKey:
         :rtype: bytes
         """
 
-        return self.verify_key.to_string("uncompressed")
+        return self._key.raw_uncompressed()
 
     def point(self) -> Point:
         """
@@ -147,4 +278,4 @@ class PublicKey:
         :rtype: Point
         """
 
-        return Point(self.verify_key.pubkey.point)
+        return Point.from_jacobian(self.x, self.y, 1)
@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+
+# Copyright © 2023-2024, Meheret Tesfaye Batu <meherett.batu@gmail.com>
+# Distributed under the MIT software license, see the accompanying
+# file COPYING or https://opensource.org/license/mit
+
+from typing import (
+    Type, Optional, Callable, Iterator, Deque, List, Tuple, Pattern
+)
+from collections import deque
+from concurrent.futures import (
+    Future, ProcessPoolExecutor
+)
+
+import os
+import re
+import threading
+import time
+
+from .bip38 import BIP38
+from .cryptocurrencies import (
+    ICryptocurrency, Bitcoin
+)
+from .exceptions import Error
+from .secp256k1 import Point
+
+# Search state of each worker process, see _initialize
+_bip38: Optional[BIP38] = None
+_pass_point: Optional[Point] = None
+_public_key_type: Optional[str] = None
+_match: Optional[Callable[[str], bool]] = None
+
+
+class Vanity:
+    """
+    Searches for EC-multiplied BIP38 keys whose address matches a vanity prefix or regular expression,
+    on behalf of the owner of an intermediate passphrase.
+
+    Only the cheap part of :meth:`bip38.BIP38.create_new_encrypted_wif` runs for every candidate:
+    a random seed b, factor b as its double SHA-256, the pass point multiplied by factor b with a
+    precomputed table, and the address. Batches of candidates are searched across a process pool,
+    and the scrypt and AES steps building the encrypted WIF and confirmation code only run for the
+    seeds that match.
+
+    A prefix includes the leading characters of the network's addresses, e.g. ``1`` for Bitcoin
+    mainnet, and every extra character makes the search about 58 times longer. The characters right
+    after the leading ones are not uniformly distributed, so some prefixes are far rarer than their
+    length suggests, e.g. ``1z`` on Bitcoin mainnet, and the search of one that never occurs only
+    ends when cancelled.
+
+    :param intermediate_passphrase: The intermediate passphrase of the owner.
+    :type intermediate_passphrase: str
+    :param pattern: The address prefix, or the regular expression searched in the address when ``regex`` is set.
+    :type pattern: str
+    :param cryptocurrency: The cryptocurrency class of the addresses (default: Bitcoin).
+    :type cryptocurrency: Type[ICryptocurrency]
+    :param network: The network of the addresses (default: 'mainnet').
+    :type network: str
+    :param wif_type: The WIF type, either 'wif' or 'wif-compressed' (default is 'wif').
+    :type wif_type: str
+    :param regex: Whether the pattern is a regular expression rather than a prefix (default: False).
+    :type regex: bool
+    :param workers: Optional number of worker processes (default: CPU count).
+    :type workers: Optional[int]
+    :param batch_size: The number of candidates searched per task (default: 256).
+    :type batch_size: int
+
+    >>> from bip38.cryptocurrencies import Bitcoin
+    >>> from bip38.vanity import Vanity
+    >>> vanity: Vanity = Vanity(intermediate_passphrase="passphraserDFxboKK9cTkBQMb73vdzgsXB5L6cCMFCzTVoMTpMWYD8SJXv3jcKyHbRWBcza", pattern="1A", cryptocurrency=Bitcoin, network="mainnet", workers=1)
+    >>> vanity.run()[0]["address"].startswith("1A")
+    True
+    """
+
+    intermediate_passphrase: str
+    pattern: str
+    cryptocurrency: Type[ICryptocurrency]
+    network: str
+    wif_type: str
+    regex: bool
+    workers: int
+    batch_size: int
+    tested: int
+
+    def __init__(
+        self,
+        intermediate_passphrase: str,
+        pattern: str,
+        cryptocurrency: Type[ICryptocurrency] = Bitcoin,
+        network: str = "mainnet",
+        wif_type: str = "wif",
+        regex: bool = False,
+        workers: Optional[int] = None,
+        batch_size: int = 256
+    ) -> None:
+
+        bip38: BIP38 = BIP38(cryptocurrency=cryptocurrency, network=network)
+        bip38.intermediate_pass_point(intermediate_passphrase=intermediate_passphrase, wif_type=wif_type)
+        if regex:
+            try:
+                re.compile(pattern)
+            except re.error as ex:
+                raise Error("Invalid vanity regular expression", got=pattern) from ex
+        elif not pattern or any(character not in bip38.alphabet for character in pattern):
+            raise Error("Invalid vanity prefix", expected="base58 characters", got=pattern)
+        if batch_size < 1:
+            raise Error("Invalid batch size", expected="batch_size >= 1", got=batch_size)
+        self.intermediate_passphrase, self.pattern, self.regex = intermediate_passphrase, pattern, regex
+        self.cryptocurrency, self.network, self.wif_type = cryptocurrency, network, wif_type
+        self.workers, self.batch_size = (workers or os.cpu_count() or 1), batch_size
+        self.tested = 0
+        self._cancelled: threading.Event = threading.Event()
+
+    def cancel(self) -> None:
+        """
+        Stops a running search after the batches in progress, e.g. from another thread or a progress callback.
+
+        :returns: None
+        """
+
+        self._cancelled.set()
+
+    def run(
+        self,
+        count: int = 1,
+        progress: Optional[Callable[[dict], None]] = None,
+        progress_interval: float = 5.0
+    ) -> List[dict]:
+        """
+        Searches until ``count`` matching keys are found or the search is cancelled.
+
+        :param count: The number of matching keys to find (default: 1).
+        :type count: int
+        :param progress: Optional callback, called with the progress at most every ``progress_interval``
+            seconds and when the search ends: the candidates searched in total and in this run, the
+            matches found, the elapsed seconds and the keys per second of this run.
+        :type progress: Optional[Callable[[dict], None]]
+        :param progress_interval: The minimum number of seconds between progress reports (default: 5.0).
+        :type progress_interval: float
+
+        :returns: Dictionaries containing the encrypted WIFs like :meth:`bip38.BIP38.create_new_encrypted_wif`,
+            fewer than ``count`` when cancelled.
+        :rtype: List[dict]
+        """
+
+        self._cancelled.clear()
+        start: float = time.monotonic()
+        tested: int = self.tested
+        reported: float = start
+        seeds: List[bytes] = []
+
+        def report() -> None:
+            if progress is not None:
+                elapsed: float = time.monotonic() - start
+                progress(dict(
+                    tested=self.tested,
+                    new=self.tested - tested,
+                    found=min(len(seeds), count),
+                    elapsed=elapsed,
+                    rate=(self.tested - tested) / elapsed if elapsed > 0 else 0.0
+                ))
+
+        results: Iterator[Tuple[int, List[bytes]]] = self._map()
+        try:
+            for searched, matches in results:
+                self.tested += searched
+                seeds.extend(matches)
+                if len(seeds) >= count or self._cancelled.is_set():
+                    break
+                now: float = time.monotonic()
+                if now - reported >= progress_interval:
+                    report()
+                    reported = now
+        finally:
+            results.close()
+        report()
+
+        seeds = seeds[:count]
+        if not seeds:
+            return []
+        return list(BIP38(cryptocurrency=self.cryptocurrency, network=self.network).create_new_encrypted_wifs(
+            intermediate_passphrase=self.intermediate_passphrase,
+            count=len(seeds),
+            wif_type=self.wif_type,
+            seeds=seeds
+        ))
+
+    def _map(self) -> Iterator[Tuple[int, List[bytes]]]:
+        # Batches are kept submitted ahead of the results, a bounded number at a time, until the caller stops
+        initargs: tuple = (
+            self.cryptocurrency, self.network, self.intermediate_passphrase, self.wif_type, self.pattern, self.regex
+        )
+        if self.workers == 1:
+            _initialize(*initargs)
+            while True:
+                yield _search(self.batch_size)
+
+        executor: ProcessPoolExecutor = ProcessPoolExecutor(
+            max_workers=self.workers, initializer=_initialize, initargs=initargs
+        )
+        pending: Deque[Future] = deque()
+        try:
+            while True:
+                while len(pending) < self.workers * 2:
+                    pending.append(executor.submit(_search, self.batch_size))
+                yield pending.popleft().result()
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+
+def _initialize(
+    cryptocurrency: Type[ICryptocurrency], network: str, intermediate_passphrase: str, wif_type: str, pattern: str, regex: bool
+) -> None:
+    global _bip38, _pass_point, _public_key_type, _match
+    _bip38 = BIP38(cryptocurrency=cryptocurrency, network=network)
+    _pass_point, _public_key_type = _bip38.intermediate_pass_point(
+        intermediate_passphrase=intermediate_passphrase, wif_type=wif_type
+    )
+    if regex:
+        compiled: Pattern = re.compile(pattern)
+        _match = lambda address: compiled.search(address) is not None
+    else:
+        _match = lambda address: address.startswith(pattern)
+
+
+def _search(batch_size: int) -> Tuple[int, List[bytes]]:
+    seeds_b: List[bytes] = [os.urandom(24) for _ in range(batch_size)]
+    return batch_size, [
+        seed_b for seed_b, address in zip(seeds_b, _bip38.seed_addresses(
+            pass_point=_pass_point, seeds=seeds_b, public_key_type=_public_key_type
+        )) if _match(address)
+    ]
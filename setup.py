@@ -6,7 +6,7 @@
 
 from typing import List
 from setuptools import (
-    setup, find_packages
+    setup, find_packages, Extension
 )
 
 import importlib.util
@@ -48,10 +48,17 @@ setup(
     python_requires=">=3.9,<4",
     packages=find_packages(exclude=["tests*"]),
     install_requires=get_requirements(name="requirements"),
+    # Native ROMix lane kernel of bip38.kdf.ParallelScrypt, skipped when no C compiler is available
+    ext_modules=[
+        Extension("bip38.libs._romix", sources=["bip38/libs/_romix.c"], optional=True)
+    ],
     include_package_data=True,
     extras_require=dict(
         docs=get_requirements(name="requirements/docs"),
-        tests=get_requirements(name="requirements/tests")
+        tests=get_requirements(name="requirements/tests"),
+        aes=get_requirements(name="requirements/aes"),
+        numpy=get_requirements(name="requirements/numpy"),
+        pycryptodome=get_requirements(name="requirements/pycryptodome")
     ),
     classifiers=[
         "Development Status :: 5 - Production/Stable",
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+
+# Copyright © 2023-2024, Meheret Tesfaye Batu <meherett.batu@gmail.com>
+# Distributed under the MIT software license, see the accompanying
+# file COPYING or https://opensource.org/license/mit
+
+import pytest
+
+from bip38 import backends
+from bip38.bip38 import BIP38
+from bip38.cryptocurrencies import Bitcoin
+from bip38.exceptions import Error
+from bip38.aes import (
+    AES_BACKENDS, AES_TEST_VECTOR, IAES, AutoAES, NumpyAES, PythonAES, get_aes_backend, select, encrypt_many, decrypt_many
+)
+
+# FIPS 197 appendix C and SP 800-38A F.1.5 vectors
+VECTORS: list = [
+    ("000102030405060708090a0b0c0d0e0f", "00112233445566778899aabbccddeeff", "69c4e0d86a7b0430d8cdb78070b4c55a"),
+    (
+        "000102030405060708090a0b0c0d0e0f1011121314151617",
+        "00112233445566778899aabbccddeeff", "dda97ca4864cdfe06eaf70a0ec0d7191"
+    ),
+    (
+        "000102030405060708090a0b0c0d0e0f101112131415161718191a1b1c1d1e1f",
+        "00112233445566778899aabbccddeeff", "8ea2b7ca516745bfeafc49904b496089"
+    ),
+    (
+        "603deb1015ca71be2b73aef0857d77811f352c073b6108d72d9810a30914dff4",
+        "6bc1bee22e409f96e93d7e117393172aae2d8a571e03ac9c9eb76fac45af8e51",
+        "f3eed1bdb5d2a03c064b5a7e3db181f8591ccb10d410ed26dc5ba74a31362870"
+    )
+]
+
+
+def test_aes_backends():
+
+    for name, backend in AES_BACKENDS.items():
+        if not backend.is_available():
+            with pytest.raises(Error):
+                get_aes_backend(name)
+            continue
+        assert get_aes_backend(name) is backend
+        for key, plaintext, ciphertext in VECTORS:
+            key, plaintext, ciphertext = bytes.fromhex(key), bytes.fromhex(plaintext), bytes.fromhex(ciphertext)
+            assert backend.new(key).encrypt(plaintext) == ciphertext
+            assert backend.new(key).decrypt(ciphertext) == plaintext
+            if len(plaintext) == 32:
+                assert backend.encrypt_blocks(key, plaintext[:16], plaintext[16:]) == (ciphertext[:16], ciphertext[16:])
+                assert backend.decrypt_blocks(key, ciphertext[:16], ciphertext[16:]) == (plaintext[:16], plaintext[16:])
+
+    selection: dict = select()
+    assert selection["selected"] in selection["available"]
+    assert backends()["aes"] == selection
+    assert get_aes_backend() is AES_BACKENDS[selection["selected"]]
+    assert AutoAES.new(AES_TEST_VECTOR["key"]).encrypt(AES_TEST_VECTOR["plaintext"]) == AES_TEST_VECTOR["ciphertext"]
+
+    with pytest.raises(NotImplementedError):
+        IAES.new(AES_TEST_VECTOR["key"])
+    assert IAES.__abstractmethods__ == frozenset(["new"])
+    with pytest.raises(TypeError):
+        type("IncompleteAES", (IAES,), dict(NAME="incomplete"))()
+    with pytest.raises(ValueError):
+        PythonAES.new(bytes(20))
+    with pytest.raises(ValueError):
+        PythonAES.new(AES_TEST_VECTOR["key"]).encrypt(bytes(20))
+    with pytest.raises(Error):
+        get_aes_backend("FAKE_BACKEND")
+
+
+def test_aes_many():
+
+    keys: list = [bytes.fromhex(key) for key, *_ in VECTORS[2:]] * 10
+    plaintexts: list = [bytes.fromhex(plaintext)[:16] for _, plaintext, _ in VECTORS[2:]] * 10
+    ciphertexts: list = [bytes.fromhex(ciphertext)[:16] for *_, ciphertext in VECTORS[2:]] * 10
+
+    class SingleAES:
+
+        @classmethod
+        def new(cls, key):
+            return PythonAES.new(key)
+
+    for backend in [None, "python", "numpy", AutoAES, SingleAES]:
+        if backend == "numpy" and not NumpyAES.is_available():
+            continue
+        assert encrypt_many(keys, plaintexts, backend=backend) == ciphertexts
+        assert decrypt_many(keys, ciphertexts, backend=backend) == plaintexts
+    assert encrypt_many([], [], backend="python") == []
+
+    with pytest.raises(Error):
+        encrypt_many(keys, plaintexts[:1])
+    with pytest.raises(Error):
+        decrypt_many(keys, ciphertexts[:1], backend=PythonAES)
+
+
+def test_numpy_aes():
+
+    if not NumpyAES.is_available():
+        pytest.skip("numpy is not installed")
+
+    import numpy
+    random: numpy.random.Generator = numpy.random.default_rng(38)
+    for size in [16, 24, 32]:
+        keys: numpy.ndarray = random.integers(0, 256, (40, size), dtype=numpy.uint8)
+        blocks: numpy.ndarray = random.integers(0, 256, (40, 32), dtype=numpy.uint8)
+        encrypted: numpy.ndarray = NumpyAES.encrypt_array(keys, blocks)
+        assert [row.tobytes() for row in encrypted] == PythonAES.encrypt_many(
+            [key.tobytes() for key in keys], [block.tobytes() for block in blocks]
+        )
+        assert numpy.array_equal(NumpyAES.decrypt_array(keys, encrypted), blocks)
+
+    assert NumpyAES.new(AES_TEST_VECTOR["key"]).encrypt(AES_TEST_VECTOR["plaintext"]) == AES_TEST_VECTOR["ciphertext"]
+    assert AutoAES.batch_backend(1) is get_aes_backend()
+    if get_aes_backend().FALLBACK:
+        assert AutoAES.batch_backend(64) is NumpyAES
+
+    with pytest.raises(ValueError):
+        NumpyAES.encrypt_many([bytes(32), bytes(16)], [bytes(16), bytes(16)])
+    with pytest.raises(ValueError):
+        NumpyAES.encrypt_array(numpy.zeros((2, 32), dtype=numpy.uint8), numpy.zeros((2, 20), dtype=numpy.uint8))
+
+
+def test_bip38_aes_backend(_):
+
+    class CountingAES(IAES):
+
+        NAME = "counting"
+        calls: int = 0
+
+        @classmethod
+        def new(cls, key):
+            cls.calls += 1
+            return PythonAES.new(key)
+
+    vector: dict = _["bip38"]["encrypt"][0]
+    for aes_backend in [CountingAES, "python"]:
+        bip38: BIP38 = BIP38(
+            cryptocurrency=Bitcoin, network=vector["network"], aes_backend=aes_backend
+        )
+        assert bip38.encrypt(
+            wif=vector["wif"], passphrase=vector["passphrase"]
+        ) == vector["encrypted_wif"]
+        assert bip38.decrypt(
+            encrypted_wif=vector["encrypted_wif"], passphrase=vector["passphrase"]
+        ) == vector["wif"]
+    assert CountingAES.calls == 2
+    assert BIP38.aes_backend is AutoAES
+
+    with pytest.raises(Error):
+        BIP38(cryptocurrency=Bitcoin, aes_backend="FAKE_BACKEND")
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+
+# Copyright © 2023-2024, Meheret Tesfaye Batu <meherett.batu@gmail.com>
+# Distributed under the MIT software license, see the accompanying
+# file COPYING or https://opensource.org/license/mit
+
+import os
+import pytest
+
+from bip38.bip38 import BIP38
+from bip38.cryptocurrencies import (
+    Bitcoin, Ripple
+)
+from bip38.exceptions import WIFError
+from bip38.libs.base58 import (
+    Base58, NUMPY_BATCH_THRESHOLD, get_codec, encode, decode, check_encode, check_decode, encode_many, decode_many,
+    check_encode_many, check_decode_many, digits_width
+)
+
+# (hex data, base58) vectors from Bitcoin Core's base58_encode_decode.json
+VECTORS: list = [
+    ("", ""),
+    ("61", "2g"),
+    ("626262", "a3gV"),
+    ("636363", "aPEr"),
+    ("73696d706c792061206c6f6e6720737472696e67", "2cFupjhnEsSn59qHXstmK2ffpLv2"),
+    ("00eb15231dfceb60925886b67d065299925915aeb172c06647", "1NS17iag9jJgTHD1VXjvLCEnZuQ3rJDE9L"),
+    ("516b6fcd0f", "ABnLTmg"),
+    ("bf4f89001e670274dd", "3SEo3LWLoPntC"),
+    ("572e4794", "3EFU7m"),
+    ("ecac89cad93923c02321", "EJDM8drfXA6uyA"),
+    ("10c8511e", "Rt5zm"),
+    ("00000000000000000000", "1111111111")
+]
+
+
+def test_base58():
+
+    for data, encoded in VECTORS:
+        assert encode(bytes.fromhex(data)) == encoded
+        assert decode(encoded) == bytes.fromhex(data)
+        assert check_decode(check_encode(bytes.fromhex(data))) == bytes.fromhex(data)
+
+    assert encode_many([bytes.fromhex(data) for data, _ in VECTORS]) == [encoded for _, encoded in VECTORS]
+    assert decode_many([encoded for _, encoded in VECTORS]) == [bytes.fromhex(data) for data, _ in VECTORS]
+    assert get_codec() is get_codec(Bitcoin.ALPHABET)
+    assert get_codec(Ripple.ALPHABET).alphabet == Ripple.ALPHABET
+    assert decode(encode(b"\x00\x01ripple", alphabet=Ripple.ALPHABET), alphabet=Ripple.ALPHABET) == b"\x00\x01ripple"
+    assert encode(b"\x00\x01ripple", alphabet=Ripple.ALPHABET).startswith("r")
+
+    for invalid in ["0", "O", "I", "l", "_", "Ä", "3EFU7m "]:
+        with pytest.raises(ValueError):
+            decode(invalid)
+    with pytest.raises(ValueError):
+        check_decode("3EFU7m")
+    with pytest.raises(ValueError):
+        Base58("123")
+
+
+def test_base58_batch():
+
+    numpy = pytest.importorskip("numpy")
+    codec: Base58 = get_codec()
+    for width in [1, 4, 21, 25, 38, 39, 51]:
+        payloads: list = [os.urandom(width) for _ in range(NUMPY_BATCH_THRESHOLD)] + [
+            bytes(width), b"\x00" + os.urandom(width - 1), bytes(width - 1) + b"\x01"
+        ]
+        encoded: list = [check_encode(payload) for payload in payloads]
+
+        assert codec.encode_array(
+            numpy.frombuffer(b"".join(payloads), dtype=numpy.uint8).reshape(len(payloads), width)
+        ) == [encode(payload) for payload in payloads]
+        assert check_encode_many(payloads) == encoded
+        assert check_decode_many(encoded, width=width) == payloads
+        assert check_decode_many(encoded) == payloads
+
+        invalid: list = list(encoded)
+        invalid[0] = invalid[0][:-1] + ("2" if invalid[0][-1] != "2" else "3")
+        invalid[1], invalid[2], invalid[3] = "1" + invalid[1], invalid[2][1:], "0" + invalid[3][1:]
+        invalid[4] = "2" * (digits_width(width + 4) + 1)
+        assert check_decode_many(invalid, width=width, strict=False) == [None] * 5 + payloads[5:]
+        with pytest.raises(ValueError):
+            check_decode_many(invalid, width=width)
+        with pytest.raises(ValueError):
+            check_decode_many(encoded[:1], width=width + 1)
+        assert check_decode_many(encoded[:1], width=width + 1, strict=False) == [None]
+
+    ripple: Base58 = get_codec(Ripple.ALPHABET)
+    payloads: list = [os.urandom(25) for _ in range(NUMPY_BATCH_THRESHOLD)]
+    assert ripple.check_encode_many(payloads) == [ripple.check_encode(payload) for payload in payloads]
+    assert ripple.check_decode_many(ripple.check_encode_many(payloads), width=25) == payloads
+
+
+def test_bip38_alphabet(_):
+
+    vector: dict = _["bip38"]["encrypt"][0]
+    bip38: BIP38 = BIP38(cryptocurrency=Ripple, network="mainnet")
+    encrypted_wif: str = bip38.encrypt(wif=vector["wif"], passphrase=vector["passphrase"])
+
+    assert bip38.alphabet == Ripple.ALPHABET
+    assert encrypted_wif != vector["encrypted_wif"]
+    assert decode(encrypted_wif, alphabet=Ripple.ALPHABET)[:2] == decode(vector["encrypted_wif"])[:2]
+    assert bip38.decrypt(encrypted_wif=encrypted_wif, passphrase=vector["passphrase"]) == vector["wif"]
+
+    with pytest.raises(WIFError):
+        bip38.decrypt(encrypted_wif="FAKE_ENCRYPTED_WIF", passphrase=vector["passphrase"])
@@ -4,15 +4,35 @@
 # Distributed under the MIT software license, see the accompanying
 # file COPYING or https://opensource.org/license/mit
 
+import hashlib
 import pytest
 
 from bip38.bip38 import BIP38
-from bip38.cryptocurrencies import Bitcoin
+from bip38.cache import (
+    PassFactorCache, PointCache
+)
+from bip38.cryptocurrencies import (
+    Bitcoin, Litecoin, Ripple, CRYPTOCURRENCIES
+)
 from bip38.exceptions import (
-    Error, NetworkError, PassphraseError
+    Error, NetworkError, PassphraseError, WIFError
+)
+from bip38.kdf import (
+    AutoScrypt, calibrate
 )
 
 
+class SaltedScrypt:
+    # A scrypt backend deriving other keys than scrypt, to tell whether a process used it
+
+    @classmethod
+    def hash(cls, password, salt, N=16384, r=8, p=1, buflen=64):
+        return hashlib.scrypt(
+            password.encode() if isinstance(password, str) else password,
+            salt=b"SALTED" + salt, n=N, r=r, p=p, dklen=buflen, maxmem=1 << 26
+        )
+
+
 def test_intermediate_code(_):
 
     for index in range(len(_["bip38"]["intermediate_code"])):
@@ -31,6 +51,45 @@ def test_intermediate_code(_):
         assert intermediate_passphrase == _["bip38"]["intermediate_code"][index]["intermediate_passphrase"]
 
 
+def test_intermediate_codes(_):
+
+    for index in range(len(_["bip38"]["intermediate_code"])):
+        if _["bip38"]["intermediate_code"][index]["lot"] is None:
+            continue
+        lot: int = _["bip38"]["intermediate_code"][index]["lot"]
+        sequence: int = _["bip38"]["intermediate_code"][index]["sequence"]
+        owner_salt: str = _["bip38"]["intermediate_code"][index]["owner_salt"]
+        intermediate_passphrases: list = list(BIP38.intermediate_codes(
+            passphrase=_["bip38"]["intermediate_code"][index]["passphrase"],
+            lot=lot,
+            sequences=range(sequence - 1, sequence + 2),
+            owner_salt=owner_salt
+        ))
+
+        assert len(intermediate_passphrases) == 3
+        assert intermediate_passphrases[1] == _["bip38"]["intermediate_code"][index]["intermediate_passphrase"]
+        assert intermediate_passphrases[0] == BIP38.intermediate_code(
+            passphrase=_["bip38"]["intermediate_code"][index]["passphrase"],
+            lot=lot,
+            sequence=sequence - 1,
+            owner_salt=owner_salt
+        )
+
+        with pytest.raises(Error):
+            list(BIP38.intermediate_codes(
+                passphrase=_["bip38"]["intermediate_code"][index]["passphrase"], lot=lot, sequences=[4096]
+            ))
+        # Raised when called, before the generator is consumed
+        with pytest.raises(Error):
+            BIP38.intermediate_codes(
+                passphrase=_["bip38"]["intermediate_code"][index]["passphrase"], lot=99999, sequences=[sequence]
+            )
+        with pytest.raises(Error):
+            BIP38.intermediate_codes(
+                passphrase=_["bip38"]["intermediate_code"][index]["passphrase"], lot=lot, owner_salt="75ed1c"
+            )
+
+
 def test_bip38_encrypt(_):
 
     for index in range(len(_["bip38"]["encrypt"])):
@@ -89,6 +148,66 @@ def test_create_new_encrypted_wif(_):
             )
 
 
+def test_create_new_encrypted_wifs(_):
+
+    bip38: BIP38 = BIP38(
+        cryptocurrency=Bitcoin, network="mainnet"
+    )
+    for index in range(len(_["bip38"]["create_new_encrypted_wif"])):
+        vector: dict = _["bip38"]["create_new_encrypted_wif"][index]
+        encrypted_wifs: list = list(bip38.create_new_encrypted_wifs(
+            intermediate_passphrase=vector["intermediate_passphrase"],
+            count=2,
+            wif_type=vector["wif_type"],
+            seeds=[vector["seed"], vector["seed"], vector["seed"]]
+        ))
+
+        assert len(encrypted_wifs) == 2
+        assert encrypted_wifs[0] == encrypted_wifs[1] == bip38.create_new_encrypted_wif(
+            intermediate_passphrase=vector["intermediate_passphrase"], wif_type=vector["wif_type"], seed=vector["seed"]
+        )
+        assert encrypted_wifs[0]["encrypted_wif"] == vector["encrypted_wif"]
+        assert encrypted_wifs[0]["confirmation_code"] == vector["confirmation_code"]
+
+        assert len(list(bip38.create_new_encrypted_wifs(
+            intermediate_passphrase=vector["intermediate_passphrase"], count=3, wif_type=vector["wif_type"]
+        ))) == 3
+        assert list(bip38.create_new_encrypted_wifs(
+            intermediate_passphrase=vector["intermediate_passphrase"],
+            count=5,
+            wif_type=vector["wif_type"],
+            seeds=[vector["seed"]] * 3,
+            batch_size=2
+        )) == [encrypted_wifs[0]] * 3
+
+        with pytest.raises(PassphraseError):
+            next(bip38.create_new_encrypted_wifs(
+                intermediate_passphrase="FAKE_PASSPHRASE", count=1, wif_type=vector["wif_type"]
+            ))
+
+
+
+def test_seed_addresses(_):
+
+    bip38: BIP38 = BIP38(
+        cryptocurrency=Bitcoin, network="mainnet"
+    )
+    for vector in _["bip38"]["create_new_encrypted_wif"]:
+        pass_point, public_key_type = bip38.intermediate_pass_point(
+            intermediate_passphrase=vector["intermediate_passphrase"], wif_type=vector["wif_type"]
+        )
+        assert public_key_type == vector["public_key_type"]
+        assert bip38.seed_addresses(
+            pass_point=pass_point, seeds=[vector["seed"]] * 2, public_key_type=public_key_type
+        ) == [vector["address"]] * 2
+
+        with pytest.raises(PassphraseError):
+            bip38.intermediate_pass_point(intermediate_passphrase="FAKE_PASSPHRASE", wif_type=vector["wif_type"])
+        with pytest.raises(NetworkError):
+            bip38.seed_addresses(pass_point=pass_point, seeds=[vector["seed"]], network="FAKE_NETWORK")
+        with pytest.raises(Error):
+            bip38.seed_addresses(pass_point=pass_point, seeds=[vector["seed"]], public_key_type="FAKE_TYPE")
+
 def test_confirm_code(_):
 
     for index in range(len(_["bip38"]["confirm_code"])):
@@ -142,6 +261,73 @@ def test_confirm_code(_):
             )
 
 
+def test_confirm_codes(_):
+
+    for aes_backend in [None, "numpy"]:
+        bip38: BIP38 = BIP38(
+            cryptocurrency=Bitcoin, network="mainnet", aes_backend=aes_backend
+        )
+        for vector in _["bip38"]["confirm_code"]:
+            confirmed: list = bip38.confirm_codes(
+                passphrase=vector["passphrase"],
+                confirmation_codes=[vector["confirmation_code"]] * 16 + ["FAKE_CONFIRMATION_CODE"],
+                detail=True
+            )
+
+            assert confirmed[:-1] == [bip38.confirm_code(
+                passphrase=vector["passphrase"], confirmation_code=vector["confirmation_code"], detail=True
+            )] * 16
+            assert confirmed[0]["address"] == vector["address"]
+            assert isinstance(confirmed[-1], Error)
+
+            assert isinstance(bip38.confirm_codes(
+                passphrase="FAKE_PASSPHRASE", confirmation_codes=[vector["confirmation_code"]]
+            )[0], PassphraseError)
+
+        with pytest.raises(NetworkError):
+            bip38.confirm_codes(passphrase="TestingOneTwoThree", confirmation_codes=[], network="FAKE_NETWORK")
+
+
+def test_decrypt_ec_many(_):
+
+    vector: dict = _["bip38"]["intermediate_code"][0]
+    for aes_backend in [None, "numpy"]:
+        bip38: BIP38 = BIP38(
+            cryptocurrency=Bitcoin, network="mainnet", aes_backend=aes_backend
+        )
+        encrypted_wifs: list = list(bip38.create_new_encrypted_wifs(
+            intermediate_passphrase=vector["intermediate_passphrase"], count=20, wif_type="wif-compressed"
+        ))
+        decrypted: list = bip38.decrypt_ec_many(
+            encrypted_wifs=[encrypted_wif["encrypted_wif"] for encrypted_wif in encrypted_wifs] + [
+                _["bip38"]["decrypt"][0]["encrypted_wif"], "FAKE_ENCRYPTED_WIF"
+            ],
+            passphrase=vector["passphrase"],
+            detail=True
+        )
+
+        assert [result["address"] for result in decrypted[:-2]] == [
+            encrypted_wif["address"] for encrypted_wif in encrypted_wifs
+        ]
+        assert [result["seed"] for result in decrypted[:-2]] == [
+            encrypted_wif["seed"] for encrypted_wif in encrypted_wifs
+        ]
+        assert decrypted[0] == bip38.decrypt(
+            encrypted_wif=encrypted_wifs[0]["encrypted_wif"], passphrase=vector["passphrase"], detail=True
+        )
+        assert all(isinstance(result, Error) for result in decrypted[-2:])
+        assert bip38.confirm_codes(
+            passphrase=vector["passphrase"],
+            confirmation_codes=[encrypted_wif["confirmation_code"] for encrypted_wif in encrypted_wifs]
+        ) == [encrypted_wif["address"] for encrypted_wif in encrypted_wifs]
+        assert isinstance(bip38.decrypt_ec_many(
+            encrypted_wifs=[encrypted_wifs[0]["encrypted_wif"]], passphrase="FAKE_PASSPHRASE"
+        )[0], PassphraseError)
+
+    with pytest.raises(NetworkError):
+        bip38.decrypt_ec_many(encrypted_wifs=[], passphrase="TestingOneTwoThree", network="FAKE_NETWORK")
+
+
 def test_bip38_decrypt(_):
 
     for index in range(len(_["bip38"]["decrypt"])):
@@ -183,3 +369,214 @@ def test_bip38_decrypt(_):
                 detail=True,
                 network="FAKE_NETWORK"
             )
+
+
+
+def test_bip38_decrypt_any(_):
+
+    class CountingScrypt:
+        calls: int = 0
+
+        @classmethod
+        def hash(cls, *args):
+            cls.calls += 1
+            return BIP38.scrypt_backend.hash(*args)
+
+    for item in _["bip38"]["decrypt"]:
+        bip38: BIP38 = BIP38(cryptocurrency=Bitcoin, scrypt_backend=CountingScrypt)
+        calls: int = CountingScrypt.calls
+        matches: list = bip38.decrypt_any(
+            encrypted_wif=item["encrypted_wif"], passphrase=item["passphrase"], candidates=[Bitcoin, Litecoin, Ripple]
+        )
+        # One key derivation for every candidate, the Ripple alphabet does not decode to an encrypted WIF
+        assert CountingScrypt.calls - calls == (1 if item["seed"] is None else 2)
+        assert ("Bitcoin", item["network"], item["wif"]) in [
+            (match["cryptocurrency"], match["network"], match["wif"]) for match in matches
+        ]
+        assert all(match["network"] != "mainnet" for match in matches if match["cryptocurrency"] == "Litecoin")
+
+    item: dict = _["bip38"]["decrypt"][0]
+    bip38: BIP38 = BIP38(cryptocurrency=Bitcoin)
+    decrypted: dict = bip38.decrypt_any(
+        encrypted_wif=item["encrypted_wif"], passphrase=item["passphrase"], candidates=[(Bitcoin, "mainnet")], detail=True
+    )[0]
+    assert decrypted == dict(cryptocurrency="Bitcoin", network="mainnet", **bip38.decrypt(
+        encrypted_wif=item["encrypted_wif"], passphrase=item["passphrase"], detail=True
+    ))
+    with pytest.raises(PassphraseError):
+        bip38.decrypt_any(encrypted_wif=item["encrypted_wif"], passphrase="FAKE_PASSPHRASE", candidates=[Bitcoin])
+    with pytest.raises(PassphraseError):
+        bip38.decrypt_any(encrypted_wif=item["encrypted_wif"], passphrase=item["passphrase"], candidates=[Litecoin])
+    with pytest.raises(NetworkError):
+        bip38.decrypt_any(encrypted_wif=item["encrypted_wif"], passphrase=item["passphrase"], candidates=[(Bitcoin, "FAKE_NETWORK")])
+    with pytest.raises(WIFError):
+        bip38.decrypt_any(encrypted_wif=item["encrypted_wif"][:-2], passphrase=item["passphrase"], candidates=[Bitcoin])
+
+    # Cryptocurrencies with their own alphabet are found among all of them
+    encrypted_wif: str = BIP38(cryptocurrency=Ripple).encrypt(
+        wif=item["wif"], passphrase=item["passphrase"]
+    )
+    matches: list = BIP38(cryptocurrency=Bitcoin).decrypt_any(encrypted_wif=encrypted_wif, passphrase=item["passphrase"])
+    assert [match["cryptocurrency"] for match in matches] == ["Ripple"]
+    assert len(CRYPTOCURRENCIES) == 155
+
+def test_validate_encrypted_wifs(_):
+
+    bip38: BIP38 = BIP38(
+        cryptocurrency=Bitcoin, network="mainnet"
+    )
+    encrypted_wifs: list = [vector["encrypted_wif"] for vector in _["bip38"]["decrypt"]]
+    invalid: list = [
+        encrypted_wifs[0][:-1] + "h", "FAKE_ENCRYPTED_WIF", _["bip38"]["confirm_code"][0]["confirmation_code"],
+        _["bip38"]["create_new_encrypted_wif"][0]["intermediate_passphrase"]
+    ]
+    for count in [1, 20]:
+        assert bip38.validate_encrypted_wifs(
+            encrypted_wifs=(encrypted_wifs + invalid) * count
+        ) == ([True] * len(encrypted_wifs) + [False] * len(invalid)) * count
+
+
+def test_bip38_encrypt_many(_):
+
+    for network in ["mainnet", "testnet"]:
+        bip38: BIP38 = BIP38(
+            cryptocurrency=Bitcoin, network=network
+        )
+        vectors: list = [
+            vector for vector in _["bip38"]["encrypt"] if vector["network"] == network
+        ]
+        encrypted_wifs: list = bip38.encrypt_many(
+            pairs=[
+                (vector["wif"], vector["passphrase"]) for vector in vectors + vectors
+            ] + [("FAKE_WIF", "FAKE_PASSPHRASE")],
+            workers=2
+        )
+
+        assert encrypted_wifs[:-1] == [
+            vector["encrypted_wif"] for vector in vectors + vectors
+        ]
+        assert isinstance(encrypted_wifs[-1], Error)
+
+        with pytest.raises(NetworkError):
+            bip38.encrypt_many(pairs=[], network="FAKE_NETWORK")
+
+
+def test_bip38_decrypt_many(_):
+
+    bip38: BIP38 = BIP38(
+        cryptocurrency=Bitcoin, network="mainnet"
+    )
+    vectors: list = [
+        vector for vector in _["bip38"]["decrypt"] if vector["network"] == "mainnet"
+    ]
+    decrypted: list = bip38.decrypt_many(
+        items=[
+            (vector["encrypted_wif"], vector["passphrase"]) for vector in vectors
+        ] + [(vectors[0]["encrypted_wif"], "FAKE_PASSPHRASE")],
+        detail=True,
+        workers=2
+    )
+
+    assert [result["wif"] for result in decrypted[:-1]] == [vector["wif"] for vector in vectors]
+    assert [result["address"] for result in decrypted[:-1]] == [vector["address"] for vector in vectors]
+    assert isinstance(decrypted[-1], PassphraseError)
+
+    with pytest.raises(NetworkError):
+        bip38.decrypt_many(items=[], network="FAKE_NETWORK")
+
+
+def test_bip38_worker_settings(_):
+
+    bip38: BIP38 = BIP38(
+        cryptocurrency=Bitcoin, network="testnet", pass_factor_cache=PassFactorCache(maxsize=8), point_cache=PointCache(maxsize=4)
+    )
+    settings: dict = bip38._worker_settings()
+    assert settings["scrypt_backend"] == calibrate()["selected"] and bip38.scrypt_backend is AutoScrypt
+    worker: BIP38 = BIP38._from_worker_settings(settings)
+    assert (worker.cryptocurrency, worker.network) == (Bitcoin, "testnet")
+    assert (worker.pass_factor_cache.maxsize, worker.point_cache.maxsize) == (8, 4)
+    assert worker.pass_factor_cache is not bip38.pass_factor_cache
+
+    initializer, initargs = bip38.worker_initializer()
+    assert initargs == (settings,)
+
+    # Pool workers use the configured backend rather than a default one
+    vector: dict = _["bip38"]["encrypt"][0]
+    bip38 = BIP38(cryptocurrency=Bitcoin, network=vector["network"], scrypt_backend=SaltedScrypt)
+    encrypted_wif: str = bip38.encrypt(wif=vector["wif"], passphrase=vector["passphrase"])
+    reencrypted_wif: str = bip38.reencrypt(encrypted_wif=encrypted_wif, old_passphrase=vector["passphrase"], new_passphrase="Satoshi")
+    assert encrypted_wif != vector["encrypted_wif"]
+    for workers in [1, 2]:
+        assert bip38.encrypt_many(pairs=[(vector["wif"], vector["passphrase"])] * 2, workers=workers) == [encrypted_wif] * 2
+        assert bip38.decrypt_many(
+            items=[(encrypted_wif, vector["passphrase"]), (vector["encrypted_wif"], vector["passphrase"])], workers=workers
+        )[0] == vector["wif"]
+        assert list(bip38.reencrypt_many(
+            items=[(encrypted_wif, vector["passphrase"], "Satoshi")] * 2, workers=workers, chunk_size=1
+        )) == [reencrypted_wif] * 2
+
+
+def test_bip38_reencrypt(_):
+
+    # An uncompressed and a compressed non-EC key, and an EC-multiplied key
+    vectors: list = [
+        vector for vector in _["bip38"]["decrypt"] if vector["network"] == "mainnet"
+    ]
+    vectors = [vectors[0], vectors[2], [vector for vector in vectors if vector["seed"]][0]]
+    bip38: BIP38 = BIP38(
+        cryptocurrency=Bitcoin, network="mainnet"
+    )
+    expected: list = []
+    for vector in vectors:
+        reencrypted: str = bip38.reencrypt(
+            encrypted_wif=vector["encrypted_wif"], old_passphrase=vector["passphrase"], new_passphrase="NEW_PASSPHRASE"
+        )
+        decrypted: dict = bip38.decrypt(encrypted_wif=reencrypted, passphrase="NEW_PASSPHRASE", detail=True)
+        assert (decrypted["wif"], decrypted["address"], decrypted["seed"]) == (vector["wif"], vector["address"], None)
+        expected.append(reencrypted)
+    # The same key and address hash, so non-EC keys re-encrypt like a fresh encryption
+    assert expected[0] == bip38.encrypt(wif=vectors[0]["wif"], passphrase="NEW_PASSPHRASE")
+
+    with pytest.raises(PassphraseError):
+        bip38.reencrypt(
+            encrypted_wif=vectors[0]["encrypted_wif"], old_passphrase="FAKE_PASSPHRASE", new_passphrase="NEW_PASSPHRASE"
+        )
+
+    items: list = [
+        (vector["encrypted_wif"], vector["passphrase"], "NEW_PASSPHRASE") for vector in vectors
+    ] + [(vectors[0]["encrypted_wif"], "FAKE_PASSPHRASE", "NEW_PASSPHRASE")]
+    reencrypted: list = list(bip38.reencrypt_many(items=iter(items), workers=2, chunk_size=3))
+    assert reencrypted[:-1] == expected
+    assert isinstance(reencrypted[-1], PassphraseError)
+    assert list(bip38.reencrypt_many(items=iter(items[:1]), workers=1)) == expected[:1]
+
+    with pytest.raises(NetworkError):
+        list(bip38.reencrypt_many(items=[], network="FAKE_NETWORK"))
+    with pytest.raises(Error):
+        list(bip38.reencrypt_many(items=[], chunk_size=0))
+
+
+def test_bip38_try_decrypt(_):
+
+    for vector in _["bip38"]["decrypt"][::3]:
+        bip38: BIP38 = BIP38(
+            cryptocurrency=Bitcoin, network=vector["network"]
+        )
+        assert bip38.try_decrypt(
+            encrypted_wif=vector["encrypted_wif"], passphrase=vector["passphrase"]
+        ) == vector["private_key"]
+        assert bip38.check_passphrase(encrypted_wif=vector["encrypted_wif"], passphrase=vector["passphrase"])
+        assert bip38.try_decrypt(encrypted_wif=vector["encrypted_wif"], passphrase="FAKE_PASSPHRASE") is None
+        assert not bip38.check_passphrase(encrypted_wif=vector["encrypted_wif"], passphrase="FAKE_PASSPHRASE")
+
+    vector: dict = _["bip38"]["decrypt"][0]
+    bip38: BIP38 = BIP38(
+        cryptocurrency=Bitcoin, network="mainnet"
+    )
+    # Malformed encrypted WIFs and networks are not wrong passphrases
+    with pytest.raises(WIFError):
+        bip38.try_decrypt(encrypted_wif=vector["encrypted_wif"][:-2], passphrase=vector["passphrase"])
+    with pytest.raises(Error):
+        bip38.check_passphrase(encrypted_wif="6" * 58, passphrase=vector["passphrase"])
+    with pytest.raises(NetworkError):
+        bip38.check_passphrase(encrypted_wif=vector["encrypted_wif"], passphrase=vector["passphrase"], network="FAKE_NETWORK")
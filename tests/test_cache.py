@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+
+# Copyright © 2023-2024, Meheret Tesfaye Batu <meherett.batu@gmail.com>
+# Distributed under the MIT software license, see the accompanying
+# file COPYING or https://opensource.org/license/mit
+
+import pytest
+
+from bip38.bip38 import BIP38
+from bip38.cache import (
+    PassFactorCache, PointCache
+)
+from bip38.cryptocurrencies import Bitcoin
+from bip38.exceptions import (
+    Error, PassphraseError
+)
+
+
+def test_pass_factor_cache():
+
+    cache: PassFactorCache = PassFactorCache(maxsize=2)
+    keys: list = [
+        cache.key(passphrase="TestingOneTwoThree", owner_salt=bytes([index]) * 8) for index in range(3)
+    ]
+
+    assert cache.key("\u00c5", b"\x00" * 8) == cache.key("A\u030a", b"\x00" * 8)
+    assert cache.key("TestingOneTwoThree", b"\x00" * 4) != cache.key("TestingOneTwoThree", b"\x00" * 8)
+
+    assert cache.get(keys[0]) is None
+    cache.put(keys[0], b"\x01" * 32)
+    cache.put(keys[1], b"\x03" * 32)
+    assert cache.get(keys[0]) == b"\x01" * 32
+
+    evicted: bytearray = cache._entries[keys[1]]
+    cache.put(keys[2], b"\x05" * 32)
+    assert len(cache) == 2
+    assert cache.get(keys[1]) is None
+    assert evicted == bytearray(32)
+    assert (cache.hits, cache.misses) == (1, 2)
+
+    # Lookups hand out copies, only the cache's own buffers are wiped
+    copy: bytes = cache.get(keys[2])
+    cache.clear()
+    assert copy == b"\x05" * 32
+    assert len(cache) == 0
+
+    assert cache.get_derived(keys[0]) is None
+    for index in range(3):
+        cache.put_derived(keys[index], bytes([index + 1]) * 32, b"\x02" * 33)
+    evicted: bytearray = cache._derived[keys[1]][0]
+    assert cache.get_derived(keys[2]) == (b"\x03" * 32, b"\x02" * 33)
+    cache.put_derived(keys[0], b"\x04" * 32, b"\x03" * 33)
+    assert cache.get_derived(keys[1]) is None
+    assert evicted == bytearray(32)
+    assert (cache.derived_hits, cache.derived_misses) == (1, 2)
+    cache.clear()
+    assert cache.get_derived(keys[0]) is None
+
+    with pytest.raises(Error):
+        PassFactorCache(maxsize=0)
+
+
+def test_pass_factor_cache_lot_and_sequence():
+
+    bip38: BIP38 = BIP38(cryptocurrency=Bitcoin, network="mainnet")
+    encrypted_wifs: list = [
+        bip38.create_new_encrypted_wif(
+            intermediate_passphrase=intermediate_passphrase, seed=bytes([index]) * 24
+        )["encrypted_wif"] for index, intermediate_passphrase in enumerate(bip38.intermediate_codes(
+            passphrase="TestingOneTwoThree", lot=199999, sequences=[1, 2], owner_salt="75ed1cde"
+        ))
+    ]
+
+    # Both sequences of the lot share the scrypt pre-factor of the passphrase and owner salt
+    cache: PassFactorCache = PassFactorCache()
+    bip38 = BIP38(cryptocurrency=Bitcoin, network="mainnet", pass_factor_cache=cache)
+    wifs: list = [
+        bip38.decrypt(encrypted_wif=encrypted_wif, passphrase="TestingOneTwoThree") for encrypted_wif in encrypted_wifs
+    ]
+    assert len(set(wifs)) == 2
+    assert (cache.misses, cache.hits, len(cache)) == (1, 1, 1)
+    assert (cache.derived_misses, cache.derived_hits) == (2, 0)
+
+    # Decrypting again skips both the scrypt and the EC multiplication
+    assert bip38.decrypt(encrypted_wif=encrypted_wifs[0], passphrase="TestingOneTwoThree") == wifs[0]
+    assert (cache.misses, cache.hits, cache.derived_hits) == (1, 1, 1)
+
+
+def test_pass_factor_cache_decrypt(_):
+
+    cache: PassFactorCache = PassFactorCache()
+    for index in range(len(_["bip38"]["decrypt"])):
+        bip38: BIP38 = BIP38(
+            cryptocurrency=Bitcoin, network=_["bip38"]["decrypt"][index]["network"], pass_factor_cache=cache
+        )
+        for _attempt in range(2):
+            assert bip38.decrypt(
+                encrypted_wif=_["bip38"]["decrypt"][index]["encrypted_wif"],
+                passphrase=_["bip38"]["decrypt"][index]["passphrase"]
+            ) == _["bip38"]["decrypt"][index]["wif"]
+
+    # The second attempts are served by the derived pass factors and points
+    assert cache.derived_hits == len(cache) > 0
+    assert cache.hits == 0
+
+    for index in range(len(_["bip38"]["confirm_code"])):
+        bip38: BIP38 = BIP38(
+            cryptocurrency=Bitcoin, network="mainnet", pass_factor_cache=cache
+        )
+        assert bip38.confirm_code(
+            passphrase=_["bip38"]["confirm_code"][index]["passphrase"],
+            confirmation_code=_["bip38"]["confirm_code"][index]["confirmation_code"]
+        ) == _["bip38"]["confirm_code"][index]["address"]
+
+        with pytest.raises(PassphraseError):
+            bip38.confirm_code(
+                passphrase="FAKE_PASSPHRASE",
+                confirmation_code=_["bip38"]["confirm_code"][index]["confirmation_code"]
+            )
+
+
+def test_point_cache(_):
+
+    cache: PointCache = PointCache(maxsize=2)
+    points: list = list(dict.fromkeys(
+        bytes.fromhex(item["public_key"]) for item in _["bip38"]["decrypt"] if len(item["public_key"]) == 66
+    ))
+    assert cache.get(points[0]) is None
+    assert cache.decompress_many(points[:2] + points[:2]) == [cache.decompress(point) for point in points[:2]] * 2
+    assert (cache.hits, cache.misses, len(cache)) == (4, 3, 2)
+    cache.decompress(points[2])
+    assert len(cache) == 2 and cache.get(points[0]) is None
+    with pytest.raises(Error):
+        cache.decompress(b"\x02" + bytes(32))
+    assert len(cache) == 2
+
+    cache.clear()
+    assert len(cache) == 0
+    with pytest.raises(Error):
+        PointCache(maxsize=0)
+
+    # Minting and confirming against the same intermediate code only decompresses its pass point once
+    cache = PointCache()
+    bip38: BIP38 = BIP38(cryptocurrency=Bitcoin, network="mainnet", point_cache=cache)
+    for item in _["bip38"]["create_new_encrypted_wif"]:
+        for _attempt in range(2):
+            assert bip38.create_new_encrypted_wif(
+                intermediate_passphrase=item["intermediate_passphrase"], wif_type=item["wif_type"], seed=item["seed"]
+            )["encrypted_wif"] == item["encrypted_wif"]
+    assert (cache.hits, cache.misses) == (2, 2)
+    for item in _["bip38"]["confirm_code"]:
+        assert bip38.confirm_code(
+            passphrase=item["passphrase"], confirmation_code=item["confirmation_code"]
+        ) == item["address"]
@@ -4,10 +4,17 @@
 # Distributed under the MIT software license, see the accompanying
 # file COPYING or https://opensource.org/license/mit
 
+import hashlib
+import os
 
+import pytest
+
+from bip38 import crypto, backends
 from bip38.crypto import (
-    ripemd160, sha256, double_sha256, get_checksum, hash160
+    ripemd160, sha256, double_sha256, get_checksum, hash160, ripemd160_many, hash160_many,
+    ripemd160_backend, RIPEMD160_BACKENDS, RIPEMD160_TEST_VECTOR
 )
+from bip38.libs.ripemd160 import ripemd160 as r160
 from bip38.utils import get_bytes
 
 
@@ -27,3 +34,38 @@ def test_crypto(_):
 
     assert isinstance(hash160(data=_["crypto"]["data"]), bytes)
     assert hash160(data=_["crypto"]["data"]) == get_bytes(_["crypto"]["hash160"])
+
+
+def test_ripemd160_backends():
+
+    selection = ripemd160_backend()
+    assert selection["selected"] == selection["available"][0]
+    assert selection["available"][-1] == "python"
+    assert backends()["ripemd160"] == selection
+    for name in selection["available"]:
+        assert RIPEMD160_BACKENDS[name](RIPEMD160_TEST_VECTOR["message"]) == RIPEMD160_TEST_VECTOR["digest"]
+
+    # Differential check of the unrolled fallback around the padding boundaries
+    for length in [0, 1, 32, 55, 56, 63, 64, 65, 119, 120, 200]:
+        data = os.urandom(length)
+        assert r160(data) == ripemd160(data)
+
+
+def test_ripemd160_many(monkeypatch, _):
+
+    assert hash160_many([_["crypto"]["data"]]) == [get_bytes(_["crypto"]["hash160"])]
+    assert ripemd160_many([]) == []
+
+    items = [os.urandom(32) for _ in range(crypto.NUMPY_BATCH_THRESHOLD)] + [os.urandom(33)]
+    assert ripemd160_many(items) == [r160(data) for data in items]
+    assert hash160_many(items) == [r160(hashlib.sha256(data).digest()) for data in items]
+
+    if crypto.numpy is None:  # pragma: no cover
+        pytest.skip("numpy is not installed")
+    # Force the NumPy multi-message kernel, as on hosts without a native RIPEMD-160
+    monkeypatch.setitem(crypto._selection, "selected", "python")
+    monkeypatch.setattr(crypto, "_ripemd160", r160)
+    for length in [20, 32, 33, 65, 64]:
+        items = [os.urandom(length) for _ in range(crypto.NUMPY_BATCH_THRESHOLD)]
+        assert ripemd160_many(items) == [r160(data) for data in items]
+    assert hash160_many(items) == [r160(hashlib.sha256(data).digest()) for data in items]
@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+
+# Copyright © 2023-2024, Meheret Tesfaye Batu <meherett.batu@gmail.com>
+# Distributed under the MIT software license, see the accompanying
+# file COPYING or https://opensource.org/license/mit
+
+import hashlib
+import pytest
+import time
+import os
+
+from bip38 import backends
+from bip38.bip38 import BIP38
+from bip38.cryptocurrencies import Bitcoin
+from bip38.exceptions import Error
+from bip38.kdf import (
+    SCRYPT_BACKENDS, SCRYPT_TEST_VECTOR, IScrypt, AutoScrypt, NumpyScrypt, ParallelScrypt, calibrate,
+    get_scrypt_backend, scrypt_many, native_ro_mix
+)
+from bip38.libs.scrypt import ro_mix
+
+VECTORS: list = [
+    ("password", "NaCl", 64, 4, 4, 64),
+    (b"\xcf\x92\xcc\x81", b"\x00" * 4, 16, 8, 8, 32),
+    ("TestingOneTwoThree", b"\x01\x02\x03\x04", 64, 2, 3, 64),
+    ("TestingOneTwoThree", b"\x01\x02\x03\x04", 1024, 1, 1, 64)
+]
+
+
+def reference(password, salt, n, r, p, buflen=64) -> bytes:
+    return hashlib.scrypt(
+        password.encode() if isinstance(password, str) else password,
+        salt=salt.encode() if isinstance(salt, str) else salt, n=n, r=r, p=p, dklen=buflen
+    )
+
+
+def test_scrypt_backends():
+
+    for name, backend in SCRYPT_BACKENDS.items():
+        if not backend.is_available():
+            with pytest.raises(Error):
+                get_scrypt_backend(name)
+            continue
+        assert get_scrypt_backend(name) is backend
+        for vector in VECTORS:
+            assert backend.hash(*vector) == reference(*vector)
+
+    calibration: dict = calibrate()
+    assert calibration["selected"] in calibration["available"]
+    assert not SCRYPT_BACKENDS[calibration["selected"]].FALLBACK
+    assert set(calibration["timings"]) <= set(calibration["available"])
+    assert backends()["scrypt"] == calibration
+    assert get_scrypt_backend() is SCRYPT_BACKENDS[calibration["selected"]]
+    assert AutoScrypt.hash(
+        SCRYPT_TEST_VECTOR["password"], SCRYPT_TEST_VECTOR["salt"], SCRYPT_TEST_VECTOR["N"],
+        SCRYPT_TEST_VECTOR["r"], SCRYPT_TEST_VECTOR["p"], SCRYPT_TEST_VECTOR["buflen"]
+    ) == SCRYPT_TEST_VECTOR["key"]
+
+    with pytest.raises(NotImplementedError):
+        IScrypt.hash("password", "NaCl")
+    assert IScrypt.__abstractmethods__ == frozenset(["hash"])
+    with pytest.raises(TypeError):
+        type("IncompleteScrypt", (IScrypt,), dict(NAME="incomplete"))()
+    with pytest.raises(Error):
+        get_scrypt_backend("FAKE_BACKEND")
+
+
+def test_numpy_scrypt(monkeypatch):
+
+    if not NumpyScrypt.is_available():
+        pytest.skip("numpy is not installed")
+
+    passwords: list = ["password", b"\xcf\x92\xcc\x81", "TestingOneTwoThree", ""]
+    salts: list = ["NaCl", b"\x00" * 4, b"\x01\x02\x03\x04", ""]
+    for n, r, p in [(16, 1, 1), (64, 2, 3), (1024, 1, 1)]:
+        expected: list = [reference(password, salt, n, r, p) for password, salt in zip(passwords, salts)]
+        assert NumpyScrypt.hash_many(passwords, salts, n, r, p) == expected
+        monkeypatch.setattr(NumpyScrypt, "MAX_MEMORY", 128 * r * n * p)
+        assert NumpyScrypt.hash_many(passwords, salts, n, r, p) == expected
+        monkeypatch.undo()
+
+    with pytest.raises(Error):
+        NumpyScrypt.hash_many(passwords, salts[:2], 16, 1, 1)
+    with pytest.raises(Error):
+        NumpyScrypt.hash_many(passwords, salts, 1000, 1, 1)
+
+
+def test_scrypt_many():
+
+    class SingleScrypt:
+
+        @classmethod
+        def hash(cls, *args):
+            return reference(*args)
+
+    passwords: list = ["password", "TestingOneTwoThree"]
+    salts: list = ["NaCl", b"\x01\x02\x03\x04"]
+    expected: list = [reference(password, salt, 1024, 1, 1, 32) for password, salt in zip(passwords, salts)]
+    for backend in [None, "python", AutoScrypt, SingleScrypt]:
+        assert scrypt_many(passwords, salts, 1024, 1, 1, 32, backend=backend) == expected
+    assert scrypt_many([], [], 1024, 1, 1) == []
+
+    with pytest.raises(Error):
+        scrypt_many(passwords, salts[:1], 1024, 1, 1, backend=SingleScrypt)
+
+
+def test_parallel_scrypt(monkeypatch):
+
+    for executor in ["thread", "process"]:
+        engine: ParallelScrypt = ParallelScrypt(workers=2, executor=executor)
+        for vector in VECTORS:
+            assert engine.hash(*vector) == reference(*vector)
+        engine.close()
+
+    # Without the native lane kernel every call goes to the fallback engine, never to a pure-Python ROMix
+    class CountingScrypt:
+
+        calls: int = 0
+
+        @classmethod
+        def hash(cls, *args):
+            cls.calls += 1
+            return reference(*args)
+
+    monkeypatch.setattr(ParallelScrypt, "is_available", staticmethod(lambda: False))
+    assert ParallelScrypt(workers=2, fallback=CountingScrypt).hash(*VECTORS[0]) == reference(*VECTORS[0])
+    assert CountingScrypt.calls == 1
+    monkeypatch.undo()
+
+    with pytest.raises(Error):
+        ParallelScrypt(executor="FAKE_EXECUTOR")
+    with pytest.raises(Error):
+        ParallelScrypt(workers=1).hash("password", "NaCl", 1000, 8, 8)
+
+
+def test_native_ro_mix():
+
+    # Compiled with the package, see setup.py
+    assert ParallelScrypt.is_available()
+    for n, r in [(2, 1), (16, 1), (64, 4)]:
+        lane: bytes = bytes(range(256)) * (r // 2) if r > 1 else bytes(range(128))
+        assert native_ro_mix(lane, n, r) == ro_mix(lane, n, r)
+    for lane, n, r in [(bytes(127), 16, 1), (bytes(128), 15, 1), (bytes(128), 1, 1), (bytes(128), 16, 0)]:
+        with pytest.raises(ValueError):
+            native_ro_mix(lane, n, r)
+
+
+def test_parallel_scrypt_latency():
+
+    # The BIP38 decryption scrypt, 8 lanes of N=16384 and r=8, against OpenSSL running them in turn.
+    # The kernel beats OpenSSL per lane, so the engine wins on a single core too, and more with more cores
+    def best(function) -> float:
+        timings: list = []
+        for _ in range(3):
+            start: float = time.perf_counter()
+            function()
+            timings.append(time.perf_counter() - start)
+        return min(timings)
+
+    engine: ParallelScrypt = ParallelScrypt(workers=8)
+    engine.hash("TestingOneTwoThree", b"\x01" * 8, 16384, 8, 8)
+    parallel: float = best(lambda: engine.hash("TestingOneTwoThree", b"\x01" * 8, 16384, 8, 8))
+    native: float = best(lambda: reference("TestingOneTwoThree", b"\x01" * 8, 16384, 8, 8))
+    engine.close()
+    assert parallel < native
+
+
+def test_bip38_scrypt_backend(_):
+
+    class CountingScrypt:
+
+        calls: int = 0
+
+        @classmethod
+        def hash(cls, *args):
+            cls.calls += 1
+            return reference(*args)
+
+    vector: dict = _["bip38"]["encrypt"][0]
+    for scrypt_backend in [CountingScrypt, "hashlib"]:
+        bip38: BIP38 = BIP38(
+            cryptocurrency=Bitcoin, network=vector["network"], scrypt_backend=scrypt_backend
+        )
+        assert bip38.encrypt(
+            wif=vector["wif"], passphrase=vector["passphrase"]
+        ) == vector["encrypted_wif"]
+    assert CountingScrypt.calls == 1
+    assert BIP38.scrypt_backend is AutoScrypt
+
+    with pytest.raises(Error):
+        BIP38(cryptocurrency=Bitcoin, scrypt_backend="FAKE_BACKEND")
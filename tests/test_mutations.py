@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+
+# Copyright © 2023-2024, Meheret Tesfaye Batu <meherett.batu@gmail.com>
+# Distributed under the MIT software license, see the accompanying
+# file COPYING or https://opensource.org/license/mit
+
+import unicodedata
+import pytest
+
+from bip38.mutations import (
+    BloomFilter, Mutations
+)
+from bip38.recovery import Recovery
+from bip38.exceptions import Error
+
+
+def test_bloom_filter():
+
+    bloom_filter: BloomFilter = BloomFilter(capacity=3, error_rate=1e-6)
+    assert [bloom_filter.add(item) for item in ["a", "b", "a", "c", "d", "d"]] == [True, True, False, True, True, True]
+    assert len(bloom_filter) == 3 and "a" in bloom_filter and "d" not in bloom_filter
+    bloom_filter.clear()
+    assert len(bloom_filter) == 0 and "a" not in bloom_filter
+
+    with pytest.raises(Error):
+        BloomFilter(capacity=0)
+    with pytest.raises(Error):
+        BloomFilter(error_rate=1)
+
+
+def test_mutations(_):
+
+    assert list(Mutations(passphrase="ab", depth=0)) == ["ab"]
+    assert list(Mutations.mutate(passphrase="abc", rules=["swap", "delete"])) == ["bac", "acb", "bc", "ac", "ab"]
+    assert list(Mutations.mutate(passphrase="Q", rules=["keyboard"])) == ["W", "1", "2", "A"]
+    assert list(Mutations.mutate(passphrase="é’", rules=["unicode"])) == ["e’", "é'"]
+    assert list(Mutations.mutate(passphrase="ｆ", rules=["unicode"])) == ["f"]
+
+    # Candidates equal under NFC are tested once, the decomposed passphrase comes out composed
+    mutations: Mutations = Mutations(passphrase=unicodedata.normalize("NFD", "Cafè"), depth=2)
+    candidates: list = list(mutations)
+    assert candidates[0] == "Cafè" and len(candidates) == len(set(candidates)) and mutations.skipped > 0
+    assert all(unicodedata.is_normalized("NFC", candidate) for candidate in candidates)
+    assert {"cAFÈ", "Cafe", "Caf", "aCfè", "CaFe"} <= set(candidates)
+    assert list(mutations) == candidates
+
+    # Past the exact set, the filter deduplicates, and concurrent iterations do not share their state
+    mutations = Mutations(passphrase=unicodedata.normalize("NFD", "Cafè"), depth=2, capacity=len(candidates) // 2 + 1)
+    assert list(mutations) == candidates
+    first, second = iter(mutations), iter(mutations)
+    assert [next(first) for _ in range(10)] == [next(second) for _ in range(10)] == candidates[:10]
+
+    with pytest.raises(Error):
+        Mutations(passphrase="ab", rules=["FAKE_RULE"])
+    with pytest.raises(Error):
+        Mutations(passphrase="ab", depth=-1)
+    with pytest.raises(Error):
+        Mutations(passphrase="ab", capacity=0)
+
+    vector: dict = _["bip38"]["decrypt"][0]
+    typo: str = vector["passphrase"][1] + vector["passphrase"][0] + vector["passphrase"][2:]
+    recovery: Recovery = Recovery(encrypted_wif=vector["encrypted_wif"], workers=1)
+    assert recovery.run(candidates=Mutations(passphrase=typo, rules=["swap"]))["wif"] == vector["wif"]
+    assert recovery.tested == 2
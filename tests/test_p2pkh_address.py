@@ -32,3 +32,13 @@ def test_p2pkh_address(_):
         public_key_address_prefix=int(_["p2pkh_address"]["uncompressed"]["args"]["public_key_address_prefix"], base=16),
         public_key_type=_["p2pkh_address"]["uncompressed"]["args"]["public_key_type"]
     ) == _["p2pkh_address"]["uncompressed"]["decode"]
+
+
+def test_p2pkh_address_encode_many(_):
+
+    for public_key_type in ["compressed", "uncompressed"]:
+        vector: dict = _["p2pkh_address"][public_key_type]
+        for count in [1, 200]:
+            assert P2PKHAddress.encode_many(
+                public_keys=[vector["public_key"]] * count, public_key_type=vector["args"]["public_key_type"]
+            ) == [vector["encode"]] * count
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+
+# Copyright © 2023-2024, Meheret Tesfaye Batu <meherett.batu@gmail.com>
+# Distributed under the MIT software license, see the accompanying
+# file COPYING or https://opensource.org/license/mit
+
+import hashlib
+import json
+
+import pytest
+
+from bip38.bip38 import BIP38
+from bip38.cache import PassFactorCache
+from bip38.cryptocurrencies import Bitcoin
+from bip38.recovery import Recovery
+from bip38.exceptions import (
+    Error, NetworkError, WIFError
+)
+
+
+class SaltedScrypt:
+    # A scrypt backend deriving other keys than scrypt, to tell whether a worker process used it
+
+    @classmethod
+    def hash(cls, password, salt, N=16384, r=8, p=1, buflen=64):
+        return hashlib.scrypt(
+            password.encode() if isinstance(password, str) else password,
+            salt=b"SALTED" + salt, n=N, r=r, p=p, dklen=buflen, maxmem=1 << 26
+        )
+
+
+def test_recovery(_):
+
+    vector: dict = _["bip38"]["decrypt"][0]
+    reports: list = []
+    recovered: dict = Recovery(encrypted_wif=vector["encrypted_wif"], workers=1, chunk_size=2).run(
+        candidates=["FAKE_PASSPHRASE_1", "FAKE_PASSPHRASE_2", vector["passphrase"], "FAKE_PASSPHRASE_3"],
+        progress=reports.append,
+        progress_interval=0
+    )
+    assert (recovered["passphrase"], recovered["wif"], recovered["address"]) == (
+        vector["passphrase"], vector["wif"], vector["address"]
+    )
+    assert [report["tested"] for report in reports] == [2, 3]
+    assert reports[-1]["new"] == 3 and reports[-1]["rate"] > 0
+
+    # EC-multiplied keys across a process pool
+    vector = [vector for vector in _["bip38"]["decrypt"] if vector["seed"] and vector["network"] == "mainnet"][0]
+    recovery: Recovery = Recovery(encrypted_wif=vector["encrypted_wif"], workers=2, chunk_size=1)
+    assert recovery.run(candidates=iter(["FAKE_PASSPHRASE_1", vector["passphrase"], "FAKE_PASSPHRASE_2"]))["wif"] == vector["wif"]
+    assert recovery.tested == 2
+
+    with pytest.raises(WIFError):
+        Recovery(encrypted_wif=vector["encrypted_wif"][:-1] + "1")
+    with pytest.raises(NetworkError):
+        Recovery(encrypted_wif=vector["encrypted_wif"], network="FAKE_NETWORK")
+    with pytest.raises(Error):
+        Recovery(encrypted_wif=vector["encrypted_wif"], chunk_size=0)
+
+
+def test_recovery_checkpoint(_, tmp_path):
+
+    vector: dict = _["bip38"]["decrypt"][1]
+    checkpoint: str = str(tmp_path / "recovery.json")
+    candidates: list = ["FAKE_PASSPHRASE_1", "FAKE_PASSPHRASE_2", "FAKE_PASSPHRASE_3"]
+
+    recovery: Recovery = Recovery(
+        encrypted_wif=vector["encrypted_wif"], network=vector["network"], workers=1, checkpoint=checkpoint
+    )
+    assert recovery.run(candidates=candidates) is None
+    with open(checkpoint, "r", encoding="utf-8") as file:
+        state: dict = json.load(file)
+    assert state["tested"] == 3 and "FAKE_PASSPHRASE_1" not in json.dumps(state)
+
+    # Resumed with a longer stream, the candidates already tested are skipped, not tested again
+    def stream():
+        for candidate in candidates:
+            yield candidate
+        yield vector["passphrase"]
+
+    recovery = Recovery(
+        encrypted_wif=vector["encrypted_wif"], network=vector["network"], workers=1, checkpoint=checkpoint
+    )
+    assert recovery.tested == 3
+    reports: list = []
+    assert recovery.run(candidates=stream(), progress=reports.append)["wif"] == vector["wif"]
+    assert (recovery.tested, reports[-1]["new"]) == (4, 1)
+
+    with pytest.raises(Error):
+        Recovery(encrypted_wif=_["bip38"]["decrypt"][0]["encrypted_wif"], checkpoint=checkpoint)
+    with open(checkpoint, "w", encoding="utf-8") as file:
+        file.write("{")
+    with pytest.raises(Error):
+        Recovery(encrypted_wif=vector["encrypted_wif"], network=vector["network"], checkpoint=checkpoint)
+
+
+def test_recovery_worker_settings(_):
+
+    vector: dict = _["bip38"]["decrypt"][0]
+    encrypted_wif: str = BIP38(
+        cryptocurrency=Bitcoin, network=vector["network"], scrypt_backend=SaltedScrypt
+    ).encrypt(wif=vector["wif"], passphrase=vector["passphrase"])
+    # Workers test candidates with the backends of the recovery, not the default ones
+    for workers in [1, 2]:
+        recovery: Recovery = Recovery(
+            encrypted_wif=encrypted_wif,
+            network=vector["network"],
+            workers=workers,
+            chunk_size=1,
+            pass_factor_cache=PassFactorCache(),
+            scrypt_backend=SaltedScrypt,
+            aes_backend="python"
+        )
+        assert recovery.run(candidates=["FAKE_PASSPHRASE_1", vector["passphrase"]])["wif"] == vector["wif"]
+        assert recovery.tested == 2
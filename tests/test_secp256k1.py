@@ -4,14 +4,25 @@
 # Distributed under the MIT software license, see the accompanying
 # file COPYING or https://opensource.org/license/mit
 
+import random
+
+import pytest
 from ecdsa import (
-    SigningKey, VerifyingKey
+    SigningKey, VerifyingKey, curves
 )
+from ecdsa.ecdsa import generator_secp256k1
 from ecdsa.ellipticcurve import PointJacobi
 
 from bip38.secp256k1 import (
-    Secp256k1, Point, PublicKey, PrivateKey
+    Secp256k1, Point, PublicKey, PrivateKey, CompactPublicKey, CompactPrivateKey
+)
+from bip38.secp256k1 import ecmult
+from bip38.secp256k1.ecmult import (
+    GeneratorTable, generator_multiply, use_generator_table, jacobian_add, jacobian_double,
+    batch_to_affine, to_affine, glv_split, wnaf, multiply, generator_multiply_many, N, WINDOW, TABLE_HEADER,
+    LAMBDA, BETA, P, decompress, decompress_many
 )
+from bip38.exceptions import Secp256k1Error
 from bip38.utils import get_bytes
 
 
@@ -40,6 +51,9 @@ def test_secp256k1_point(_):
         assert point.raw_encoded() == get_bytes(_["secp256k1"][public_key_type]["point"]["encode"])
         assert point.raw() == point.raw_decoded() == get_bytes(_["secp256k1"][public_key_type]["point"]["decode"])
 
+        # Test fixed-base precomputation
+        assert (point.precomputed() * 0xdeadbeef).raw() == (point * 0xdeadbeef).raw()
+
         # Test from coordinate
         point = Point.from_coordinates(
             x=_["secp256k1"][public_key_type]["point"]["x"],
@@ -83,3 +97,233 @@ def test_secp256k1_private_key(_):
     assert private_key.raw() == get_bytes(_["secp256k1"]["private_key"])
     assert private_key.public_key().raw_uncompressed() == get_bytes(_["secp256k1"]["uncompressed"]["public_key"])
     assert private_key.public_key().raw_compressed() == get_bytes(_["secp256k1"]["compressed"]["public_key"])
+
+
+def test_secp256k1_ecmult():
+
+    # Window boundaries, signed digit carries and random scalars against ecdsa
+    scalars = [1, 2, 3, N - 1, N - 2, 2 ** 255, 2 ** 256 - 1] + [
+        (2 ** (WINDOW * i)) + d for i in range(0, 256 // WINDOW) for d in (-1, 0, 1) if i or d >= 0
+    ] + [(2 ** (WINDOW - 1)) * 3, (2 ** WINDOW - 1) * 2 ** 64] + [random.randrange(1, N) for _ in range(64)]
+    for scalar in scalars:
+        expected = generator_secp256k1 * scalar
+        assert generator_multiply(scalar) == (expected.x(), expected.y())
+        assert (Secp256k1.GENERATOR * scalar).raw() == Point(expected).raw()
+    assert generator_multiply(0) is None and generator_multiply(N) is None
+
+    point, other = (generator_secp256k1.x(), generator_secp256k1.y(), 1), (generator_secp256k1 * 5)
+    doubled = jacobian_double(point)
+    assert to_affine(doubled) == ((generator_secp256k1 * 2).x(), (generator_secp256k1 * 2).y())
+    assert to_affine(jacobian_add(doubled, point)) == ((generator_secp256k1 * 3).x(), (generator_secp256k1 * 3).y())
+    assert batch_to_affine([doubled, (0, 1, 0), (other.x(), other.y(), 1)]) == [
+        to_affine(doubled), None, (other.x(), other.y())
+    ]
+
+    for private_key in [b"", bytes(32), N.to_bytes(32, "big"), bytes(31) + b"\x01" + b"\x00"]:
+        with pytest.raises(Secp256k1Error):
+            PrivateKey.from_bytes(private_key)
+    for _ in range(8):
+        private_key = random.randrange(1, N).to_bytes(32, "big")
+        signing_key = SigningKey.from_string(private_key, curve=curves.SECP256k1)
+        assert PrivateKey.from_bytes(private_key).public_key().raw_uncompressed() == \
+            PrivateKey(signing_key).public_key().raw_uncompressed() == \
+            signing_key.get_verifying_key().to_string("uncompressed")
+
+
+def test_secp256k1_generator_table(monkeypatch, tmp_path):
+
+    monkeypatch.setattr(ecmult, "_generator_table", [])
+    scalars = [1, N - 1, 2 ** 256 - 1] + [random.randrange(1, N) for _ in range(16)]
+    expected = [generator_multiply(scalar) for scalar in scalars]
+    with pytest.raises(Secp256k1Error):
+        GeneratorTable.build(window=1)
+
+    path = str(tmp_path / "tables" / "secp256k1.tbl")
+    builds = []
+    build = GeneratorTable.build
+    monkeypatch.setattr(GeneratorTable, "build", classmethod(
+        lambda cls, window=WINDOW: builds.append(window) or build(window=window)
+    ))
+    # Built and saved once, then only mapped
+    for _ in range(3):
+        table = GeneratorTable.open(path, window=5)
+        assert (table.window, table.windows, table.count) == (5, 52, 16)
+        assert [table.multiply(scalar) for scalar in scalars] == expected
+        table.close()
+    assert builds == [5]
+
+    assert use_generator_table(path) is ecmult.generator_table()
+    assert [generator_multiply(scalar) for scalar in scalars] == expected
+    assert [(Secp256k1.GENERATOR * scalar).x() for scalar in scalars] == [point[0] for point in expected]
+    ecmult.generator_table().close()
+
+    data = bytearray(open(path, "rb").read())
+    data[-1] ^= 1
+    with pytest.raises(Secp256k1Error, match="checksum"):
+        GeneratorTable(bytes(data))
+    data[8:12] = (2).to_bytes(4, "big")
+    with pytest.raises(Secp256k1Error, match="version"):
+        GeneratorTable(bytes(data))
+    with pytest.raises(Secp256k1Error, match="magic"):
+        GeneratorTable(bytes(TABLE_HEADER.size))
+
+    # A corrupted file is rebuilt
+    open(path, "wb").write(bytes(data))
+    table = GeneratorTable.open(path, window=5)
+    assert builds == [5, 5] and table.multiply(scalars[0]) == expected[0]
+    table.close()
+
+    # A valid checksum over points that are not multiples of the generator is rejected, and rebuilt
+    forged = build(window=5, base=to_affine(jacobian_double((*expected[0], 1))))
+    with pytest.raises(Secp256k1Error, match="point"):
+        GeneratorTable(forged._data)
+    open(path, "wb").write(forged._data)
+    with pytest.raises(Secp256k1Error, match="point"):
+        GeneratorTable.load(path)
+    table = GeneratorTable.open(path, window=5)
+    assert builds == [5, 5, 5] and [table.multiply(scalar) for scalar in scalars] == expected
+    table.close()
+
+
+def test_secp256k1_glv():
+
+    rng = random.Random(0x38)
+    point = generator_secp256k1 * rng.randrange(1, N)
+    assert to_affine(multiply((point.x(), point.y()), LAMBDA)) == (point.x() * BETA % P, point.y())
+
+    for scalar in [0, 1, 2, N - 1, N, LAMBDA, N - LAMBDA, 2 ** 128, 2 ** 256 - 1] + [
+        rng.randrange(0, 2 ** 256) for _ in range(64)
+    ]:
+        k1, k2 = glv_split(scalar)
+        assert (k1 + k2 * LAMBDA - scalar) % N == 0
+        assert abs(k1) < 2 ** 129 and abs(k2) < 2 ** 129
+        digits = wnaf(scalar, 5)
+        assert sum(digit << index for index, digit in enumerate(digits)) == scalar
+        assert all(digit == 0 or (digit & 1 and -16 < digit < 16) for digit in digits)
+
+    # Randomized differential test of the default variable-base multiply against ecdsa
+    for _ in range(48):
+        point = generator_secp256k1 * rng.randrange(1, N)
+        scalar = rng.choice([rng.randrange(1, N), rng.randrange(1, 2 ** 128), N - rng.randrange(1, 2 ** 64)])
+        expected = Point(point * scalar)
+        assert (Point(point) * scalar).raw() == expected.raw()
+        assert (Point(point).precomputed() * scalar).raw() == expected.raw()
+        assert (scalar * Point(point)).raw_encoded() == expected.raw_encoded()
+        assert (Point(point) * -scalar).raw() == Point(point * (N - scalar)).raw()
+    assert (Point(point) * N).underlying_object() == point * N
+
+
+def test_secp256k1_batch_normalization(tmp_path):
+
+    rng = random.Random(0x16)
+    scalars = [rng.randrange(1, N) for _ in range(12)]
+    private_keys = [scalar.to_bytes(32, "big") for scalar in scalars]
+    expected = [PrivateKey.from_bytes(private_key).public_key() for private_key in private_keys]
+
+    assert generator_multiply_many(scalars + [N]) == [generator_multiply(scalar) for scalar in scalars] + [None]
+    assert [public_key.raw_uncompressed() for public_key in PrivateKey.public_keys_many(
+        private_keys[:6] + [PrivateKey.from_bytes(private_key) for private_key in private_keys[6:]]
+    )] == [public_key.raw_uncompressed() for public_key in expected]
+    assert PrivateKey.public_keys_many([]) == []
+    with pytest.raises(Secp256k1Error):
+        PrivateKey.public_keys_many([bytes(32)])
+
+    # Generator table, GLV, per-point table and plain ecdsa points normalized together
+    base = Point(generator_secp256k1 * rng.randrange(1, N))
+    precomputed = base.precomputed()
+    points = [Secp256k1.GENERATOR * scalars[0], base * scalars[1], precomputed * scalars[2], base, base * N]
+    normalized = Point.normalize_many(points)
+    assert [point.raw() for point in normalized[:4]] == [point.raw() for point in points[:4]]
+    assert normalized[4] is points[4]
+    assert [public_key.raw_compressed() for public_key in PublicKey.from_points_many(points[:4])] == [
+        point.raw_encoded() for point in points[:4]
+    ]
+    with pytest.raises(Secp256k1Error):
+        PublicKey.from_points_many(points)
+    # Points off the curve are rejected rather than encoded
+    with pytest.raises(Secp256k1Error):
+        PublicKey.from_point(Point.from_jacobian(5, 7, 1))
+    with pytest.raises(Secp256k1Error):
+        PublicKey.from_points_many([points[0], Point.from_jacobian(5, 7, 1)])
+    with pytest.raises(Secp256k1Error):
+        GeneratorTable.build(window=3, base=(base.x(), base.y())).save(str(tmp_path / "base.tbl"))
+
+
+def test_secp256k1_public_key_encodings(_):
+
+    public_key = PrivateKey.from_bytes(get_bytes(_["secp256k1"]["private_key"])).public_key()
+    # Encodings are computed once, the verifying key only on demand
+    assert public_key.raw_compressed() is public_key.raw_compressed()
+    assert public_key.raw_uncompressed() is public_key.raw_uncompressed()
+    assert public_key.raw_compressed() == get_bytes(_["secp256k1"]["compressed"]["public_key"])
+    assert public_key.underlying_object().to_string("uncompressed") == public_key.raw_uncompressed()
+    assert public_key.point().raw_encoded() == public_key.raw_compressed()
+
+    x, y = public_key.x, public_key.y
+    assert PublicKey.from_coordinates(x, y).raw_uncompressed() == public_key.raw_uncompressed()
+    for x, y in [(x, y + 1), (x + P, y), (0, 0), (-x, y)]:
+        with pytest.raises(Secp256k1Error):
+            PublicKey.from_coordinates(x, y)
+    with pytest.raises(Secp256k1Error):
+        PublicKey.from_bytes(b"\x04" + bytes(64))
+
+
+def test_secp256k1_compact_keys(_):
+
+    private_key = CompactPrivateKey.from_bytes(get_bytes(_["secp256k1"]["private_key"]))
+    assert private_key.raw() == get_bytes(_["secp256k1"]["private_key"])
+    public_key = private_key.public_key()
+    assert private_key.public_key() is public_key
+    assert public_key.raw_compressed() == get_bytes(_["secp256k1"]["compressed"]["public_key"])
+    assert public_key.raw("uncompressed") == get_bytes(_["secp256k1"]["uncompressed"]["public_key"])
+    # Both encodings decode to the same point, without building an ecdsa key
+    assert CompactPublicKey.from_bytes(public_key.raw_compressed()) == public_key
+    assert CompactPublicKey.from_bytes(public_key.raw_uncompressed()) == public_key
+    assert CompactPublicKey.from_bytes(public_key.raw_uncompressed()[1:]) == public_key
+    for invalid in [b"\x02" + bytes(32), b"\x02" + P.to_bytes(32, "big"), b"\x04" + bytes(64), bytes(33)]:
+        with pytest.raises(Secp256k1Error):
+            CompactPublicKey.from_bytes(invalid)
+    for invalid in [bytes(32), N.to_bytes(32, "big"), bytes(31) + b"\x01" * 2]:
+        with pytest.raises(Secp256k1Error):
+            CompactPrivateKey.from_bytes(invalid)
+    with pytest.raises(AttributeError):
+        public_key.label = "slots"
+
+    # The adapters share the compact keys and their cached encodings
+    adapter = PrivateKey.from_compact(private_key)
+    assert adapter.compact() is private_key and adapter.secret_exponent == private_key.secret_exponent
+    assert adapter.public_key().compact() is public_key
+    assert adapter.public_key().raw_compressed() is public_key.raw_compressed()
+    assert adapter.underlying_object().get_verifying_key().to_string("compressed") == public_key.raw_compressed()
+    assert PublicKey.from_bytes(public_key.raw_compressed()).compact() == public_key
+    assert PrivateKey(adapter.underlying_object()).public_key().raw_uncompressed() == public_key.raw_uncompressed()
+
+    private_keys = [CompactPrivateKey(secret_exponent) for secret_exponent in range(1, 9)]
+    assert CompactPrivateKey.public_keys_many(private_keys[:4] + [key.raw() for key in private_keys[4:]]) == [
+        PrivateKey(secret_exponent=key.secret_exponent).public_key().compact() for key in private_keys
+    ]
+    assert [key.public_key() for key in private_keys[:4]] == CompactPrivateKey.public_keys_many(private_keys[:4])
+
+
+def test_secp256k1_decompression(_):
+
+    rng = random.Random(19)
+    points = [generator_secp256k1 * rng.randrange(1, N) for _index in range(16)]
+    encoded = [point.to_bytes("compressed") for point in points]
+    assert [decompress(point) for point in encoded] == [(point.x(), point.y()) for point in points]
+    assert decompress_many(encoded + encoded[:2]) == [(point.x(), point.y()) for point in points + points[:2]]
+    for invalid in [bytes(33), b"\x02" + bytes(32), b"\x03" + P.to_bytes(32, "big"), encoded[0][:32]]:
+        with pytest.raises(Secp256k1Error):
+            decompress(invalid)
+
+    public_keys = PublicKey.from_bytes_many(encoded + encoded[:1])
+    assert public_keys[0] is public_keys[-1]
+    assert [public_key.raw_uncompressed() for public_key in public_keys[:-1]] == [
+        point.to_bytes("uncompressed") for point in points
+    ]
+    assert CompactPublicKey.from_bytes_many(encoded)[3] == public_keys[3].compact()
+    assert Point.from_bytes(encoded[5]).raw() == points[5].to_bytes("raw")
+    with pytest.raises(Secp256k1Error):
+        Point.from_bytes(b"\x02" + bytes(32))
+    with pytest.raises(Secp256k1Error):
+        PublicKey.from_bytes(b"\x02" + bytes(32))
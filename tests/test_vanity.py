@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+
+# Copyright © 2023-2024, Meheret Tesfaye Batu <meherett.batu@gmail.com>
+# Distributed under the MIT software license, see the accompanying
+# file COPYING or https://opensource.org/license/mit
+
+import pytest
+
+from bip38.bip38 import BIP38
+from bip38.vanity import Vanity
+from bip38.cryptocurrencies import Bitcoin
+from bip38.exceptions import (
+    Error, PassphraseError, WIFError
+)
+
+
+def test_vanity(_):
+
+    vector: dict = _["bip38"]["intermediate_code"][0]
+    bip38: BIP38 = BIP38(cryptocurrency=Bitcoin, network="mainnet")
+
+    reports: list = []
+    vanity: Vanity = Vanity(
+        intermediate_passphrase=vector["intermediate_passphrase"], pattern="1A", wif_type="wif-compressed", workers=1, batch_size=64
+    )
+    found: list = vanity.run(progress=reports.append, progress_interval=0)
+    assert len(found) == 1 and found[0]["address"].startswith("1A") and found[0]["public_key_type"] == "compressed"
+    assert bip38.confirm_code(passphrase=vector["passphrase"], confirmation_code=found[0]["confirmation_code"]) == found[0]["address"]
+    assert bip38.decrypt(encrypted_wif=found[0]["encrypted_wif"], passphrase=vector["passphrase"], detail=True)["address"] == found[0]["address"]
+    assert reports[-1]["found"] == 1 and reports[-1]["tested"] == vanity.tested > 0 and reports[-1]["rate"] > 0
+
+    # Regular expressions across a process pool
+    vanity = Vanity(intermediate_passphrase=vector["intermediate_passphrase"], pattern="[xyz]$", regex=True, workers=2, batch_size=16)
+    found = vanity.run(count=2)
+    assert len(found) == 2 and all(new["address"][-1] in "xyz" for new in found)
+    assert found[0]["seed"] != found[1]["seed"]
+
+    # Cancelled from the progress callback, before any match of a prefix this long
+    vanity = Vanity(intermediate_passphrase=vector["intermediate_passphrase"], pattern="1zzzzzzzzz", workers=1, batch_size=8)
+    assert vanity.run(progress=lambda report: vanity.cancel(), progress_interval=0) == []
+    assert vanity.tested == 16
+
+    with pytest.raises(Error):
+        Vanity(intermediate_passphrase=vector["intermediate_passphrase"], pattern="10")
+    with pytest.raises(Error):
+        Vanity(intermediate_passphrase=vector["intermediate_passphrase"], pattern="(", regex=True)
+    with pytest.raises(Error):
+        Vanity(intermediate_passphrase=vector["intermediate_passphrase"], pattern="1A", batch_size=0)
+    with pytest.raises(WIFError):
+        Vanity(intermediate_passphrase=vector["intermediate_passphrase"], pattern="1A", wif_type="FAKE_WIF_TYPE")
+    with pytest.raises(PassphraseError):
+        Vanity(intermediate_passphrase=vector["intermediate_passphrase"][:-1], pattern="1A")